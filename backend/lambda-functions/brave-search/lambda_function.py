@@ -1,25 +1,65 @@
 """
 Brave Search Lambda for AgentCore Gateway
-Provides web, local, video, image, news, and summarizer search tools
+Provides web, local, video, image, news, and summarizer search tools,
+plus brave_multi for running several of them concurrently
 """
-import json
 import os
+import json
 import logging
-from typing import Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 import requests
-import boto3
-from botocore.exceptions import ClientError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Cache for API key as (value, expires_at) on the monotonic clock, so a
+# rotated secret is picked up without a redeploy
+_api_key_cache: Optional[Tuple[str, float]] = None
+_CACHE_TTL = int(os.getenv("BRAVE_CACHE_TTL_SEC", "600"))
 
-# Cache for API key
-_api_key_cache: Optional[str] = None
+# Secrets Manager client for the SDK fallback path (created on first use)
+_sm_client = None
 
 # Brave Search API base URL
 BRAVE_API_BASE = "https://api.search.brave.com/res/v1"
 
+# AWS Parameters and Secrets Lambda Extension (attached as a layer in the gateway stack)
+SECRETS_EXTENSION_PORT = os.getenv("PARAMETERS_SECRETS_EXTENSION_HTTP_PORT", "2773")
+SECRETS_EXTENSION_URL = f"http://localhost:{SECRETS_EXTENSION_PORT}/secretsmanager/get"
+
+# Shared HTTP session - module globals persist across warm invocations,
+# so keep-alive connections to the Brave API are reused instead of
+# re-handshaking TLS on every tool call
+HTTP_POOL_MAXSIZE = 10
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    ),
+)
+_session.headers.update({"Accept": "application/json"})
+
+# Short-lived response cache with in-flight coalescing, so identical queries
+# (e.g. trending news) within the TTL share a single Brave API round-trip.
+# Summarizer keys are single-use and never cached.
+# Entries are (data, expires_at) on the monotonic clock, kept in insertion order.
+_RESPONSE_CACHE_TTL = int(os.getenv("BRAVE_RESPONSE_CACHE_TTL_SEC", "60"))
+_RESPONSE_CACHE_MAXSIZE = 512
+_response_cache: Dict[Tuple[str, str], Tuple[Dict[str, Any], float]] = {}
+_response_cache_lock = threading.Lock()
+_inflight_locks: Dict[Tuple[str, str], threading.Lock] = {}
+_UNCACHED_ENDPOINTS = frozenset({'summarizer/search'})
+
 
 def lambda_handler(event, context):
     """
@@ -28,54 +68,46 @@ def lambda_handler(event, context):
     Gateway unwraps tool arguments and passes them directly to Lambda
     """
     try:
-        logger.info(f"Event: {json.dumps(event)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Event: %s", json.dumps(event))
 
         # Get tool name from context (set by AgentCore Gateway)
         tool_name = 'unknown'
         if hasattr(context, 'client_context') and context.client_context:
             if hasattr(context.client_context, 'custom'):
                 tool_name = context.client_context.custom.get('bedrockAgentCoreToolName', '')
-                if '___' in tool_name:
-                    tool_name = tool_name.split('___')[-1]
+                # Strip the "<target>___" prefix; unprefixed names pass through
+                tool_name = tool_name.rpartition('___')[2]
 
-        logger.info(f"Tool name: {tool_name}")
+        logger.info("Tool name: %s", tool_name)
 
         # Route to appropriate tool
-        tool_handlers = {
-            'brave_web_search': brave_web_search,
-            'brave_local_search': brave_local_search,
-            'brave_video_search': brave_video_search,
-            'brave_image_search': brave_image_search,
-            'brave_news_search': brave_news_search,
-            'brave_summarizer': brave_summarizer,
-        }
-
-        handler = tool_handlers.get(tool_name)
+        handler = _TOOL_HANDLERS.get(tool_name)
         if handler:
             return handler(event)
         else:
             return error_response(f"Unknown tool: {tool_name}")
 
     except Exception as e:
-        logger.error(f"Error: {str(e)}", exc_info=True)
+        logger.error("Error: %s", e, exc_info=True)
         return error_response(str(e))
 
 
 def get_brave_api_key() -> Optional[str]:
     """
-    Get Brave API key from Secrets Manager (with caching)
+    Get Brave API key from Secrets Manager (with TTL caching)
     """
     global _api_key_cache
 
-    # Return cached key if available
-    if _api_key_cache:
-        return _api_key_cache
+    # Return cached key if still fresh
+    if _api_key_cache and time.monotonic() < _api_key_cache[1]:
+        return _api_key_cache[0]
 
     # Check environment variable first (for local testing)
     api_key = os.getenv("BRAVE_API_KEY")
     if api_key:
-        _api_key_cache = api_key
-        return _api_key_cache
+        _api_key_cache = (api_key, time.monotonic() + _CACHE_TTL)
+        return api_key
 
     # Get from Secrets Manager
     secret_name = os.getenv("BRAVE_CREDENTIALS_SECRET_NAME")
@@ -83,45 +115,162 @@ def get_brave_api_key() -> Optional[str]:
         logger.error("BRAVE_CREDENTIALS_SECRET_NAME not set")
         return None
 
+    secret_str = _get_secret_from_extension(secret_name)
+    if secret_str is None:
+        secret_str = _get_secret_from_sdk(secret_name)
+    if secret_str is None:
+        return None
+
+    # Parse secret (stored as JSON with api_key field)
+    credentials = json.loads(secret_str)
+
+    api_key = credentials.get('api_key')
+    if not api_key:
+        logger.error("Brave credentials secret has no api_key field")
+        return None
+
+    # Cache for future calls
+    _api_key_cache = (api_key, time.monotonic() + _CACHE_TTL)
+    logger.info("Brave API key loaded from Secrets Manager")
+
+    return api_key
+
+
+def _get_secret_from_extension(secret_name: str) -> Optional[str]:
+    """
+    Get secret string via the Parameters and Secrets Lambda Extension
+
+    The extension keeps an out-of-process cache shared across invocations, so
+    this is a localhost HTTP call instead of a signed Secrets Manager request.
+    """
+    session_token = os.getenv("AWS_SESSION_TOKEN")
+    if not session_token:
+        return None
+
     try:
-        session = boto3.session.Session()
-        client = session.client(service_name='secretsmanager')
+        response = requests.get(
+            SECRETS_EXTENSION_URL,
+            params={"secretId": secret_name},
+            headers={"X-Aws-Parameters-Secrets-Token": session_token},
+            timeout=2,
+        )
+        response.raise_for_status()
+        return response.json()['SecretString']
+    except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+        # ValueError covers a malformed body; KeyError a binary secret or error payload
+        logger.warning("Secrets extension unavailable, falling back to SDK: %s", e)
+        return None
 
-        get_secret_value_response = client.get_secret_value(SecretId=secret_name)
 
-        # Parse secret (stored as JSON with api_key field)
-        secret_str = get_secret_value_response['SecretString']
-        credentials = json.loads(secret_str)
+def _get_secret_from_sdk(secret_name: str) -> Optional[str]:
+    """
+    Get secret string from Secrets Manager via boto3 (local testing fallback)
+    """
+    global _sm_client
 
-        # Cache for future calls
-        _api_key_cache = credentials.get('api_key')
-        logger.info("Brave API key loaded from Secrets Manager")
+    # Imported lazily so the extension path never pays the boto3 import cost
+    import boto3
+    from botocore.config import Config
+    from botocore.exceptions import ClientError
 
-        return _api_key_cache
+    try:
+        if _sm_client is None:
+            # boto3.client reuses the default session instead of building a
+            # new one (and re-walking the credential provider chain)
+            _sm_client = boto3.client(
+                'secretsmanager',
+                config=Config(
+                    tcp_keepalive=True,
+                    max_pool_connections=50,
+                    retries={"mode": "adaptive", "max_attempts": 3},
+                ),
+            )
+
+        get_secret_value_response = _sm_client.get_secret_value(SecretId=secret_name)
+        return get_secret_value_response['SecretString']
 
     except ClientError as e:
-        logger.error(f"Failed to get Brave API key from Secrets Manager: {e}")
+        logger.error("Failed to get Brave API key from Secrets Manager: %s", e)
         return None
 
 
+# Cache an env-provided API key during Lambda INIT. Secrets Manager keys are
+# left to the first invocation: the secrets extension isn't serving requests
+# during INIT, so a prefetch would always fall through to a boto3 call.
+if os.getenv("BRAVE_API_KEY"):
+    get_brave_api_key()
+
+
 def make_brave_request(endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Make authenticated request to Brave Search API
+    Make authenticated request to Brave Search API (with response caching)
+
+    Returned data is shared with the cache and must be treated as read-only.
+    """
+    if endpoint in _UNCACHED_ENDPOINTS:
+        return _fetch_brave(endpoint, params)
+
+    key = (endpoint, json.dumps(params, sort_keys=True))
+
+    with _response_cache_lock:
+        data = _cache_get(key)
+        if data is not None:
+            return data
+        inflight = _inflight_locks.setdefault(key, threading.Lock())
+
+    with inflight:
+        # Another caller may have fetched this while we waited
+        with _response_cache_lock:
+            data = _cache_get(key)
+        if data is not None:
+            return data
+
+        try:
+            data = _fetch_brave(endpoint, params)
+            with _response_cache_lock:
+                _cache_put(key, data)
+        finally:
+            with _response_cache_lock:
+                _inflight_locks.pop(key, None)
+
+    return data
+
+
+def _cache_get(key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+    """Return a fresh cached response or None (caller holds _response_cache_lock)"""
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() >= entry[1]:
+        del _response_cache[key]
+        return None
+    return entry[0]
+
+
+def _cache_put(key: Tuple[str, str], data: Dict[str, Any]) -> None:
+    """Store a response, evicting expired then oldest entries when full (caller holds _response_cache_lock)"""
+    now = time.monotonic()
+    if len(_response_cache) >= _RESPONSE_CACHE_MAXSIZE:
+        for stale in [k for k, (_, expires_at) in _response_cache.items() if now >= expires_at]:
+            del _response_cache[stale]
+    while len(_response_cache) >= _RESPONSE_CACHE_MAXSIZE:
+        del _response_cache[next(iter(_response_cache))]
+    _response_cache.pop(key, None)
+    _response_cache[key] = (data, now + _RESPONSE_CACHE_TTL)
+
+
+def _fetch_brave(endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Perform the HTTP request to the Brave Search API
     """
     api_key = get_brave_api_key()
     if not api_key:
         raise ValueError("Failed to get Brave API key")
 
     url = f"{BRAVE_API_BASE}/{endpoint}"
-    headers = {
-        "X-Subscription-Token": api_key,
-        "Accept": "application/json",
-    }
+    headers = {"X-Subscription-Token": api_key}
 
-    # Remove None values from params
-    params = {k: v for k, v in params.items() if v is not None}
-
-    response = requests.get(url, headers=headers, params=params, timeout=30)
+    response = _session.get(url, headers=headers, params=params, timeout=30)
 
     if response.status_code == 401:
         raise ValueError("Invalid Brave API key")
@@ -133,6 +282,61 @@ def make_brave_request(endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
     return response.json()
 
 
+# Shared query parameters and their defaults across Brave search endpoints
+_COMMON_DEFAULTS = MappingProxyType({
+    'country': 'US',
+    'search_lang': 'en',
+    'ui_lang': 'en-US',
+    'safesearch': 'moderate',
+    'spellcheck': True,
+})
+
+_IMAGE_DEFAULTS = MappingProxyType({
+    'country': 'US',
+    'search_lang': 'en',
+    'safesearch': 'strict',
+    'spellcheck': True,
+})
+
+
+def _common_params(
+    params: Dict[str, Any],
+    default_count: int,
+    max_count: int,
+    defaults: MappingProxyType = _COMMON_DEFAULTS,
+    max_offset: Optional[int] = 9,
+) -> Dict[str, Any]:
+    """
+    Build the shared part of a Brave query: defaults overridden by caller
+    params, plus clamped count/offset (offset omitted when max_offset is None)
+
+    Callers only insert optional fields when set, so the result never carries
+    None values and make_brave_request can send it as-is.
+    """
+    api_params = {**defaults, **{k: params[k] for k in defaults if params.get(k) is not None}}
+    # Conditional clamps avoid a builtin min() call per field
+    count = params.get('count', default_count)
+    api_params['count'] = count if count <= max_count else max_count
+    if max_offset is not None:
+        offset = params.get('offset', 0)
+        api_params['offset'] = offset if offset <= max_offset else max_offset
+    return api_params
+
+
+def _dig(d: Any, *keys: str, default: Any = None) -> Any:
+    """
+    Nested dict lookup without allocating empty-dict sentinels
+
+    _dig(item, 'video', 'duration') is equivalent to
+    item.get('video', {}).get('duration') but tolerates non-dict values.
+    """
+    for k in keys:
+        d = d.get(k) if isinstance(d, dict) else None
+        if d is None:
+            return default
+    return d
+
+
 def brave_web_search(params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Performs comprehensive web searches with rich result types
@@ -141,22 +345,18 @@ def brave_web_search(params: Dict[str, Any]) -> Dict[str, Any]:
     if not query:
         return error_response("query parameter required")
 
-    logger.info(f"Brave web search: query={query}")
+    logger.info("Brave web search: query=%s", query)
 
     try:
-        api_params = {
-            'q': query,
-            'country': params.get('country', 'US'),
-            'search_lang': params.get('search_lang', 'en'),
-            'ui_lang': params.get('ui_lang', 'en-US'),
-            'count': min(params.get('count', 10), 20),
-            'offset': min(params.get('offset', 0), 9),
-            'safesearch': params.get('safesearch', 'moderate'),
-            'freshness': params.get('freshness'),
-            'text_decorations': params.get('text_decorations', True),
-            'spellcheck': params.get('spellcheck', True),
-            'summary': params.get('summary', False),
-        }
+        api_params = _common_params(params, default_count=10, max_count=20)
+        api_params['q'] = query
+        api_params['text_decorations'] = params.get('text_decorations', True)
+        api_params['summary'] = params.get('summary', False)
+
+        # Handle freshness
+        freshness = params.get('freshness')
+        if freshness:
+            api_params['freshness'] = freshness
 
         # Handle result_filter array
         result_filter = params.get('result_filter')
@@ -177,7 +377,7 @@ def brave_web_search(params: Dict[str, Any]) -> Dict[str, Any]:
 
         # Format results
         results = []
-        web_results = data.get('web', {}).get('results', [])
+        web_results = _dig(data, 'web', 'results', default=[])
         for idx, item in enumerate(web_results, 1):
             results.append({
                 "index": idx,
@@ -195,7 +395,7 @@ def brave_web_search(params: Dict[str, Any]) -> Dict[str, Any]:
 
         # Include summary key if requested
         if params.get('summary') and 'summarizer' in data:
-            result_data['summarizer_key'] = data.get('summarizer', {}).get('key')
+            result_data['summarizer_key'] = _dig(data, 'summarizer', 'key')
 
         return success_response(json.dumps(result_data, indent=2))
 
@@ -215,26 +415,18 @@ def brave_local_search(params: Dict[str, Any]) -> Dict[str, Any]:
     if not query:
         return error_response("query parameter required")
 
-    logger.info(f"Brave local search: query={query}")
+    logger.info("Brave local search: query=%s", query)
 
     try:
-        api_params = {
-            'q': query,
-            'country': params.get('country', 'US'),
-            'search_lang': params.get('search_lang', 'en'),
-            'ui_lang': params.get('ui_lang', 'en-US'),
-            'count': min(params.get('count', 10), 20),
-            'offset': min(params.get('offset', 0), 9),
-            'safesearch': params.get('safesearch', 'moderate'),
-            'spellcheck': params.get('spellcheck', True),
-            # Force location results
-            'result_filter': 'web,locations',
-        }
+        api_params = _common_params(params, default_count=10, max_count=20)
+        api_params['q'] = query
+        # Force location results
+        api_params['result_filter'] = 'web,locations'
 
         data = make_brave_request('web/search', api_params)
 
         # Extract location results
-        locations = data.get('locations', {}).get('results', [])
+        locations = _dig(data, 'locations', 'results', default=[])
         results = []
         for idx, loc in enumerate(locations, 1):
             results.append({
@@ -242,8 +434,8 @@ def brave_local_search(params: Dict[str, Any]) -> Dict[str, Any]:
                 "name": loc.get('name', 'Unknown'),
                 "address": loc.get('address', ''),
                 "phone": loc.get('phone'),
-                "rating": loc.get('rating', {}).get('ratingValue'),
-                "review_count": loc.get('rating', {}).get('ratingCount'),
+                "rating": _dig(loc, 'rating', 'ratingValue'),
+                "review_count": _dig(loc, 'rating', 'ratingCount'),
                 "hours": loc.get('openingHours'),
                 "price_range": loc.get('priceRange'),
                 "categories": loc.get('categories', []),
@@ -273,20 +465,16 @@ def brave_video_search(params: Dict[str, Any]) -> Dict[str, Any]:
     if not query:
         return error_response("query parameter required")
 
-    logger.info(f"Brave video search: query={query}")
+    logger.info("Brave video search: query=%s", query)
 
     try:
-        api_params = {
-            'q': query,
-            'country': params.get('country', 'US'),
-            'search_lang': params.get('search_lang', 'en'),
-            'ui_lang': params.get('ui_lang', 'en-US'),
-            'count': min(params.get('count', 20), 50),
-            'offset': min(params.get('offset', 0), 9),
-            'spellcheck': params.get('spellcheck', True),
-            'safesearch': params.get('safesearch', 'moderate'),
-            'freshness': params.get('freshness'),
-        }
+        api_params = _common_params(params, default_count=20, max_count=50)
+        api_params['q'] = query
+
+        # Handle freshness
+        freshness = params.get('freshness')
+        if freshness:
+            api_params['freshness'] = freshness
 
         data = make_brave_request('videos/search', api_params)
 
@@ -299,11 +487,11 @@ def brave_video_search(params: Dict[str, Any]) -> Dict[str, Any]:
                 "title": video.get('title', 'No title'),
                 "url": video.get('url', ''),
                 "description": video.get('description', ''),
-                "thumbnail": video.get('thumbnail', {}).get('src'),
-                "duration": video.get('video', {}).get('duration'),
-                "views": video.get('video', {}).get('views'),
-                "creator": video.get('video', {}).get('creator'),
-                "publisher": video.get('video', {}).get('publisher'),
+                "thumbnail": _dig(video, 'thumbnail', 'src'),
+                "duration": _dig(video, 'video', 'duration'),
+                "views": _dig(video, 'video', 'views'),
+                "creator": _dig(video, 'video', 'creator'),
+                "publisher": _dig(video, 'video', 'publisher'),
                 "age": video.get('age'),
             })
 
@@ -331,17 +519,14 @@ def brave_image_search(params: Dict[str, Any]) -> Dict[str, Any]:
     if not query:
         return error_response("query parameter required")
 
-    logger.info(f"Brave image search: query={query}")
+    logger.info("Brave image search: query=%s", query)
 
     try:
-        api_params = {
-            'q': query,
-            'country': params.get('country', 'US'),
-            'search_lang': params.get('search_lang', 'en'),
-            'count': min(params.get('count', 50), 200),
-            'safesearch': params.get('safesearch', 'strict'),
-            'spellcheck': params.get('spellcheck', True),
-        }
+        # Image search has no ui_lang/offset and defaults to strict safesearch
+        api_params = _common_params(
+            params, default_count=50, max_count=200, defaults=_IMAGE_DEFAULTS, max_offset=None
+        )
+        api_params['q'] = query
 
         data = make_brave_request('images/search', api_params)
 
@@ -354,10 +539,10 @@ def brave_image_search(params: Dict[str, Any]) -> Dict[str, Any]:
                 "title": img.get('title', 'No title'),
                 "url": img.get('url', ''),
                 "source_url": img.get('source', ''),
-                "thumbnail": img.get('thumbnail', {}).get('src'),
-                "width": img.get('properties', {}).get('width'),
-                "height": img.get('properties', {}).get('height'),
-                "format": img.get('properties', {}).get('format'),
+                "thumbnail": _dig(img, 'thumbnail', 'src'),
+                "width": _dig(img, 'properties', 'width'),
+                "height": _dig(img, 'properties', 'height'),
+                "format": _dig(img, 'properties', 'format'),
             })
 
         result_data = {
@@ -384,20 +569,12 @@ def brave_news_search(params: Dict[str, Any]) -> Dict[str, Any]:
     if not query:
         return error_response("query parameter required")
 
-    logger.info(f"Brave news search: query={query}")
+    logger.info("Brave news search: query=%s", query)
 
     try:
-        api_params = {
-            'q': query,
-            'country': params.get('country', 'US'),
-            'search_lang': params.get('search_lang', 'en'),
-            'ui_lang': params.get('ui_lang', 'en-US'),
-            'count': min(params.get('count', 20), 50),
-            'offset': min(params.get('offset', 0), 9),
-            'spellcheck': params.get('spellcheck', True),
-            'safesearch': params.get('safesearch', 'moderate'),
-            'freshness': params.get('freshness', 'pd'),  # Default to past day
-        }
+        api_params = _common_params(params, default_count=20, max_count=50)
+        api_params['q'] = query
+        api_params['freshness'] = params.get('freshness') or 'pd'  # Default to past day
 
         # Handle goggles array
         goggles = params.get('goggles')
@@ -415,10 +592,10 @@ def brave_news_search(params: Dict[str, Any]) -> Dict[str, Any]:
                 "title": article.get('title', 'No title'),
                 "url": article.get('url', ''),
                 "description": article.get('description', ''),
-                "source": article.get('meta_url', {}).get('hostname'),
+                "source": _dig(article, 'meta_url', 'hostname'),
                 "age": article.get('age'),
                 "breaking": article.get('breaking', False),
-                "thumbnail": article.get('thumbnail', {}).get('src'),
+                "thumbnail": _dig(article, 'thumbnail', 'src'),
             })
 
         result_data = {
@@ -446,7 +623,7 @@ def brave_summarizer(params: Dict[str, Any]) -> Dict[str, Any]:
     if not key:
         return error_response("key parameter required (obtain from brave_web_search with summary=true)")
 
-    logger.info(f"Brave summarizer: key={key[:20]}...")
+    logger.info("Brave summarizer: key=%s...", key[:20])
 
     try:
         api_params = {
@@ -491,6 +668,56 @@ def brave_summarizer(params: Dict[str, Any]) -> Dict[str, Any]:
         return error_response(f"Brave summarizer error: {str(e)}")
 
 
+# Upper bound on concurrent sub-calls in brave_multi - one per pooled connection,
+# so no sub-call waits on (or overflows) the HTTP pool
+MULTI_MAX_WORKERS = HTTP_POOL_MAXSIZE
+MULTI_MAX_CALLS = 10
+
+
+def brave_multi(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Runs several Brave tool calls concurrently in one invocation
+    Each call is {"tool": "<brave tool name>", "params": {...}}
+    """
+    calls = params.get('calls')
+    if not calls or not isinstance(calls, list):
+        return error_response("calls parameter required (list of {tool, params})")
+    if len(calls) > MULTI_MAX_CALLS:
+        return error_response(f"At most {MULTI_MAX_CALLS} calls allowed per brave_multi request")
+
+    for call in calls:
+        tool = call.get('tool') if isinstance(call, dict) else None
+        if tool not in _TOOL_HANDLERS or tool == 'brave_multi':
+            return error_response(f"Unsupported tool in calls: {tool}")
+
+    logger.info("Brave multi: %d calls", len(calls))
+
+    def run(call: Dict[str, Any]) -> Dict[str, Any]:
+        response = _TOOL_HANDLERS[call['tool']](call.get('params') or {})
+        body = json.loads(response['body'])
+        if response['statusCode'] == 200:
+            return {"tool": call['tool'], "result": json.loads(body['content'][0]['text'])}
+        return {"tool": call['tool'], "error": body.get('error')}
+
+    # Sub-calls share the pooled session, so wall time is roughly the slowest call
+    with ThreadPoolExecutor(max_workers=min(len(calls), MULTI_MAX_WORKERS)) as executor:
+        results = list(executor.map(run, calls))
+
+    return success_response(json.dumps({"results": results}, indent=2))
+
+
+# Tool dispatch table (built once at import, read-only)
+_TOOL_HANDLERS = MappingProxyType({
+    'brave_web_search': brave_web_search,
+    'brave_local_search': brave_local_search,
+    'brave_video_search': brave_video_search,
+    'brave_image_search': brave_image_search,
+    'brave_news_search': brave_news_search,
+    'brave_summarizer': brave_summarizer,
+    'brave_multi': brave_multi,
+})
+
+
 def success_response(content: str) -> Dict[str, Any]:
     """Format successful MCP response"""
     return {
@@ -506,7 +733,7 @@ def success_response(content: str) -> Dict[str, Any]:
 
 def error_response(message: str) -> Dict[str, Any]:
     """Format error response"""
-    logger.error(f"Error response: {message}")
+    logger.error("Error response: %s", message)
     return {
         'statusCode': 400,
         'body': json.dumps({
@@ -10,6 +10,8 @@ import base64
 from typing import Dict, Any, Optional
 from bedrock_agentcore.tools.browser_client import BrowserClient
 
+from agents.request_context import current_session_id, current_user_id
+
 # NOVA_ACT DISABLED: Commented out temporarily due to version conflict with strands-agents
 # To re-enable: Uncomment this import and uncomment nova-act in pyproject.toml
 # from nova_act import (
@@ -711,10 +713,10 @@ class BrowserController:
 
 def get_or_create_controller(session_id: Optional[str] = None) -> BrowserController:
     """Get existing controller or create new one (auto-detects session_id from agent context)"""
-    # Auto-detect session_id from environment (set by ChatbotAgent)
-    # Uses SESSION_ID (per-conversation) for isolated browser sessions
+    # Auto-detect session_id from the request context (set by StreamCoordinator)
+    # Uses the per-conversation session ID for isolated browser sessions
     if not session_id:
-        session_id = os.getenv('SESSION_ID') or os.getenv('USER_ID') or "default"
+        session_id = current_session_id.get() or current_user_id.get() or "default"
         logger.info(f"Auto-detected browser session_id: {session_id}")
 
     if session_id not in _browser_sessions:
@@ -6,13 +6,21 @@ This package contains tools that don't require specific AWS services:
 - URL fetching and content extraction
 - Data visualization
 - Cludo search (Boise State University)
+
+Tools are imported lazily on first attribute access (PEP 562), so importing
+one tool module doesn't pull in the dependencies of all the others.
 """
 
-from .weather import get_current_weather
-from .web_search import ddg_web_search
-from .url_fetcher import fetch_url_content
-from .visualization import create_visualization
-from .cludo_search import search_boise_state
+import importlib
+
+# Tool name -> submodule that defines it
+_LAZY_MAP = {
+    'get_current_weather': '.weather',
+    'ddg_web_search': '.web_search',
+    'fetch_url_content': '.url_fetcher',
+    'create_visualization': '.visualization',
+    'search_boise_state': '.cludo_search',
+}
 
 __all__ = [
     'get_current_weather',
@@ -21,3 +29,16 @@ __all__ = [
     'create_visualization',
     'search_boise_state',
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_MAP:
+        module = importlib.import_module(_LAZY_MAP[name], __name__)
+        obj = getattr(module, name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
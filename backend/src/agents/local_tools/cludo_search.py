@@ -11,25 +11,118 @@ Supports advanced Cludo API features:
 - Advanced filtering (value, range, date, exclusion)
 """
 
+import asyncio
+import hashlib
 import os
 import json
 import logging
+import random
+import re
 from typing import Optional, Dict, Any, List, Literal, Union
+from cachetools import TTLCache
 from strands import tool
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
 # Cludo API configuration
 CLUDO_API_ENDPOINT = "https://api-us1.cludo.com/api/v3/10000203/10000303/search"
-CLUDO_SITE_KEY = os.getenv("TOOL_CLUDO_SITE_KEY")
-
-if not CLUDO_SITE_KEY:
-    logger.warning("TOOL_CLUDO_SITE_KEY environment variable not set. Cludo search will not work without it.")
+_BASE_HEADERS = {"Content-Type": "application/json"}
 
 # Constants for Bedrock payload limits
 MAX_BEDROCK_PAYLOAD_SIZE = 15000
 MAX_RESULTS_BEFORE_TRUNCATION = 8
+MAX_DESCRIPTION_LENGTH = 300
+
+# Retry policy for transient Cludo failures
+MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.1  # seconds, doubled per attempt
+MAX_RETRY_AFTER = 2.0  # seconds, upper bound when honoring Retry-After
+_RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Emphasis tags Cludo wraps around matched terms in highlight snippets
+_HIGHLIGHT_TAG_RE = re.compile(r"</?(?:b|i|em|strong)>")
+
+# Shared HTTP client so keep-alive connections to Cludo are reused across tool calls.
+# httpx clients are bound to the event loop they were first used on, so the client
+# is rebuilt if a call arrives on a different loop.
+_CLIENT: Optional[httpx.AsyncClient] = None
+_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_CLIENT_SITE_KEY: Optional[str] = None
+# Close tasks for replaced clients (references kept so tasks aren't GC'd)
+_CLOSE_TASKS: set = set()
+
+# Recent responses keyed by a digest of the request body, plus in-flight requests so
+# concurrent identical searches share one API call. Cached responses are shared
+# between callers and must be treated as read-only.
+_RESULT_CACHE: TTLCache = TTLCache(maxsize=512, ttl=300)
+_INFLIGHT: Dict[str, asyncio.Future] = {}
+
+# Background next-page prefetches (bounded; references kept so tasks aren't GC'd)
+MAX_CONCURRENT_PREFETCHES = 4
+_PREFETCH_SEMAPHORE: Optional[asyncio.Semaphore] = None
+_PREFETCH_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_PREFETCH_TASKS: set = set()
+
+
+def _site_key() -> Optional[str]:
+    """
+    Read the Cludo site key from the environment
+
+    Read per call rather than at import so a rotated key (or a .env loaded after
+    import) is picked up without restarting the process.
+    """
+    return os.environ.get("TOOL_CLUDO_SITE_KEY")
+
+
+async def _get_client(site_key: str) -> httpx.AsyncClient:
+    """Return the shared Cludo HTTP client, creating it on first use or when the site key changes"""
+    global _CLIENT, _CLIENT_LOOP, _CLIENT_SITE_KEY
+
+    loop = asyncio.get_running_loop()
+    if _CLIENT is None or _CLIENT.is_closed or _CLIENT_LOOP is not loop or _CLIENT_SITE_KEY != site_key:
+        _discard_client(_CLIENT, _CLIENT_LOOP, loop)
+        _CLIENT = httpx.AsyncClient(
+            timeout=30.0,
+            # Concurrent searches multiplex over one connection as HTTP/2 streams
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            # Sent with every request, so calls don't build per-request header dicts
+            headers={**_BASE_HEADERS, "Authorization": f"SiteKey {site_key}"},
+        )
+        _CLIENT_LOOP = loop
+        _CLIENT_SITE_KEY = site_key
+    return _CLIENT
+
+
+def _discard_client(
+    client: Optional[httpx.AsyncClient],
+    client_loop: Optional[asyncio.AbstractEventLoop],
+    loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Close a client that is being replaced so its connection pool isn't leaked"""
+    if client is None or client.is_closed:
+        return
+    if client_loop is loop:
+        task = loop.create_task(client.aclose())
+        _CLOSE_TASKS.add(task)
+        task.add_done_callback(_CLOSE_TASKS.discard)
+    elif client_loop is not None and client_loop.is_running():
+        # Its connections belong to another (still running) loop - close it there
+        asyncio.run_coroutine_threadsafe(client.aclose(), client_loop)
+    # Otherwise the owning loop is gone and its transports went with it
+
+
+async def close_cludo_client() -> None:
+    """Close the shared Cludo HTTP client (called on application shutdown)"""
+    global _CLIENT, _CLIENT_LOOP, _CLIENT_SITE_KEY
+
+    if _CLIENT is not None and not _CLIENT.is_closed:
+        await _CLIENT.aclose()
+    _CLIENT = None
+    _CLIENT_LOOP = None
+    _CLIENT_SITE_KEY = None
 
 
 async def query_cludo_api(
@@ -60,12 +153,14 @@ async def query_cludo_api(
         enable_facet_filtering: Enable facet-level filtering
 
     Returns:
-        API response data as dictionary
+        API response data as dictionary, limited to the fields search_boise_state
+        reads and at most MAX_RESULTS_BEFORE_TRUNCATION documents
 
     Raises:
         httpx.HTTPError: If the API request fails
     """
-    if not CLUDO_SITE_KEY:
+    site_key = _site_key()
+    if not site_key:
         raise ValueError("TOOL_CLUDO_SITE_KEY environment variable not set")
 
     request_body: Dict[str, Any] = {
@@ -93,22 +188,225 @@ async def query_cludo_api(
         # Range filters format: [{"field": "Price", "min": 20, "max": 100}]
         request_body["rangeFilters"] = range_filters
 
-    headers = {
-        "Authorization": f"SiteKey {CLUDO_SITE_KEY}",
-        "Content-Type": "application/json",
-    }
+    cache_key = hashlib.blake2b(orjson.dumps(request_body, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+
+    cached = _RESULT_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    loop = asyncio.get_running_loop()
+    while True:
+        inflight = _INFLIGHT.get(cache_key)
+        if inflight is None or inflight.get_loop() is not loop:
+            break
+        try:
+            return await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            # The leader's cancellation (e.g. its client disconnected) must not fail
+            # unrelated callers coalesced onto it: unless this caller is itself being
+            # cancelled, go round again and fetch (or join a new leader) instead.
+            if not inflight.cancelled() or asyncio.current_task().cancelling():
+                raise
+
+    future = loop.create_future()
+    _INFLIGHT[cache_key] = future
+    try:
+        data = _slim_response(await _post_cludo(request_body, site_key))
+        _RESULT_CACHE[cache_key] = data
+        future.set_result(data)
+        return data
+    except BaseException as e:
+        if isinstance(e, asyncio.CancelledError):
+            future.cancel()
+        else:
+            future.set_exception(e)
+            # Mark as retrieved so an unawaited future doesn't log a warning
+            future.exception()
+        raise
+    finally:
+        if _INFLIGHT.get(cache_key) is future:
+            del _INFLIGHT[cache_key]
+
+
+# Top-level response fields used when formatting results
+_RESPONSE_FIELDS = ("TotalDocument", "FixedQuery", "Facets", "RelatedSearchDocuments")
+
+
+def _slim_response(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Drop response data that is never formatted before it is cached
+
+    Only the first MAX_RESULTS_BEFORE_TRUNCATION documents are ever returned to
+    the agent, so holding the rest (up to 100 per page) in the result cache only
+    inflates memory.
+    """
+    slim = {key: data[key] for key in _RESPONSE_FIELDS if key in data}
+    typed_documents = data.get("TypedDocuments")
+    if typed_documents:
+        slim["TypedDocuments"] = typed_documents[:MAX_RESULTS_BEFORE_TRUNCATION]
+    return slim
+
+
+def _prefetch_next_page(**query_kwargs: Any) -> None:
+    """
+    Warm the result cache with the next page in the background
+
+    Agents that paginate usually request page N+1 right after page N, so that
+    follow-up call becomes a cache hit. Failures are logged and ignored.
+    """
+    global _PREFETCH_SEMAPHORE, _PREFETCH_LOOP
+
+    loop = asyncio.get_running_loop()
+    if _PREFETCH_SEMAPHORE is None or _PREFETCH_LOOP is not loop:
+        _PREFETCH_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENT_PREFETCHES)
+        _PREFETCH_LOOP = loop
+    semaphore = _PREFETCH_SEMAPHORE
+
+    # Skip rather than queue when the prefetch budget is used up
+    if semaphore.locked():
+        return
+
+    async def _run() -> None:
+        async with semaphore:
+            try:
+                await query_cludo_api(**query_kwargs)
+            except Exception as e:
+                logger.debug(f"Cludo prefetch of page {query_kwargs.get('page')} failed: {e}")
+
+    task = asyncio.create_task(_run())
+    _PREFETCH_TASKS.add(task)
+    task.add_done_callback(_PREFETCH_TASKS.discard)
+
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+async def _post_cludo(request_body: Dict[str, Any], site_key: str) -> Dict[str, Any]:
+    """
+    Send a search request to the Cludo API
+
+    Args:
+        request_body: Cludo search request body
+        site_key: Cludo site key used for authorization
+
+    Transient failures (429/502/503/504, timeouts, connection errors) are retried
+    with exponential backoff and jitter, honoring Retry-After on 429.
+
+    Returns:
+        API response data as dictionary
+    """
+    client = await _get_client(site_key)
+    for attempt in range(MAX_ATTEMPTS):
+        last_attempt = attempt == MAX_ATTEMPTS - 1
+        delay = RETRY_BASE_DELAY * (2 ** attempt) + random.random() * 0.05
         try:
-            response = await client.post(CLUDO_API_ENDPOINT, json=request_body, headers=headers)
+            response = await client.post(CLUDO_API_ENDPOINT, json=request_body)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
-            logger.error(f"Cludo API HTTP error: {e.response.status_code} - {e.response.text}")
-            raise
+            status_code = e.response.status_code
+            if status_code not in _RETRYABLE_STATUS_CODES or last_attempt:
+                logger.error(f"Cludo API HTTP error: {status_code} - {e.response.text}")
+                raise
+            retry_after = e.response.headers.get("Retry-After")
+            if status_code == 429 and retry_after and retry_after.isdigit():
+                delay = min(float(retry_after), MAX_RETRY_AFTER)
+            logger.warning(f"Cludo API HTTP {status_code}, retrying in {delay:.2f}s (attempt {attempt + 1}/{MAX_ATTEMPTS})")
+        except (httpx.TimeoutException, httpx.ConnectError) as e:
+            if last_attempt:
+                logger.error(f"Cludo API request error: {e}")
+                raise
+            logger.warning(f"Cludo API request error: {e}, retrying in {delay:.2f}s (attempt {attempt + 1}/{MAX_ATTEMPTS})")
         except httpx.RequestError as e:
             logger.error(f"Cludo API request error: {e}")
             raise
+        await asyncio.sleep(delay)
+
+    raise RuntimeError("Cludo API retry loop exited without a result")
+
+
+def _format_result(index: int, result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Format a single Cludo TypedDocument for the agent
+
+    Args:
+        index: 1-based position of the result on the page
+        result: TypedDocument from the Cludo response
+
+    Returns:
+        Result dict with title, URL, description, highlights and source
+    """
+    fields = result.get("Fields", {})
+    desc = fields.get("Description") or {}
+    cont = fields.get("Content") or {}
+
+    # Extract highlights for relevant context
+    highlights = desc.get("Highlights") or cont.get("Highlights") or ()
+
+    # Clean highlights by removing HTML tags
+    clean_highlights = ""
+    if highlights:
+        # Get up to 3 highlight snippets; skip the regex when no tags are present
+        clean_highlights = " ... ".join(highlights if len(highlights) <= 3 else highlights[:3])
+        if "<" in clean_highlights:
+            clean_highlights = _HIGHLIGHT_TAG_RE.sub("", clean_highlights)
+
+    # Get description or fall back to first content snippet
+    description = desc.get("Value") or (cont.get("Values") or [""])[0]
+
+    if not description:
+        description = "No description available"
+    elif len(description) > MAX_DESCRIPTION_LENGTH:
+        description = description[:MAX_DESCRIPTION_LENGTH]  # Limit description length
+
+    return {
+        "index": index,
+        "title": fields.get("Title", {}).get("Value", "Untitled"),
+        "url": fields.get("Url", {}).get("Value", ""),
+        "description": description,
+        "highlights": clean_highlights,
+        "source": fields.get("Domain", {}).get("Value", "Boise State University"),
+    }
+
+
+def _format_facets(facets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Format Cludo facets as name/items pairs, keeping the top 10 values per facet
+
+    Args:
+        facets: Facets from the Cludo response
+
+    Returns:
+        Non-empty facets with their value counts
+    """
+    facets_data = []
+    for facet in facets:
+        facet_items = [
+            {"value": item.get("Value", ""), "count": item.get("Count", 0)}
+            for item in facet.get("Items", [])[:10]  # Limit to top 10 facet values
+        ]
+        if facet_items:
+            facets_data.append({
+                "name": facet.get("Name", "Unknown"),
+                "items": facet_items,
+            })
+    return facets_data
+
+
+def _format_related_searches(related_documents: List[Any]) -> List[str]:
+    """
+    Extract up to 5 related search suggestions
+
+    Args:
+        related_documents: RelatedSearchDocuments from the Cludo response (dicts or strings)
+
+    Returns:
+        Related query strings
+    """
+    related = []
+    for rel in related_documents[:5]:  # Limit to 5 suggestions
+        if isinstance(rel, dict):
+            related.append(rel.get("Query", rel.get("Title", "")))
+        elif isinstance(rel, str):
+            related.append(rel)
+    return related
 
 
 @tool
@@ -141,7 +439,8 @@ async def search_boise_state(
                   to match (default: "or")
         page: Page number for pagination, 1-indexed (default: 1). Use with page_size
               to navigate through large result sets.
-        page_size: Number of results per page (default: 10, max: 100)
+        page_size: Number of results per page (default: 10). At most 8 results are
+                   returned per page; larger values are capped.
         sort: Optional field name to sort results by (e.g., "Date", "Title").
               Overrides default relevance-based ranking.
         filters: Value filters to include specific content types or categories
@@ -168,7 +467,7 @@ async def search_boise_state(
         search_boise_state("business administration")
 
         # Paginated search - get page 2
-        search_boise_state("scholarships", page=2, page_size=10)
+        search_boise_state("scholarships", page=2, page_size=5)
 
         # Search with fuzzy matching for misspellings
         search_boise_state("admisions~")
@@ -186,28 +485,35 @@ async def search_boise_state(
         search_boise_state("announcements", sort="Date")
     """
     try:
-        if not CLUDO_SITE_KEY:
+        if not _site_key():
+            logger.warning("TOOL_CLUDO_SITE_KEY environment variable not set. Cludo search will not work without it.")
             return json.dumps({
                 "success": False,
                 "error": "TOOL_CLUDO_SITE_KEY environment variable not set. Please configure it in your .env file to use Cludo search.",
                 "query": query
             }, indent=2)
 
-        results = await query_cludo_api(
+        # Only MAX_RESULTS_BEFORE_TRUNCATION results are ever returned, so don't ask
+        # Cludo for more. Pages are numbered on this effective size so that
+        # consecutive pages don't skip the documents beyond the truncation point.
+        effective_page_size = max(min(page_size, MAX_RESULTS_BEFORE_TRUNCATION), 1)
+
+        query_kwargs: Dict[str, Any] = dict(
             query=query,
             operator=operator,
-            page=page,
-            page_size=page_size,
+            page_size=effective_page_size,
             sort=sort,
             filters=filters,
             not_filters=not_filters,
             enable_related_searches=include_related_searches,
             enable_facet_filtering=include_facets,
         )
+        results = await query_cludo_api(page=page, **query_kwargs)
 
         # Extract total document count for pagination
         total_documents = results.get("TotalDocument", 0)
-        total_pages = (total_documents + page_size - 1) // page_size if total_documents > 0 else 0
+        # Ceiling division; evaluates to 0 when there are no documents
+        total_pages = (total_documents + effective_page_size - 1) // effective_page_size
 
         # Check for spelling correction suggestion
         spelling_suggestion = results.get("FixedQuery")
@@ -224,50 +530,16 @@ async def search_boise_state(
             if spelling_suggestion and spelling_suggestion != query:
                 response_data["spelling_suggestion"] = spelling_suggestion
                 response_data["message"] = f'No results found for "{query}". Did you mean: "{spelling_suggestion}"?'
-            return json.dumps(response_data, indent=2)
+            return orjson.dumps(response_data).decode()
 
         typed_documents = results["TypedDocuments"]
 
         # Limit results to prevent payload size issues
-        max_results = min(len(typed_documents), page_size, MAX_RESULTS_BEFORE_TRUNCATION)
-
-        formatted_results = []
-        for result in typed_documents[:max_results]:
-            fields = result.get("Fields", {})
-
-            # Extract highlights for relevant context
-            highlights = []
-            if "Description" in fields and "Highlights" in fields["Description"]:
-                highlights = fields["Description"]["Highlights"]
-            elif "Content" in fields and "Highlights" in fields["Content"]:
-                highlights = fields["Content"]["Highlights"]
-
-            # Clean highlights by removing HTML tags
-            clean_highlights = ""
-            if highlights:
-                clean_highlights = " ... ".join(highlights[:3])  # Get up to 3 highlight snippets
-                clean_highlights = clean_highlights.replace("<b>", "").replace("</b>", "")
-
-            # Get description or fall back to first content snippet
-            description = ""
-            if "Description" in fields and "Value" in fields["Description"]:
-                description = fields["Description"]["Value"]
-            elif "Content" in fields and "Values" in fields["Content"] and fields["Content"]["Values"]:
-                description = fields["Content"]["Values"][0]
-
-            if not description:
-                description = "No description available"
-            else:
-                description = description[:300]  # Limit description length
-
-            formatted_results.append({
-                "index": len(formatted_results) + 1,
-                "title": fields.get("Title", {}).get("Value", "Untitled"),
-                "url": fields.get("Url", {}).get("Value", ""),
-                "description": description,
-                "highlights": clean_highlights,
-                "source": fields.get("Domain", {}).get("Value", "Boise State University"),
-            })
+        max_results = min(len(typed_documents), effective_page_size)
+
+        formatted_results = [
+            _format_result(index, result) for index, result in enumerate(typed_documents[:max_results], 1)
+        ]
 
         # Build JSON response
         result_data: Dict[str, Any] = {
@@ -292,36 +564,21 @@ async def search_boise_state(
 
         # Include facets if requested
         if include_facets and results.get("Facets"):
-            facets_data = []
-            for facet in results["Facets"]:
-                facet_name = facet.get("Name", "Unknown")
-                facet_items = []
-                for item in facet.get("Items", [])[:10]:  # Limit to top 10 facet values
-                    facet_items.append({
-                        "value": item.get("Value", ""),
-                        "count": item.get("Count", 0),
-                    })
-                if facet_items:
-                    facets_data.append({
-                        "name": facet_name,
-                        "items": facet_items,
-                    })
+            facets_data = _format_facets(results["Facets"])
             if facets_data:
                 result_data["facets"] = facets_data
 
         # Include related searches if requested
         if include_related_searches and results.get("RelatedSearchDocuments"):
-            related = []
-            for rel in results["RelatedSearchDocuments"][:5]:  # Limit to 5 suggestions
-                if isinstance(rel, dict):
-                    related.append(rel.get("Query", rel.get("Title", "")))
-                elif isinstance(rel, str):
-                    related.append(rel)
+            related = _format_related_searches(results["RelatedSearchDocuments"])
             if related:
                 result_data["related_searches"] = related
 
-        # Convert to JSON string
-        result_json = json.dumps(result_data, indent=2)
+        if page < total_pages:
+            _prefetch_next_page(page=page + 1, **query_kwargs)
+
+        # Convert to compact JSON string (indentation only costs payload size and tokens)
+        result_json = orjson.dumps(result_data).decode()
 
         # Check payload size and log warning if needed (but don't truncate JSON as it would break the format)
         if len(result_json) > MAX_BEDROCK_PAYLOAD_SIZE:
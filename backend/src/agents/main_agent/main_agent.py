@@ -255,7 +255,7 @@ class MainAgent:
 
     async def stream_async(
         self, message: str, session_id: Optional[str] = None, files: Optional[List] = None, citations: Optional[List] = None
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[bytes, None]:
         """
         Stream agent responses
 
@@ -266,7 +266,7 @@ class MainAgent:
             citations: Optional list of citation dicts from RAG retrieval
 
         Yields:
-            str: SSE formatted events
+            SSE formatted events (UTF-8 bytes)
         """
         if not self.agent:
             self._create_agent()
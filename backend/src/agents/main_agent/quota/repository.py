@@ -1,8 +1,10 @@
 """DynamoDB repository for quota management (Phase 1)."""
 
 from typing import Optional, List
+import asyncio
 from datetime import datetime
 import boto3
+from boto3.dynamodb.types import TypeDeserializer
 from botocore.exceptions import ClientError
 import logging
 import uuid
@@ -11,6 +13,8 @@ from .models import QuotaTier, QuotaAssignment, QuotaEvent, QuotaAssignmentType,
 
 logger = logging.getLogger(__name__)
 
+_deserializer = TypeDeserializer()
+
 
 class QuotaRepository:
     """DynamoDB repository for quota management (Phase 1)"""
@@ -27,8 +31,12 @@ class QuotaRepository:
             events_table_name = os.getenv("DYNAMODB_QUOTA_EVENTS_TABLE", "QuotaEvents")
 
         self.dynamodb = boto3.resource('dynamodb')
+        self.table_name = table_name
         self.table = self.dynamodb.Table(table_name)
         self.events_table = self.dynamodb.Table(events_table_name)
+        # Low-level client for queries run on worker threads: boto3 resources
+        # are not thread-safe, clients are
+        self.client = self.dynamodb.meta.client
 
         logger.info(f"QuotaRepository initialized with tables: {table_name}, {events_table_name}")
 
@@ -211,6 +219,23 @@ class QuotaRepository:
             logger.error(f"Error querying user assignment for {user_id}: {e}")
             return None
 
+    def _query_index_descending(self, index_name: str, key_name: str, key_value: str) -> List[dict]:
+        """
+        Blocking GSI query (highest sort key first) through the low-level client,
+        so it is safe to run concurrently on worker threads.
+        """
+        response = self.client.query(
+            TableName=self.table_name,
+            IndexName=index_name,
+            KeyConditionExpression=f"{key_name} = :pk",
+            ExpressionAttributeValues={":pk": {"S": key_value}},
+            ScanIndexForward=False  # Descending order (highest priority first)
+        )
+        return [
+            {k: _deserializer.deserialize(v) for k, v in item.items()}
+            for item in response.get('Items', [])
+        ]
+
     async def query_app_role_assignments(self, app_role_id: str) -> List[QuotaAssignment]:
         """
         Query AppRole-based assignments using GSI6 (AppRoleAssignmentIndex).
@@ -218,17 +243,17 @@ class QuotaRepository:
         O(log n) lookup - no scan.
         """
         try:
-            response = self.table.query(
-                IndexName="AppRoleAssignmentIndex",
-                KeyConditionExpression="GSI6PK = :pk",
-                ExpressionAttributeValues={
-                    ":pk": f"APP_ROLE#{app_role_id}"
-                },
-                ScanIndexForward=False  # Descending order (highest priority first)
+            # boto3 is blocking; run it on a worker thread so the resolver's
+            # per-role queries (asyncio.gather) actually overlap
+            items = await asyncio.to_thread(
+                self._query_index_descending,
+                "AppRoleAssignmentIndex",
+                "GSI6PK",
+                f"APP_ROLE#{app_role_id}",
             )
 
             assignments = []
-            for item in response.get('Items', []):
+            for item in items:
                 for key in ['PK', 'SK', 'GSI1PK', 'GSI1SK', 'GSI2PK', 'GSI2SK', 'GSI3PK', 'GSI3SK', 'GSI6PK', 'GSI6SK']:
                     item.pop(key, None)
                 assignments.append(QuotaAssignment(**item))
@@ -245,17 +270,17 @@ class QuotaRepository:
         O(log n) lookup - no scan.
         """
         try:
-            response = self.table.query(
-                IndexName="RoleAssignmentIndex",
-                KeyConditionExpression="GSI3PK = :pk",
-                ExpressionAttributeValues={
-                    ":pk": f"ROLE#{role}"
-                },
-                ScanIndexForward=False  # Descending order (highest priority first)
+            # boto3 is blocking; run it on a worker thread so the resolver's
+            # per-role queries (asyncio.gather) actually overlap
+            items = await asyncio.to_thread(
+                self._query_index_descending,
+                "RoleAssignmentIndex",
+                "GSI3PK",
+                f"ROLE#{role}",
             )
 
             assignments = []
-            for item in response.get('Items', []):
+            for item in items:
                 for key in ['PK', 'SK', 'GSI1PK', 'GSI1SK', 'GSI2PK', 'GSI2SK', 'GSI3PK', 'GSI3SK', 'GSI6PK', 'GSI6SK']:
                     item.pop(key, None)
                 assignments.append(QuotaAssignment(**item))
@@ -1,10 +1,13 @@
 """Quota resolver with intelligent caching."""
 
-from typing import Optional, Dict, Tuple, List
-from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional, Set, Tuple, List
+import asyncio
 import logging
+import re
+import time
+from cachetools import TLRUCache, TTLCache
 from apis.shared.auth.models import User
-from .models import QuotaTier, QuotaAssignment, ResolvedQuota
+from .models import QuotaTier, QuotaAssignment, QuotaOverride, ResolvedQuota
 from .repository import QuotaRepository
 
 logger = logging.getLogger(__name__)
@@ -26,23 +29,99 @@ def _get_app_role_service():
     return _app_role_service if _app_role_service else None
 
 
+DomainMatcher = Callable[[str], bool]
+
+# (user_id, sorted roles)
+CacheKey = Tuple[str, Tuple[str, ...]]
+
+# Upper bound on distinct (user, roles) entries held by the resolver cache
+CACHE_MAX_SIZE = 10_000
+
+# Upper bound on cached tier definitions (tiers are few and change rarely)
+TIER_CACHE_MAX_SIZE = 256
+
+
+class _UserIndexedCache(TLRUCache):
+    """
+    TLRUCache with a user_id -> cache keys index for O(1) per-user invalidation.
+
+    The index is kept in sync with LRU eviction (popitem -> __delitem__) and
+    TTL expiry (expire) so it never outgrows the cache.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.user_index: Dict[str, Set[CacheKey]] = {}
+
+    def __setitem__(self, key: CacheKey, value) -> None:
+        super().__setitem__(key, value)
+        if key in self:
+            self.user_index.setdefault(key[0], set()).add(key)
+
+    def __delitem__(self, key: CacheKey) -> None:
+        try:
+            super().__delitem__(key)
+        finally:
+            self._unindex(key)
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for key, _ in expired or ():
+            self._unindex(key)
+        return expired
+
+    def clear(self) -> None:
+        super().clear()
+        self.user_index.clear()
+
+    def pop_user(self, user_id: str) -> int:
+        """Remove every entry for user_id; returns the number of keys dropped."""
+        keys = self.user_index.pop(user_id, ())
+        for key in keys:
+            self.pop(key, None)
+        return len(keys)
+
+    def _unindex(self, key: CacheKey) -> None:
+        keys = self.user_index.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self.user_index[key[0]]
+
+
 class QuotaResolver:
     """
     Resolves user quota tier with intelligent caching.
 
     Supports overrides, direct user, AppRole, JWT role, email domain, and default tier assignments.
     Cache TTL: 5 minutes (reduces DynamoDB calls by ~90%)
+
+    The cache lives on the instance, so callers should share one resolver per
+    process via apis.shared.quota.get_quota_resolver() rather than constructing
+    one per request.
     """
 
     def __init__(
         self,
         repository: QuotaRepository,
-        cache_ttl_seconds: int = 300  # 5 minutes
+        cache_ttl_seconds: int = 300,  # 5 minutes
+        cache_max_size: int = CACHE_MAX_SIZE,
+        negative_ttl_seconds: int = 60  # 1 minute for "no quota configured"
     ):
         self.repository = repository
         self.cache_ttl = cache_ttl_seconds
-        self._cache: Dict[str, Tuple[Optional[ResolvedQuota], datetime]] = {}
-        self._domain_assignments_cache: Optional[Tuple[list, datetime]] = None
+        self.negative_ttl = negative_ttl_seconds
+        # LRU + per-entry TTL: None results expire sooner so newly
+        # configured users are picked up quickly
+        self._cache = _UserIndexedCache(maxsize=cache_max_size, ttu=self._time_to_use)
+        # Tier definitions shared by every user resolved through them
+        self._tier_cache: TTLCache = TTLCache(maxsize=TIER_CACHE_MAX_SIZE, ttl=cache_ttl_seconds)
+        # (value, expires_at) on the monotonic clock
+        self._domain_assignments_cache: Optional[Tuple[List[Tuple[QuotaAssignment, DomainMatcher]], float]] = None
+
+    def _time_to_use(self, _key: CacheKey, resolved: Optional[ResolvedQuota], now: float) -> float:
+        """Expiry time for a cache entry (shorter for negative results)."""
+        return now + (self.cache_ttl if resolved is not None else self.negative_ttl)
 
     async def resolve_user_quota(self, user: User) -> Optional[ResolvedQuota]:
         """
@@ -58,19 +137,20 @@ class QuotaResolver:
         """
         cache_key = self._get_cache_key(user)
 
-        # Check cache
-        if cache_key in self._cache:
-            resolved, cached_at = self._cache[cache_key]
-            if datetime.utcnow() - cached_at < timedelta(seconds=self.cache_ttl):
-                logger.debug(f"Cache hit for user {user.user_id}")
-                return resolved
+        # Check cache (None results are cached too)
+        try:
+            resolved = self._cache[cache_key]
+            logger.debug(f"Cache hit for user {user.user_id}")
+            return resolved
+        except KeyError:
+            pass
 
         # Cache miss - resolve from database
         logger.debug(f"Cache miss for user {user.user_id}, resolving...")
         resolved = await self._resolve_from_db(user)
 
-        # Cache result
-        self._cache[cache_key] = (resolved, datetime.utcnow())
+        # Cache result, including None (negative cache)
+        self._cache[cache_key] = resolved
 
         return resolved
 
@@ -95,7 +175,7 @@ class QuotaResolver:
         # 2. Check for direct user assignment (GSI2: UserAssignmentIndex)
         user_assignment = await self.repository.query_user_assignment(user.user_id)
         if user_assignment and user_assignment.enabled:
-            tier = await self.repository.get_tier(user_assignment.tier_id)
+            tier = await self._get_tier(user_assignment.tier_id)
             if tier and tier.enabled:
                 return ResolvedQuota(
                     user_id=user.user_id,
@@ -110,18 +190,19 @@ class QuotaResolver:
             try:
                 user_permissions = await app_role_service.resolve_user_permissions(user)
                 if user_permissions and user_permissions.app_roles:
-                    app_role_assignments: List[QuotaAssignment] = []
-                    for app_role_id in user_permissions.app_roles:
-                        # Targeted query per app role (O(log n) per role)
-                        assignments = await self.repository.query_app_role_assignments(app_role_id)
-                        app_role_assignments.extend(assignments)
+                    # Targeted query per app role (O(log n) per role), issued concurrently
+                    results = await asyncio.gather(*(
+                        self.repository.query_app_role_assignments(app_role_id)
+                        for app_role_id in user_permissions.app_roles
+                    ))
+                    app_role_assignments: List[QuotaAssignment] = [a for sub in results for a in sub]
 
                     if app_role_assignments:
                         # Sort by priority (descending) and take highest enabled
                         app_role_assignments.sort(key=lambda a: a.priority, reverse=True)
                         for assignment in app_role_assignments:
                             if assignment.enabled:
-                                tier = await self.repository.get_tier(assignment.tier_id)
+                                tier = await self._get_tier(assignment.tier_id)
                                 if tier and tier.enabled:
                                     return ResolvedQuota(
                                         user_id=user.user_id,
@@ -134,18 +215,18 @@ class QuotaResolver:
 
         # 4. Check JWT role assignments (GSI3: RoleAssignmentIndex)
         if user.roles:
-            role_assignments = []
-            for role in user.roles:
-                # Targeted query per role (O(log n) per role)
-                assignments = await self.repository.query_role_assignments(role)
-                role_assignments.extend(assignments)
+            # Targeted query per role (O(log n) per role), issued concurrently
+            results = await asyncio.gather(*(
+                self.repository.query_role_assignments(role) for role in user.roles
+            ))
+            role_assignments = [a for sub in results for a in sub]
 
             if role_assignments:
                 # Sort by priority (descending) and take highest enabled
                 role_assignments.sort(key=lambda a: a.priority, reverse=True)
                 for assignment in role_assignments:
                     if assignment.enabled:
-                        tier = await self.repository.get_tier(assignment.tier_id)
+                        tier = await self._get_tier(assignment.tier_id)
                         if tier and tier.enabled:
                             return ResolvedQuota(
                                 user_id=user.user_id,
@@ -159,10 +240,10 @@ class QuotaResolver:
             domain_assignments = await self._get_cached_domain_assignments()
             user_domain = user.email.split('@')[1]
 
-            # Sort by priority and find matching domain
-            for assignment in sorted(domain_assignments, key=lambda a: a.priority, reverse=True):
-                if assignment.enabled and self._matches_email_domain(user_domain, assignment.email_domain):
-                    tier = await self.repository.get_tier(assignment.tier_id)
+            # Already sorted by priority; find first matching domain
+            for assignment, matches in domain_assignments:
+                if assignment.enabled and matches(user_domain):
+                    tier = await self._get_tier(assignment.tier_id)
                     if tier and tier.enabled:
                         return ResolvedQuota(
                             user_id=user.user_id,
@@ -179,7 +260,7 @@ class QuotaResolver:
         if default_assignments:
             # Take highest priority default
             default_assignment = default_assignments[0]
-            tier = await self.repository.get_tier(default_assignment.tier_id)
+            tier = await self._get_tier(default_assignment.tier_id)
             if tier and tier.enabled:
                 return ResolvedQuota(
                     user_id=user.user_id,
@@ -192,33 +273,29 @@ class QuotaResolver:
         logger.warning(f"No quota configured for user {user.user_id}")
         return None
 
-    def _get_cache_key(self, user: User) -> str:
+    def _get_cache_key(self, user: User) -> CacheKey:
         """
         Generate cache key from user attributes.
 
-        Includes user_id and roles hash to auto-invalidate when these change.
+        Includes user_id and sorted roles to auto-invalidate when these change.
         """
-        roles_hash = hash(frozenset(user.roles)) if user.roles else 0
-        return f"{user.user_id}:{roles_hash}"
+        return (user.user_id, tuple(sorted(user.roles)) if user.roles else ())
 
     def invalidate_cache(self, user_id: Optional[str] = None):
         """Invalidate cache for specific user or all users"""
         if user_id:
             # Remove all cache entries for this user
-            keys_to_remove = [k for k in self._cache.keys() if k.startswith(f"{user_id}:")]
-            for key in keys_to_remove:
-                del self._cache[key]
+            self._cache.pop_user(user_id)
             logger.info(f"Invalidated cache for user {user_id}")
         else:
             # Clear entire cache
             self._cache.clear()
+            self._tier_cache.clear()
             self._domain_assignments_cache = None
             logger.info("Invalidated entire quota cache")
 
-    def _override_to_tier(self, override) -> QuotaTier:
+    def _override_to_tier(self, override: QuotaOverride) -> QuotaTier:
         """Convert override to a tier for use in quota checking"""
-        from .models import QuotaOverride  # Import here to avoid circular dependency
-
         if override.override_type == "unlimited":
             return QuotaTier(
                 tier_id=f"override_{override.override_id}",
@@ -245,19 +322,39 @@ class QuotaResolver:
                 created_by=override.created_by
             )
 
-    async def _get_cached_domain_assignments(self) -> list:
-        """Get domain assignments with separate cache"""
+    async def _get_tier(self, tier_id: str) -> Optional[QuotaTier]:
+        """Get tier by ID, memoized (tier changes invalidate the whole resolver cache)"""
+        tier = self._tier_cache.get(tier_id)
+        if tier is not None:
+            return tier
+
+        tier = await self.repository.get_tier(tier_id)
+        if tier is not None:
+            self._tier_cache[tier_id] = tier
+        return tier
+
+    async def _get_cached_domain_assignments(self) -> List[Tuple[QuotaAssignment, DomainMatcher]]:
+        """
+        Get domain assignments with separate cache.
+
+        Returns (assignment, matcher) pairs pre-sorted by priority (descending),
+        with each email_domain pattern parsed once at load time.
+        """
         if self._domain_assignments_cache:
-            assignments, cached_at = self._domain_assignments_cache
-            if datetime.utcnow() - cached_at < timedelta(seconds=self.cache_ttl):
+            assignments, expires_at = self._domain_assignments_cache
+            if time.monotonic() < expires_at:
                 return assignments
 
         # Cache miss - query domain assignments
-        assignments = await self.repository.list_assignments_by_type(
+        raw_assignments = await self.repository.list_assignments_by_type(
             assignment_type="email_domain",
             enabled_only=True
         )
-        self._domain_assignments_cache = (assignments, datetime.utcnow())
+        assignments = [
+            (assignment, _compile_domain_matcher(assignment.email_domain))
+            for assignment in sorted(raw_assignments, key=lambda a: a.priority, reverse=True)
+        ]
+        self._domain_assignments_cache = (assignments, time.monotonic() + self.cache_ttl)
         return assignments
 
     def _matches_email_domain(self, user_domain: str, pattern: str) -> bool:
@@ -270,31 +367,40 @@ class QuotaResolver:
         - Regex: "regex:^(cs|eng)\\.university\\.edu$"
         - Multiple: "university.edu,college.edu"
         """
-        if not pattern:
-            return False
-
-        # Exact match
-        if pattern == user_domain:
-            return True
-
-        # Wildcard subdomain (*.example.com)
-        if pattern.startswith('*.'):
-            base_domain = pattern[2:]
-            return user_domain == base_domain or user_domain.endswith('.' + base_domain)
-
-        # Regex pattern (prefix with "regex:")
-        if pattern.startswith('regex:'):
-            import re
-            regex_pattern = pattern[6:]
-            try:
-                return bool(re.match(regex_pattern, user_domain))
-            except re.error:
-                logger.error(f"Invalid regex pattern: {regex_pattern}")
-                return False
+        return _compile_domain_matcher(pattern)(user_domain)
+
 
-        # Multiple domains (comma-separated)
-        if ',' in pattern:
-            domains = [d.strip() for d in pattern.split(',')]
-            return any(self._matches_email_domain(user_domain, d) for d in domains)
+def _compile_domain_matcher(pattern: Optional[str]) -> DomainMatcher:
+    """
+    Parse an email domain pattern into a matcher callable.
 
-        return False
+    See QuotaResolver._matches_email_domain for the supported pattern syntax.
+    """
+    if not pattern:
+        return lambda user_domain: False
+
+    # Wildcard subdomain (*.example.com)
+    if pattern.startswith('*.'):
+        base_domain = pattern[2:]
+        suffix = '.' + base_domain
+        return lambda user_domain: (
+            user_domain == pattern or user_domain == base_domain or user_domain.endswith(suffix)
+        )
+
+    # Regex pattern (prefix with "regex:")
+    if pattern.startswith('regex:'):
+        regex_pattern = pattern[6:]
+        try:
+            compiled = re.compile(regex_pattern)
+        except re.error:
+            logger.error(f"Invalid regex pattern: {regex_pattern}")
+            return lambda user_domain: user_domain == pattern
+        return lambda user_domain: user_domain == pattern or compiled.match(user_domain) is not None
+
+    # Multiple domains (comma-separated)
+    if ',' in pattern:
+        matchers = [_compile_domain_matcher(d.strip()) for d in pattern.split(',')]
+        return lambda user_domain: any(m(user_domain) for m in matchers)
+
+    # Exact match
+    return lambda user_domain: user_domain == pattern
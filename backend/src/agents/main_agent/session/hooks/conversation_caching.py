@@ -53,7 +53,8 @@ In agent loops with multiple tool calls, savings compound:
 """
 
 import logging
-from typing import Any, Optional
+import math
+from typing import Any, Optional, Set
 from strands.hooks import HookProvider, HookRegistry, BeforeModelCallEvent
 
 logger = logging.getLogger(__name__)
@@ -68,6 +69,40 @@ CACHING_SUPPORTED_PATTERNS = [
 ]
 
 
+# Bedrock ignores cache points on prefixes shorter than this many tokens
+MIN_CACHE_PREFIX_TOKENS = 1024
+
+# Rough characters-per-token ratio used for the prefix size estimate
+CHARS_PER_TOKEN = 4
+
+# Images, documents, video and other non-text blocks: their token cost can't be
+# estimated from characters, but it is typically well over the minimum, so a
+# prefix containing one is treated as meeting it
+_ATTACHMENT_CHARS = math.inf
+
+
+def _estimate_block_chars(block: Any) -> float:
+    """Rough character count of a content block (text, tool use input, tool result content)."""
+    if type(block) is not dict:
+        return 0
+    if "text" in block:
+        return len(block["text"] or "")
+    tool_use = block.get("toolUse")
+    if tool_use is not None:
+        return len(str(tool_use.get("input", "")))
+    tool_result = block.get("toolResult")
+    if tool_result is not None:
+        return sum(_estimate_block_chars(item) for item in tool_result.get("content") or ())
+    if "json" in block:
+        return len(str(block["json"]))
+    reasoning = block.get("reasoningContent")
+    if reasoning is not None:
+        return len((reasoning.get("reasoningText") or {}).get("text") or "")
+    if "cachePoint" in block:
+        return 0
+    return _ATTACHMENT_CHARS
+
+
 def is_caching_supported(model_id: Optional[str]) -> bool:
     """Check if the model supports prompt caching with cachePoint field.
 
@@ -108,8 +143,19 @@ class ConversationCachingHook(HookProvider):
     - Requires Bedrock API version 2023-09-30 or later
     """
 
-    def __init__(self, enabled: bool = True):
+    def __init__(self, enabled: bool = True, min_prefix_tokens: int = MIN_CACHE_PREFIX_TOKENS):
         self.enabled = enabled
+        self.min_prefix_tokens = min_prefix_tokens
+        # ((id(tool_registry), tool count), estimated tool spec chars)
+        self._tool_chars_memo: Optional[tuple] = None
+        # (id(messages), len(messages), id(messages[-1])) as of the last call that left
+        # the cache point in place, plus the content list that holds it
+        self._last_fingerprint: Optional[tuple] = None
+        self._last_cached_content: Optional[list] = None
+        # Indices of messages holding cache points this hook placed, valid while the
+        # message list keeps the same identity and first message (see _list_key)
+        self._cp_message_indices: Set[int] = set()
+        self._cp_list_key: Optional[tuple] = None
 
     def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
         registry.add_callback(BeforeModelCallEvent, self.add_conversation_cache_point)
@@ -117,13 +163,15 @@ class ConversationCachingHook(HookProvider):
     def add_conversation_cache_point(self, event: BeforeModelCallEvent) -> None:
         """Add single cache point at the end of the last assistant message
 
-        This method implements a simple 6-step caching strategy:
+        This method implements a simple 7-step caching strategy:
         0. Check if the model supports caching (Claude/Nova only)
-        1. Find all existing cache points and the last assistant message
+        Memo: return if the message list is unchanged since the last call
+        1. Scan messages in reverse to find the last assistant message
         2. Early return if no assistant message exists
-        3. Check if cache point already exists at target location
-        4. Remove ALL existing cache points (reverse order to avoid index issues)
-        5. Append single cache point to end of last assistant content
+        3. Fast path: return if cache point already exists at target location
+        4. Remove ALL existing cache points (tracked indices, or one full reverse pass)
+        5. Skip if the cached prefix is below Bedrock's minimum token count
+        6. Append single cache point to end of last assistant content
         """
         if not self.enabled:
             logger.info("ConversationCachingHook: disabled, skipping")
@@ -160,53 +208,124 @@ class ConversationCachingHook(HookProvider):
         if not messages:
             return
 
-        # Step 1: Find all existing cache points and the last assistant message
-        cache_point_positions = []  # [(msg_idx, block_idx), ...]
+        # Memo: message list unchanged since the last call and the cache point is still
+        # at its tail - nothing to do
+        fingerprint = (id(messages), len(messages), id(messages[-1]))
+        if fingerprint == self._last_fingerprint:
+            cached_content = self._last_cached_content
+            if cached_content:
+                tail = cached_content[-1]
+                if type(tail) is dict and "cachePoint" in tail:
+                    logger.info("🔄 Messages unchanged since last call - cache point already in place")
+                    return
+
+        # Step 1: Find the last assistant message (reverse scan stops at the first hit)
         last_assistant_idx = None
-
-        for msg_idx, msg in enumerate(messages):
-            # Track last assistant message
-            if msg.get("role") == "assistant":
+        for msg_idx in range(len(messages) - 1, -1, -1):
+            if messages[msg_idx].get("role") == "assistant":
                 last_assistant_idx = msg_idx
-
-            content = msg.get("content", [])
-            if not isinstance(content, list):
-                continue
-
-            for block_idx, block in enumerate(content):
-                if isinstance(block, dict) and "cachePoint" in block:
-                    cache_point_positions.append((msg_idx, block_idx))
+                break
 
         # Step 2: If no assistant message yet, nothing to cache
         if last_assistant_idx is None:
             logger.info("🔄 No assistant message in conversation - skipping cache point (first turn)")
             return
 
-        last_assistant_content = messages[last_assistant_idx].get("content", [])
-        if not isinstance(last_assistant_content, list) or len(last_assistant_content) == 0:
+        last_assistant_content = messages[last_assistant_idx].get("content")
+        if type(last_assistant_content) is not list or not last_assistant_content:
             logger.info("🔄 Last assistant message has no content - skipping cache point")
             return
 
-        # Step 3: Check if cache point already exists at the end of last assistant message
+        # Step 3: Fast path - in steady state the cache point is already at the end of
+        # the last assistant message, so this O(1) tail check is the common exit
         last_block = last_assistant_content[-1]
-        if isinstance(last_block, dict) and "cachePoint" in last_block:
+        if type(last_block) is dict and "cachePoint" in last_block:
             logger.info("🔄 Cache point already exists at end of last assistant message")
+            self._last_fingerprint = fingerprint
+            self._last_cached_content = last_assistant_content
             return
 
         # Step 4: Remove ALL existing cache points (we only want 1 at the end)
-        # Process in reverse order to avoid index shifting issues
-        for msg_idx, block_idx in reversed(cache_point_positions):
-            msg_content = messages[msg_idx].get("content", [])
-            if isinstance(msg_content, list) and block_idx < len(msg_content):
-                del msg_content[block_idx]
-                logger.info(f"🔄 Removed old cache point at msg {msg_idx} block {block_idx}")
-
-        # Step 5: Add single cache point at the end of the last assistant message
+        list_key = (id(messages), id(messages[0]))
+        if list_key == self._cp_list_key:
+            # Same conversation as last time - only the messages we placed CPs on can have one
+            candidate_indices = sorted(
+                (i for i in self._cp_message_indices if i < len(messages)), reverse=True
+            )
+        else:
+            # New or reshaped conversation (e.g. trimmed by the conversation manager) - scan it all.
+            # Strands normalizes content to list[ContentBlock]; validate that once here so
+            # the removal pass below can trust it instead of re-checking per message/block
+            if any(type(msg.get("content")) is not list for msg in messages):
+                logger.warning("🔄 Message with non-list content in conversation - skipping cache point")
+                return
+            candidate_indices = range(len(messages) - 1, -1, -1)
+
+        # Delete in place; reverse block order keeps indices valid
+        for msg_idx in candidate_indices:
+            content = messages[msg_idx]["content"]
+            for block_idx in range(len(content) - 1, -1, -1):
+                if "cachePoint" in content[block_idx]:
+                    del content[block_idx]
+                    logger.info(f"🔄 Removed old cache point at msg {msg_idx} block {block_idx}")
+
+        self._cp_message_indices = set()
+        self._cp_list_key = list_key
+
+        # Step 5: Skip the cache point if the prefix is too short for Bedrock to cache it
+        if not self._prefix_meets_minimum(event.agent, messages, last_assistant_idx):
+            logger.info(
+                f"🔄 Prefix below {self.min_prefix_tokens} estimated tokens - skipping cache point"
+            )
+            return
+
+        # Step 6: Add single cache point at the end of the last assistant message
         cache_block = {"cachePoint": {"type": "default"}}
+        last_assistant_content.append(cache_block)
+        self._cp_message_indices.add(last_assistant_idx)
+        self._last_fingerprint = fingerprint
+        self._last_cached_content = last_assistant_content
+        logger.info(f"✅ Added cache point at end of assistant message {last_assistant_idx}")
 
-        # Re-fetch content in case it was modified by deletion
-        last_assistant_content = messages[last_assistant_idx].get("content", [])
-        if isinstance(last_assistant_content, list):
-            last_assistant_content.append(cache_block)
-            logger.info(f"✅ Added cache point at end of assistant message {last_assistant_idx}")
+    def _prefix_meets_minimum(self, agent: Any, messages: list, last_assistant_idx: int) -> bool:
+        """Estimate whether the prefix up to the last assistant message reaches min_prefix_tokens
 
+        Uses ~4 characters per token over the system prompt, tool specs, and message blocks,
+        and stops counting as soon as the threshold is reached.
+        """
+        threshold = self.min_prefix_tokens * CHARS_PER_TOKEN
+        if threshold <= 0:
+            return True
+
+        system_prompt = getattr(agent, "system_prompt", None)
+        total = len(system_prompt) if type(system_prompt) is str else 0
+        total += self._estimate_tool_chars(agent)
+
+        # Walk backwards from the cache point; recent turns tend to be the largest
+        for msg_idx in range(last_assistant_idx, -1, -1):
+            if total >= threshold:
+                return True
+            for block in messages[msg_idx]["content"]:
+                total += _estimate_block_chars(block)
+
+        return total >= threshold
+
+    def _estimate_tool_chars(self, agent: Any) -> int:
+        """Character count of the agent's tool specs, memoized until the tool set changes"""
+        tool_registry = getattr(agent, "tool_registry", None)
+        registry = getattr(tool_registry, "registry", None)
+        if not isinstance(registry, dict):
+            return 0
+
+        key = (id(tool_registry), len(registry))
+        if self._tool_chars_memo and self._tool_chars_memo[0] == key:
+            return self._tool_chars_memo[1]
+
+        try:
+            tool_chars = sum(len(str(spec)) for spec in tool_registry.get_all_tool_specs())
+        except Exception as e:
+            logger.debug(f"Could not estimate tool spec size: {e}")
+            tool_chars = 0
+
+        self._tool_chars_memo = (key, tool_chars)
+        return tool_chars
@@ -4,17 +4,39 @@ Wraps FileSessionManager with buffering and cancellation support for local devel
 Similar to TurnBasedSessionManager but for local file-based storage.
 """
 
+import asyncio
+import atexit
+import json
 import logging
-from typing import Optional, Dict, Any, List
+import threading
+import weakref
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional, List, Tuple
+
+from strands.types.content import Message
+
+from apis.app_api.storage.paths import get_message_path, get_messages_dir
 
 logger = logging.getLogger(__name__)
 
+# Live buffers, flushed at interpreter exit as a last-resort safety net (local dev)
+_live_buffers: "weakref.WeakSet[LocalSessionBuffer]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_buffers() -> None:
+    for buffer in list(_live_buffers):
+        try:
+            buffer.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush session {buffer.session_id} at exit: {e}")
+
 
 class LocalSessionBuffer:
     """
     Wrapper around FileSessionManager that adds:
-    1. Cancellation support (cancelled flag)
-    2. Simple buffering to batch writes
+    1. Cancellation support (cancel() sets the cancelled flag and flushes, awaitable)
+    2. Simple buffering to batch writes (flushes on message count or buffered size)
 
     For local development only - mimics TurnBasedSessionManager behavior.
     """
@@ -23,15 +45,35 @@ class LocalSessionBuffer:
         self,
         base_manager,
         session_id: str,
-        batch_size: int = 5
+        batch_size: int = 5,
+        max_pending_bytes: int = 1_048_576  # 1 MiB
     ):
         self.base_manager = base_manager
         self.session_id = session_id
         self.batch_size = batch_size
+        self.max_pending_bytes = max_pending_bytes
         self.cancelled = False  # Flag to stop accepting new messages
-        self.pending_messages: List[Dict[str, Any]] = []
-
-        logger.info(f"✅ LocalSessionBuffer initialized (batch_size={batch_size})")
+        self.pending_messages: List[Message] = []
+        self._pending_bytes = 0  # Rough size of buffered content
+        # Serializes disk writes when flushes run on worker threads; also guards
+        # _last_message_id
+        self._flush_lock = threading.Lock()
+        # Pending writes (background and flush_async) -> the batch each one writes.
+        # Only touched on the event loop thread; each task waits for the earlier ones.
+        self._flush_tasks: Dict[asyncio.Task, List[Message]] = {}
+        # Last written message sequence; loaded from disk before the first write, then kept in memory
+        self._last_message_id: Optional[int] = None
+        # Messages detached from the buffer for writing (caller's thread only)
+        self._handed_off = 0
+        # (last message sequence, handed-off messages since written or dropped), replaced
+        # as a whole by the writer so message_count can read it without _flush_lock
+        self._write_progress: Tuple[Optional[int], int] = (None, 0)
+        self._messages_dir = get_messages_dir(session_id)
+        _live_buffers.add(self)
+
+        logger.info(
+            f"✅ LocalSessionBuffer initialized (batch_size={batch_size}, max_pending_bytes={max_pending_bytes})"
+        )
 
     def append_message(self, message, agent, **kwargs):
         """
@@ -47,75 +89,179 @@ class LocalSessionBuffer:
             logger.warning(f"🚫 Session cancelled, ignoring message (role={message.get('role')})")
             return
 
-        # Convert Message to dict format for buffering
-        message_dict = {
-            "role": message.get("role"),
-            "content": message.get("content", [])
-        }
+        # Strands messages are already plain dicts - buffer as-is
+        self.pending_messages.append(message)
+        self._pending_bytes += len(str(message.get("content", "")))
+        logger.debug("📝 Buffered message (role=%s, total=%d)", message.get("role"), len(self.pending_messages))
+
+        # Periodic flush to prevent data loss - by message count, or sooner for
+        # large payloads (e.g. big tool results) to bound buffered memory
+        if len(self.pending_messages) >= self.batch_size or self._pending_bytes >= self.max_pending_bytes:
+            logger.info(
+                f"⏰ Flush threshold reached ({len(self.pending_messages)} messages, "
+                f"~{self._pending_bytes} bytes), flushing buffer"
+            )
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self.flush()
+            else:
+                # Keep disk I/O off the event loop
+                self._schedule_flush(loop)
+
+    async def cancel(self, stop_message: Optional[Message] = None) -> Optional[int]:
+        """
+        Stop accepting new messages and flush what is already buffered.
 
-        # Add to buffer
-        self.pending_messages.append(message_dict)
-        logger.debug(f"📝 Buffered message (role={message_dict['role']}, total={len(self.pending_messages)})")
+        Callers should use this rather than setting `cancelled` directly, so messages
+        buffered before the cancellation (e.g. 4 of a batch of 5) aren't lost.
 
-        # Periodic flush to prevent data loss
-        if len(self.pending_messages) >= self.batch_size:
-            logger.info(f"⏰ Batch size ({self.batch_size}) reached, flushing buffer")
-            self.flush()
+        Args:
+            stop_message: Optional final message (e.g. "Session stopped by user")
+                persisted after the buffered ones
+
+        Returns:
+            Sequence number (0-based) of the last flushed message, or None if unavailable
+        """
+        self.cancelled = True
+        if stop_message is not None:
+            self.pending_messages.append(stop_message)
+        return await self.flush_async()
+
+    def _take_pending(self) -> List[Message]:
+        """Detach the buffered messages; later appends start a new batch"""
+        if self._handed_off == 0 and self._last_message_id is None:
+            # One-time directory scan before any writer runs, so later reads of
+            # _write_progress never race with the initial load
+            self._load_last_message_id()
+        batch, self.pending_messages = self.pending_messages, []
+        self._pending_bytes = 0
+        self._handed_off += len(batch)
+        return batch
+
+    def _schedule_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Write the current buffer on a worker thread without blocking the caller"""
+        self._schedule_write(loop, self._take_pending(), self._write_batch)
+
+    def _schedule_write(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        batch: List[Message],
+        writer: Callable[[List[Message]], Optional[int]],
+    ) -> asyncio.Task:
+        """Queue a batch write behind every write already pending"""
+        previous = list(self._flush_tasks)
+        task = loop.create_task(self._write_in_background(batch, previous, writer))
+        self._flush_tasks[task] = batch
+        task.add_done_callback(self._on_flush_done)
+        return task
+
+    async def _write_in_background(
+        self,
+        batch: List[Message],
+        previous: List[asyncio.Task],
+        writer: Callable[[List[Message]], Optional[int]],
+    ) -> Optional[int]:
+        # Earlier batches go first so sequence numbers follow message order
+        if previous:
+            await asyncio.wait(previous)
+        return await asyncio.to_thread(writer, batch)
+
+    def _on_flush_done(self, task: asyncio.Task) -> None:
+        batch = self._flush_tasks.pop(task, None)
+        if task.cancelled():
+            logger.warning(
+                "Background flush cancelled for session %s (%d messages unwritten)",
+                self.session_id, len(batch or []),
+            )
+        elif task.exception() is not None:
+            logger.error("Background flush failed for session %s: %s", self.session_id, task.exception())
+
+    async def __aenter__(self) -> "LocalSessionBuffer":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        # Guarantee buffered messages reach disk when the scope ends
+        await self.flush_async()
+
+    async def flush_async(self) -> Optional[int]:
+        """
+        Flush pending messages on a worker thread so disk writes don't block the event loop
+
+        Waits for background flushes started by append_message first, so every
+        message appended before this call is on disk when it returns.
+
+        Returns:
+            Sequence number (0-based) of the last flushed message, or None if nothing was flushed
+        """
+        task = self._schedule_write(asyncio.get_running_loop(), self._take_pending(), self._flush_batch)
+        # Shielded so a cancelled caller doesn't abandon the batch it detached
+        return await asyncio.shield(task)
 
     def flush(self) -> Optional[int]:
         """
-        Force flush pending messages to FileSessionManager
+        Force flush pending messages to FileSessionManager, blocking the caller
+
+        For callers without a running event loop (interpreter exit, sync code);
+        async code should await flush_async() instead.
 
         Returns:
             Sequence number (0-based) of the last flushed message, or None if nothing was flushed
         """
-        # Flush pending messages if any exist
-        if self.pending_messages:
-            logger.info(f"💾 Flushing {len(self.pending_messages)} messages to FileSessionManager")
-
-            # Get current sequence number for file naming (0-based)
-            sequence_num = self._get_next_sequence_number()
-
-            # Write each pending message to base manager
-            for idx, message_dict in enumerate(self.pending_messages):
-                # Convert dict back to Message-like object
-                from strands.types.session import SessionMessage
-                from strands.types.content import Message
-
-                strands_message: Message = {
-                    "role": message_dict["role"],
-                    "content": message_dict["content"]
-                }
-
-                # Create SessionMessage and pass to base manager
-                session_message = SessionMessage.from_message(strands_message, 0)
-
-                try:
-                    # Store with 0-based sequence number for filename
-                    current_seq = sequence_num + idx
-                    self._write_message_to_disk(
-                        session_message,
-                        sequence=current_seq
-                    )
-                    logger.debug(f"💾 Wrote message to message_{current_seq}.json")
-                except Exception as e:
-                    logger.error(f"Failed to write message to FileSessionManager: {e}")
-
-            # Clear buffer after writing
-            self.pending_messages = []
-
-        # Always try to get the latest message ID from disk
-        # This handles the case where messages were already flushed during streaming
-        # (e.g., when batch_size was reached)
-        last_message_id = self._get_latest_message_id()
+        return self._flush_batch(self._take_pending())
+
+    def _write_batch(self, batch: List[Message]) -> Optional[int]:
+        """Write a detached batch under the flush lock (runs on a worker thread)"""
+        with self._flush_lock:
+            return self._write_all(batch) if batch else None
+
+    def _flush_batch(self, batch: List[Message]) -> Optional[int]:
+        """Write a detached batch and report the latest stored message sequence"""
+        with self._flush_lock:
+            last_message_id = self._write_all(batch) if batch else None
+
+            # Nothing written this time - get the latest message ID from disk
+            # This handles the case where messages were already flushed during streaming
+            # (e.g., when batch_size was reached)
+            if last_message_id is None:
+                last_message_id = self._get_latest_message_id()
 
         if last_message_id is not None:
-            logger.debug(f"✅ Flush complete (latest message sequence: {last_message_id})")
+            logger.debug("✅ Flush complete (latest message sequence: %s)", last_message_id)
         else:
-            logger.debug(f"✅ Flush complete (no messages found)")
+            logger.debug("✅ Flush complete (no messages found)")
 
         return last_message_id
 
+    def _write_all(self, to_write: List[Message]) -> Optional[int]:
+        """
+        Write a batch of buffered messages to disk
+
+        Returns:
+            Sequence number of the last message written, or None if every write failed
+        """
+        logger.info(f"💾 Flushing {len(to_write)} messages to FileSessionManager")
+
+        last_written = None
+        finished = self._write_progress[1]
+
+        for message in to_write:
+            try:
+                # Store with 0-based sequence number for filename
+                current_seq = self._get_next_sequence_number()
+                self._write_message_to_disk(
+                    message,
+                    sequence=current_seq
+                )
+                self._last_message_id = last_written = current_seq
+                logger.debug("💾 Wrote message to message_%d.json", current_seq)
+            except Exception as e:
+                logger.error(f"Failed to write message to FileSessionManager: {e}")
+            finished += 1
+            self._write_progress = (self._last_message_id, finished)
+
+        return last_written
+
     def _get_latest_message_id(self) -> Optional[int]:
         """
         Get the sequence number of the most recently stored message in local file storage
@@ -123,71 +269,78 @@ class LocalSessionBuffer:
         Returns:
             Sequence number (0-based) or None if unavailable
         """
-        try:
-            from pathlib import Path
-            from apis.app_api.storage.paths import get_messages_dir
+        last_message_id = self._load_last_message_id()
+        return last_message_id if last_message_id is not None and last_message_id >= 0 else None
 
-            # Get messages directory
-            messages_dir = get_messages_dir(self.session_id)
+    def _get_next_sequence_number(self) -> int:
+        """
+        Get the next sequence number for file naming
 
-            if messages_dir.exists():
-                # Get all message files sorted by number
-                message_files = sorted(
-                    messages_dir.glob("message_*.json"),
-                    key=lambda p: int(p.stem.split("_")[1]) if p.stem.split("_")[1].isdigit() else 0
-                )
-                if message_files:
-                    # Get the highest message number (0-based sequence)
-                    latest_file = message_files[-1]
-                    message_num = int(latest_file.stem.split("_")[1])
-                    return message_num
+        Returns:
+            int: Next sequence number (0-based: 0 for first message, increments from there)
+        """
+        last_message_id = self._load_last_message_id()
+        return last_message_id + 1 if last_message_id is not None else 0
 
-        except Exception as e:
-            logger.error(f"Failed to get latest message sequence: {e}")
+    @property
+    def message_count(self) -> int:
+        """
+        Number of messages stored or buffered for this session (from the in-memory counter)
 
-        return None
+        Lets StreamCoordinator read the count without listing every message in the session.
+        Reads one snapshot published by the writer, so it never waits on a disk write.
+        """
+        if self._handed_off == 0 and self._last_message_id is None:
+            self._load_last_message_id()
+        last_message_id, finished = self._write_progress
+        stored = last_message_id + 1 if last_message_id is not None and last_message_id >= 0 else 0
+        return stored + (self._handed_off - finished) + len(self.pending_messages)
 
-    def _get_next_sequence_number(self) -> int:
+    def _load_last_message_id(self) -> Optional[int]:
         """
-        Get the next sequence number for file naming
+        Return the in-memory last message sequence, scanning the messages directory once on first use
+
+        The base FileSessionManager also writes message files directly (Strands registers
+        its hooks), so a cached value is advanced by probing for the next sequential files.
 
         Returns:
-            int: Next sequence number (0-based: 0 for first message, increments from there)
+            Last sequence number, -1 if the session has no messages yet, or None if the scan failed
         """
-        try:
-            from apis.app_api.storage.paths import get_messages_dir
+        if self._last_message_id is not None:
+            last_message_id = self._last_message_id
+            while get_message_path(self.session_id, last_message_id + 1).exists():
+                last_message_id += 1
+            if last_message_id != self._last_message_id:
+                self._last_message_id = last_message_id
+                self._write_progress = (last_message_id, self._write_progress[1])
+            return last_message_id
 
-            messages_dir = get_messages_dir(self.session_id)
+        try:
+            messages_dir = self._messages_dir
+            last_message_id = -1
 
             if messages_dir.exists():
-                message_files = sorted(
-                    messages_dir.glob("message_*.json"),
-                    key=lambda p: int(p.stem.split("_")[1]) if p.stem.split("_")[1].isdigit() else 0
-                )
-                if message_files:
-                    latest_file = message_files[-1]
-                    last_seq = int(latest_file.stem.split("_")[1])
-                    return last_seq + 1
-
-            return 0  # First message (0-based)
+                for path in messages_dir.glob("message_*.json"):
+                    suffix = path.stem.split("_")[1]
+                    if suffix.isdigit():
+                        last_message_id = max(last_message_id, int(suffix))
+
+            self._last_message_id = last_message_id
+            self._write_progress = (last_message_id, self._write_progress[1])
+            return last_message_id
         except Exception as e:
-            logger.error(f"Failed to get next sequence number: {e}")
-            return 0
+            logger.error(f"Failed to get latest message sequence: {e}")
+            return None
 
-    def _write_message_to_disk(self, session_message, sequence: int):
+    def _write_message_to_disk(self, message: Message, sequence: int):
         """
         Write message to disk with sequence number
 
         Args:
-            session_message: SessionMessage object from Strands
+            message: Message from Strands framework
             sequence: 0-based sequence number for file naming and ID computation
         """
-        from apis.app_api.storage.paths import get_message_path
-        import json
-        from datetime import datetime, timezone
-
         message_path = get_message_path(self.session_id, sequence)
-        message_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Store message with sequence number and timestamp
         # Message ID is computed from session_id and sequence: msg-{sessionId}-{sequence}
@@ -195,12 +348,19 @@ class LocalSessionBuffer:
             "sequence": sequence,
             "created_at": datetime.now(timezone.utc).isoformat(),
             "message": {
-                "role": session_message.role,
-                "content": session_message.content
+                "role": message.get("role"),
+                "content": message.get("content", [])
             }
         }
 
-        with open(message_path, 'w') as f:
+        try:
+            f = open(message_path, 'w')
+        except FileNotFoundError:
+            # Only the first write of a session (or after the session dir was
+            # removed) needs the directory created - skip the mkdir stats otherwise
+            message_path.parent.mkdir(parents=True, exist_ok=True)
+            f = open(message_path, 'w')
+        with f:
             json.dump(message_data, f, indent=2)
 
     # Delegate all other methods to base manager
@@ -392,3 +392,45 @@ class TestFallbackSummary:
         # Should only have one point (the actual question, not the tool result)
         assert len(key_points) == 1
         assert "weather" in key_points[0].lower()
+
+
+class TestCompactionStatePersistence:
+    """Tests for _save_compaction_state write shape"""
+
+    @pytest.fixture
+    def manager(self):
+        from unittest.mock import MagicMock
+
+        manager = object.__new__(TurnBasedSessionManager)
+        manager.user_id = "user-1"
+        manager.compaction_config = CompactionConfig(enabled=True)
+        manager._persisted_compaction = None
+        table = MagicMock()
+        manager._get_dynamodb_table = lambda: table
+        manager._get_session_via_gsi = lambda t: {"PK": "USER#user-1", "SK": "S#ACTIVE#x#s1"}
+        return manager, table
+
+    def test_token_only_change_writes_token_fields(self, manager):
+        manager, table = manager
+        state = CompactionState(checkpoint=4, summary="Earlier context")
+
+        manager._save_compaction_state(state)
+        assert table.update_item.call_args.kwargs["UpdateExpression"] == "SET compaction = :state"
+
+        state.last_input_tokens = 1234
+        manager._save_compaction_state(state)
+        kwargs = table.update_item.call_args.kwargs
+        assert "compaction.lastInputTokens" in kwargs["UpdateExpression"]
+        assert kwargs["ExpressionAttributeValues"][":tokens"] == 1234
+
+    def test_checkpoint_change_writes_full_state(self, manager):
+        manager, table = manager
+        state = CompactionState(checkpoint=4, summary="Earlier context")
+        manager._save_compaction_state(state)
+
+        state.checkpoint = 8
+        state.summary = "More context"
+        manager._save_compaction_state(state)
+        kwargs = table.update_item.call_args.kwargs
+        assert kwargs["UpdateExpression"] == "SET compaction = :state"
+        assert kwargs["ExpressionAttributeValues"][":state"]["checkpoint"] == 8
@@ -14,12 +14,17 @@ Compaction Strategy (two-feature approach):
 Based on: https://medium.com/@tonypeng_30327/part-2-building-agent-memory-system-bedrock-agentcore-context-compaction-82917f4c2ba0
 """
 
+import asyncio
 import copy
 import json
 import logging
 import os
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List, TYPE_CHECKING
+from typing import Optional, Dict, Any, List, Tuple, TYPE_CHECKING
+
+import boto3
+from boto3.dynamodb.conditions import Key
+from strands.hooks import AgentInitializedEvent, MessageAddedEvent, AfterInvocationEvent
 
 from bedrock_agentcore.memory.integrations.strands.session_manager import AgentCoreMemorySessionManager
 from bedrock_agentcore.memory.integrations.strands.config import AgentCoreMemoryConfig
@@ -78,6 +83,8 @@ class TurnBasedSessionManager:
         )
 
         self.config = agentcore_memory_config
+        # Cached once: read on every compaction save, summary lookup and log line
+        self.session_id = agentcore_memory_config.session_id
         self.region_name = region_name
         self.user_id = user_id
         self.summarization_strategy_id = summarization_strategy_id
@@ -87,6 +94,9 @@ class TurnBasedSessionManager:
 
         # Compaction state (loaded during initialize)
         self.compaction_state: Optional[CompactionState] = None
+        # (checkpoint, summary) last known to be stored in DynamoDB; while it matches,
+        # saves only touch the per-turn token fields instead of rewriting the summary
+        self._persisted_compaction: Optional[Tuple[int, Optional[str]]] = None
 
         # Cached data for checkpoint calculation
         self._valid_cutoff_indices: List[int] = []
@@ -127,7 +137,6 @@ class TurnBasedSessionManager:
                 logger.warning("DYNAMODB_SESSIONS_METADATA_TABLE_NAME not configured, compaction state will not persist")
                 return None
 
-            import boto3
             TurnBasedSessionManager._dynamodb_table_name = table_name
             dynamodb = boto3.resource('dynamodb', region_name=self.region_name)
             TurnBasedSessionManager._dynamodb_table = dynamodb.Table(table_name)
@@ -145,12 +154,10 @@ class TurnBasedSessionManager:
             Session item dict including PK/SK if found, None otherwise
         """
         try:
-            from boto3.dynamodb.conditions import Key
-
             response = table.query(
                 IndexName='SessionLookupIndex',
                 KeyConditionExpression=(
-                    Key('GSI_PK').eq(f'SESSION#{self.config.session_id}') &
+                    Key('GSI_PK').eq(f'SESSION#{self.session_id}') &
                     Key('GSI_SK').eq('META')
                 )
             )
@@ -163,7 +170,7 @@ class TurnBasedSessionManager:
 
             # Verify user ownership
             if item.get('userId') != self.user_id:
-                logger.warning(f"Session {self.config.session_id} belongs to different user")
+                logger.warning(f"Session {self.session_id} belongs to different user")
                 return None
 
             return item
@@ -181,7 +188,7 @@ class TurnBasedSessionManager:
         """
         try:
             messages = self.base_manager.list_messages(
-                self.config.session_id,
+                self.session_id,
                 "default"  # agent_id
             )
             initial_count = len(messages) if messages else 0
@@ -221,13 +228,14 @@ class TurnBasedSessionManager:
             # Look up session via GSI since we don't know the exact SK
             session_item = self._get_session_via_gsi(table)
             if not session_item:
-                logger.debug(f"_load_compaction_state: No session record found for session {self.config.session_id}")
+                logger.debug(f"_load_compaction_state: No session record found for session {self.session_id}")
                 return CompactionState()
 
             # Extract compaction state from session record
             compaction_data = session_item.get('compaction')
             if compaction_data:
                 state = CompactionState.from_dict(compaction_data)
+                self._persisted_compaction = (state.checkpoint, state.summary)
                 logger.info(
                     f"📍 Loaded compaction state: checkpoint={state.checkpoint}, "
                     f"summary_len={len(state.summary) if state.summary else 0}, "
@@ -248,6 +256,8 @@ class TurnBasedSessionManager:
         Save compaction state to DynamoDB session metadata.
 
         Uses GSI to find the session record, then updates it with the compaction state.
+        Most turns only change the token count, so when the checkpoint and summary
+        match what is already stored, only lastInputTokens/updatedAt are written.
         """
         if not self.user_id or not self.compaction_config or not self.compaction_config.enabled:
             return
@@ -269,8 +279,29 @@ class TurnBasedSessionManager:
                 logger.warning(f"Session record missing PK/SK, cannot save compaction state")
                 return
 
-            # Update with compaction state
             state.updated_at = datetime.now(timezone.utc).isoformat()
+
+            if self._persisted_compaction == (state.checkpoint, state.summary):
+                try:
+                    table.update_item(
+                        Key={'PK': pk, 'SK': sk},
+                        UpdateExpression=(
+                            'SET compaction.lastInputTokens = :tokens, '
+                            'compaction.updatedAt = :updated_at'
+                        ),
+                        ConditionExpression='attribute_exists(compaction)',
+                        ExpressionAttributeValues={
+                            ':tokens': state.last_input_tokens,
+                            ':updated_at': state.updated_at,
+                        }
+                    )
+                    logger.debug(f"💾 Saved compaction token count: {state.last_input_tokens}")
+                    return
+                except Exception as e:
+                    # Stored map missing or replaced - fall back to a full write
+                    logger.debug(f"Partial compaction save failed, writing full state: {e}")
+
+            # Update with compaction state
             table.update_item(
                 Key={'PK': pk, 'SK': sk},
                 UpdateExpression='SET compaction = :state',
@@ -278,6 +309,7 @@ class TurnBasedSessionManager:
                     ':state': state.to_dict()
                 }
             )
+            self._persisted_compaction = (state.checkpoint, state.summary)
             logger.debug(f"💾 Saved compaction state: checkpoint={state.checkpoint}")
         except Exception as e:
             logger.error(f"Error saving compaction state: {e}")
@@ -318,12 +350,10 @@ class TurnBasedSessionManager:
             return []
 
         try:
-            import boto3
-
             namespace = (
                 f"/strategies/{strategy_id}"
                 f"/actors/{self.config.actor_id}"
-                f"/sessions/{self.config.session_id}"
+                f"/sessions/{self.session_id}"
             )
 
             client = boto3.client('bedrock-agentcore', region_name=self.region_name)
@@ -699,6 +729,12 @@ class TurnBasedSessionManager:
         if not self.compaction_config or not self.compaction_config.enabled:
             return
 
+        # The state save (GSI query + update_item) and, past the threshold, the message
+        # fetch and LTM retrieval are blocking boto3 calls - keep them off the event loop
+        await asyncio.to_thread(self._update_after_turn_blocking, input_tokens)
+
+    def _update_after_turn_blocking(self, input_tokens: int) -> None:
+        """Synchronous body of update_after_turn (runs on a worker thread)."""
         if self.compaction_state is None:
             self.compaction_state = CompactionState()
 
@@ -719,7 +755,7 @@ class TurnBasedSessionManager:
         # The cached indices from initialize() are stale - new messages were added
         try:
             raw_messages = self.base_manager.list_messages(
-                self.config.session_id,
+                self.session_id,
                 "default"  # agent_id
             )
             if not raw_messages:
@@ -831,6 +867,10 @@ class TurnBasedSessionManager:
         """
         Pass message through to base manager and track message count.
 
+        No lock is needed: MessageAddedEvent is fired by the Strands event loop
+        as each message is appended to agent.messages, one at a time, even when
+        tools run concurrently - tools never append messages themselves.
+
         Args:
             message: Message from Strands framework
             agent: Agent instance
@@ -846,8 +886,7 @@ class TurnBasedSessionManager:
         # Track message count
         self.message_count += 1
 
-        role = message.get("role", "unknown")
-        logger.debug(f"📝 Message persisted (role={role}, count={self.message_count})")
+        logger.debug("📝 Message persisted (role=%s, count=%s)", message.get("role", "unknown"), self.message_count)
 
     def register_hooks(self, registry, **kwargs):
         """
@@ -856,12 +895,6 @@ class TurnBasedSessionManager:
         CRITICAL: This method MUST be defined here to prevent the base manager
         from registering its own hooks. We register OUR methods as callbacks.
         """
-        from strands.hooks import (
-            AgentInitializedEvent,
-            MessageAddedEvent,
-            AfterInvocationEvent
-        )
-
         logger.info("🔗 Registering hooks (with compaction support)")
 
         # Register initialization hook - use OUR initialize (with compaction)
@@ -895,6 +928,21 @@ class TurnBasedSessionManager:
 
         logger.info("✅ Hooks registered (including LTM retrieval)")
 
+    # Strands calls these directly on the agent's session manager; forward them
+    # explicitly so they don't go through the __getattr__ miss path
+
+    def sync_agent(self, agent, **kwargs):
+        """Delegate agent state sync to the base manager."""
+        return self.base_manager.sync_agent(agent, **kwargs)
+
+    def redact_latest_message(self, redact_message, agent, **kwargs):
+        """Delegate guardrail redaction to the base manager."""
+        return self.base_manager.redact_latest_message(redact_message, agent, **kwargs)
+
+    def list_messages(self, session_id, agent_id, limit=None, offset=0, **kwargs):
+        """Delegate message listing to the base manager."""
+        return self.base_manager.list_messages(session_id, agent_id, limit=limit, offset=offset, **kwargs)
+
     def __getattr__(self, name):
-        """Delegate unknown methods to base AgentCore session manager."""
+        """Delegate any other attribute to base AgentCore session manager."""
         return getattr(self.base_manager, name)
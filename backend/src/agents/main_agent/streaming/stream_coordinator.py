@@ -5,11 +5,13 @@ Stream coordinator for managing agent streaming lifecycle
 import asyncio
 import json
 import logging
-import os
 import time
 from datetime import datetime, timezone
 from typing import Any, AsyncGenerator, Dict, List, Optional, Union
 
+import orjson
+
+from agents.request_context import current_session_id, current_user_id
 from apis.shared.errors import ConversationalErrorEvent, ErrorCode, StreamErrorEvent, build_conversational_error_event
 
 from .stream_processor import process_agent_stream
@@ -38,7 +40,7 @@ class StreamCoordinator:
         user_id: str,
         main_agent_wrapper: Any = None,
         citations: Optional[List] = None,
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[bytes, None]:
         """
         Stream agent responses with proper lifecycle management
 
@@ -55,11 +57,11 @@ class StreamCoordinator:
             citations: Optional list of citation dicts from RAG retrieval to persist with metadata
 
         Yields:
-            str: SSE formatted events
+            bytes: SSE formatted events (str for the rarely hit error frames)
         """
-        # Set environment variables for browser session isolation
-        os.environ["SESSION_ID"] = session_id
-        os.environ["USER_ID"] = user_id
+        # Per-request identifiers for browser session isolation (context-local, not os.environ)
+        current_session_id.set(session_id)
+        current_user_id.set(user_id)
 
         # Track timing for latency metrics
         stream_start_time = time.time()
@@ -87,8 +89,11 @@ class StreamCoordinator:
 
             # Process through new stream processor and format as SSE
             async for event in process_agent_stream(agent_stream):
+                # Most events are content deltas - read the type once per event
+                event_type = event.get("type")
+
                 # Track when new assistant messages start (to associate metadata with them)
-                if event.get("type") == "message_start":
+                if event_type == "message_start":
                     role = event.get("data", {}).get("role")
                     if role == "assistant":
                         current_assistant_message_index += 1
@@ -103,12 +108,12 @@ class StreamCoordinator:
                                 "end_time": None,  # When this message ended
                             }
                         )
-                        logger.debug(f"📝 Assistant message {current_assistant_message_index} started at {per_message_metadata[-1]['start_time']}")
+                        logger.debug("📝 Assistant message %s started at %s", current_assistant_message_index, per_message_metadata[-1]["start_time"])
 
                 # Track first token time per assistant message
                 # This captures when the first content delta arrives for each message
                 # We check for text content specifically to measure time to first TEXT token
-                if event.get("type") == "content_block_delta":
+                if event_type == "content_block_delta":
                     event_data = event.get("data", {})
                     # Only track first token for text deltas (not tool use deltas)
                     # This gives accurate TTFT for actual text generation
@@ -117,20 +122,22 @@ class StreamCoordinator:
                             if per_message_metadata[current_assistant_message_index]["first_token_time"] is None:
                                 per_message_metadata[current_assistant_message_index]["first_token_time"] = time.time()
                                 logger.info(
-                                    f"📝 First TEXT token for assistant message {current_assistant_message_index} at {per_message_metadata[current_assistant_message_index]['first_token_time']:.3f}"
+                                    "📝 First TEXT token for assistant message %s at %.3f",
+                                    current_assistant_message_index,
+                                    per_message_metadata[current_assistant_message_index]["first_token_time"],
                                 )
                                 # Also update global first_token_time for the first message (backward compatibility)
                                 if current_assistant_message_index == 0 and first_token_time is None:
                                     first_token_time = per_message_metadata[0]["first_token_time"]
 
                 # Track when assistant messages end
-                if event.get("type") == "message_stop":
+                if event_type == "message_stop":
                     if current_assistant_message_index >= 0 and current_assistant_message_index < len(per_message_metadata):
                         per_message_metadata[current_assistant_message_index]["end_time"] = time.time()
-                        logger.debug(f"📝 Assistant message {current_assistant_message_index} ended")
+                        logger.debug("📝 Assistant message %s ended", current_assistant_message_index)
 
                 # Track individual metadata events (per assistant message)
-                if event.get("type") == "metadata":
+                if event_type == "metadata":
                     event_data = event.get("data", {})
                     if current_assistant_message_index >= 0 and current_assistant_message_index < len(per_message_metadata):
                         msg_meta = per_message_metadata[current_assistant_message_index]
@@ -154,11 +161,14 @@ class StreamCoordinator:
                                     # Estimate TTFT as ~30% of total latency (typical for LLM calls)
                                     msg_meta["metrics"]["timeToFirstByteMs"] = int(provider_latency * 0.3)
                                     logger.info(
-                                        f"📊 Estimated TTFT for message {current_assistant_message_index}: {msg_meta['metrics']['timeToFirstByteMs']}ms (30% of {provider_latency}ms)"
+                                        "📊 Estimated TTFT for message %s: %sms (30%% of %sms)",
+                                        current_assistant_message_index,
+                                        msg_meta["metrics"]["timeToFirstByteMs"],
+                                        provider_latency,
                                     )
                                 elif calculated_ttft >= 10:
                                     msg_meta["metrics"]["timeToFirstByteMs"] = calculated_ttft
-                                    logger.info(f"📊 Calculated TTFT for message {current_assistant_message_index}: {calculated_ttft}ms")
+                                    logger.info("📊 Calculated TTFT for message %s: %sms", current_assistant_message_index, calculated_ttft)
 
                         # ENRICH the metadata event sent to client with our calculated TTFT
                         # This ensures the client sees accurate per-message TTFT during streaming
@@ -168,9 +178,9 @@ class StreamCoordinator:
                             event_data["metrics"]["timeToFirstByteMs"] = msg_meta["metrics"]["timeToFirstByteMs"]
                             # Update the event with enriched data for client streaming
                             event = {"type": "metadata", "data": event_data}
-                            logger.info(f"📊 Enriched metadata event for client with TTFT: {msg_meta['metrics']['timeToFirstByteMs']}ms")
+                            logger.info("📊 Enriched metadata event for client with TTFT: %sms", msg_meta["metrics"]["timeToFirstByteMs"])
 
-                        logger.debug(f"📊 Metadata for message {current_assistant_message_index}: {msg_meta['metrics']}")
+                        logger.debug("📊 Metadata for message %s: %s", current_assistant_message_index, msg_meta["metrics"])
                     # Also accumulate for backward compatibility
                     if "usage" in event_data:
                         accumulated_metadata["usage"].update(event_data["usage"])
@@ -178,7 +188,7 @@ class StreamCoordinator:
                         accumulated_metadata["metrics"].update(event_data["metrics"])
 
                 # Collect metadata_summary event (don't send to client as-is)
-                if event.get("type") == "metadata_summary":
+                if event_type == "metadata_summary":
                     event_data = event.get("data", {})
                     if "usage" in event_data:
                         accumulated_metadata["usage"].update(event_data["usage"])
@@ -193,7 +203,7 @@ class StreamCoordinator:
                     continue
 
                 # Check if this is the "done" event - send final metadata before it
-                if event.get("type") == "done":
+                if event_type == "done":
                     # Calculate end-to-end latency
                     stream_end_time = time.time()
 
@@ -244,7 +254,7 @@ class StreamCoordinator:
 
                 # Intercept legacy "error" events from stream_processor and convert to conversational format
                 # This ensures errors appear as assistant messages in the chat UI
-                if event.get("type") == "error":
+                if event_type == "error":
                     error_data = event.get("data", {})
                     error_message = error_data.get("error", "An error occurred")
                     error_detail = error_data.get("detail", "")
@@ -265,13 +275,8 @@ class StreamCoordinator:
                     )
 
                     # Emit message events so error appears in chat
-                    yield f'event: message_start\ndata: {{"role": "assistant"}}\n\n'
-                    yield f'event: content_block_start\ndata: {{"contentBlockIndex": 0, "type": "text"}}\n\n'
-                    yield f"event: content_block_delta\ndata: {json.dumps({'contentBlockIndex': 0, 'type': 'text', 'text': conv_error_event.message})}\n\n"
-                    yield f'event: content_block_stop\ndata: {{"contentBlockIndex": 0}}\n\n'
-                    yield f'event: message_stop\ndata: {{"stopReason": "error"}}\n\n'
-                    yield conv_error_event.to_sse_format()
-                    yield "event: done\ndata: {}\n\n"
+                    for frame in self._conversational_error_frames(conv_error_event):
+                        yield frame
 
                     # Persist error messages to session
                     try:
@@ -314,7 +319,7 @@ class StreamCoordinator:
             # Flush buffered messages (turn-based session manager)
             # Note: In cloud mode with AgentCoreMemorySessionManager, the base manager's hooks
             # persist messages directly, so flush() typically returns None. This is expected.
-            message_id = self._flush_session(session_manager)
+            message_id = await self._flush_session(session_manager)
 
             logger.info(f"💾 Flush returned message_id: {message_id}")
 
@@ -470,19 +475,14 @@ class StreamCoordinator:
             logger.error(f"Traceback: {traceback.format_exc()}")
 
             # Emergency flush: save buffered messages before losing them
-            self._emergency_flush(session_manager)
+            await self._emergency_flush(session_manager)
 
             # Stream error as conversational assistant message for better UX
             error_event = build_conversational_error_event(code=ErrorCode.STREAM_ERROR, error=e, session_id=session_id, recoverable=True)
 
             # Emit message events so error appears in chat
-            yield f'event: message_start\ndata: {{"role": "assistant"}}\n\n'
-            yield f'event: content_block_start\ndata: {{"contentBlockIndex": 0, "type": "text"}}\n\n'
-            yield f"event: content_block_delta\ndata: {json.dumps({'contentBlockIndex': 0, 'type': 'text', 'text': error_event.message})}\n\n"
-            yield f'event: content_block_stop\ndata: {{"contentBlockIndex": 0}}\n\n'
-            yield f'event: message_stop\ndata: {{"stopReason": "error"}}\n\n'
-            yield error_event.to_sse_format()
-            yield "event: done\ndata: {}\n\n"
+            for frame in self._conversational_error_frames(error_event):
+                yield frame
 
             # Persist error messages to session
             try:
@@ -512,26 +512,45 @@ class StreamCoordinator:
             except Exception as persist_error:
                 logger.error(f"Failed to persist stream error to session: {persist_error}")
 
-    def _format_sse_event(self, event: Dict[str, Any]) -> str:
+    def _conversational_error_frames(self, error_event: ConversationalErrorEvent) -> List[bytes]:
+        """
+        SSE frames that show an error as an assistant message, then end the stream
+
+        Encoded like _format_sse_event output so the stream yields a single type.
+        """
+        frames = [
+            'event: message_start\ndata: {"role": "assistant"}\n\n',
+            'event: content_block_start\ndata: {"contentBlockIndex": 0, "type": "text"}\n\n',
+            f"event: content_block_delta\ndata: {json.dumps({'contentBlockIndex': 0, 'type': 'text', 'text': error_event.message})}\n\n",
+            'event: content_block_stop\ndata: {"contentBlockIndex": 0}\n\n',
+            'event: message_stop\ndata: {"stopReason": "error"}\n\n',
+            error_event.to_sse_format(),
+            "event: done\ndata: {}\n\n",
+        ]
+        return [frame.encode() for frame in frames]
+
+    def _format_sse_event(self, event: Dict[str, Any]) -> bytes:
         """
         Format processed event as SSE (Server-Sent Event)
 
+        Returns bytes so StreamingResponse can send the frame without re-encoding it.
+
         Args:
             event: Processed event from stream_processor {"type": str, "data": dict}
 
         Returns:
-            str: SSE formatted event string with event type and data
+            bytes: UTF-8 SSE formatted event with event type and data
         """
         try:
             event_type = event.get("type", "message")
             event_data = event.get("data", {})
 
-            # Format as SSE with explicit event type
-            return f"event: {event_type}\ndata: {json.dumps(event_data)}\n\n"
+            # Format as SSE with explicit event type (orjson: compact, C-level encoding)
+            return b"event: " + event_type.encode() + b"\ndata: " + orjson.dumps(event_data, option=orjson.OPT_NON_STR_KEYS) + b"\n\n"
         except (TypeError, ValueError) as e:
             # Fallback for non-serializable objects (should never happen with new processor)
             logger.error(f"Failed to serialize event: {e}")
-            return f"event: error\ndata: {json.dumps({'error': f'Serialization error: {str(e)}'})}\n\n"
+            return f"event: error\ndata: {json.dumps({'error': f'Serialization error: {str(e)}'})}\n\n".encode()
 
     def _log_cache_metrics(self, usage: Dict[str, Any], session_id: str) -> None:
         """
@@ -590,7 +609,7 @@ class StreamCoordinator:
                     f"(usage keys: {list(usage.keys())})"
                 )
 
-    def _flush_session(self, session_manager: Any) -> Optional[int]:
+    async def _flush_session(self, session_manager: Any) -> Optional[int]:
         """
         Flush session manager if it supports buffering
 
@@ -600,6 +619,9 @@ class StreamCoordinator:
         Returns:
             Message ID of the flushed message, or None if unavailable
         """
+        # Prefer the off-loop variant so disk writes don't stall streaming
+        if hasattr(type(session_manager), "flush_async"):
+            return await session_manager.flush_async()
         if hasattr(session_manager, "flush"):
             message_id = session_manager.flush()
             return message_id
@@ -614,8 +636,9 @@ class StreamCoordinator:
         the indices of new messages without querying the database after streaming.
 
         The count is obtained from:
-        1. TurnBasedSessionManager.message_count (initialized from AgentCore Memory at session start)
-        2. LocalSessionBuffer or FileSessionManager (via list_messages)
+        1. session_manager.message_count - TurnBasedSessionManager (initialized from AgentCore
+           Memory at session start) or LocalSessionBuffer (in-memory message counter)
+        2. FileSessionManager (via list_messages)
         3. Fallback to 0 if no count is available
 
         Args:
@@ -733,18 +756,17 @@ class StreamCoordinator:
 
         return None
 
-    def _emergency_flush(self, session_manager: Any) -> None:
+    async def _emergency_flush(self, session_manager: Any) -> None:
         """
         Emergency flush on error to prevent data loss
 
         Args:
             session_manager: Session manager instance
         """
-        if hasattr(session_manager, "flush"):
-            try:
-                session_manager.flush()
-            except Exception as flush_error:
-                logger.error(f"Failed to emergency flush: {flush_error}")
+        try:
+            await self._flush_session(session_manager)
+        except Exception as flush_error:
+            logger.error(f"Failed to emergency flush: {flush_error}")
 
     def _create_error_event(self, error_message: str) -> str:
         """
@@ -858,6 +858,88 @@ def _handle_citation_events(event: RawEvent) -> List[ProcessedEvent]:
     return events
 
 
+def _extract_usage_data(usage_obj: Any) -> Dict[str, Any]:
+    """Extract and normalize usage data from various formats.
+
+    Extracts:
+    - inputTokens/input_tokens: Number of input tokens
+    - outputTokens/output_tokens: Number of output tokens
+    - totalTokens/total_tokens: Total number of tokens
+    - cacheReadInputTokens/cache_read_input_tokens: Tokens read from cache (optional)
+    - cacheWriteInputTokens/cache_write_input_tokens: Tokens written to cache (optional)
+
+    Handles both camelCase (Bedrock API) and snake_case (Python SDK) formats.
+    """
+    if not usage_obj:
+        return {}
+
+    # Handle dict format
+    if isinstance(usage_obj, dict):
+        usage_data = {
+            "inputTokens": usage_obj.get("inputTokens") or usage_obj.get("input_tokens", 0),
+            "outputTokens": usage_obj.get("outputTokens") or usage_obj.get("output_tokens", 0),
+            "totalTokens": usage_obj.get("totalTokens") or usage_obj.get("total_tokens", 0),
+        }
+
+        # Add cache token fields if present
+        # Handle both camelCase and snake_case variants
+        # Use 'is not None' check to distinguish between absent field and 0 value
+        cache_read = usage_obj.get("cacheReadInputTokens")
+        if cache_read is None:
+            cache_read = usage_obj.get("cache_read_input_tokens")
+
+        cache_write = usage_obj.get("cacheWriteInputTokens")
+        if cache_write is None:
+            cache_write = usage_obj.get("cache_write_input_tokens")
+
+        # Include cache fields if they exist (even if 0)
+        if cache_read is not None:
+            usage_data["cacheReadInputTokens"] = cache_read
+        if cache_write is not None:
+            usage_data["cacheWriteInputTokens"] = cache_write
+
+        return usage_data
+
+    return {}
+
+
+def _extract_metrics_data(metrics_obj: Any) -> Dict[str, Any]:
+    """Extract and normalize metrics data from various formats."""
+    if not metrics_obj:
+        return {}
+
+    # Handle dict format
+    if isinstance(metrics_obj, dict):
+        metrics_data = {
+            "latencyMs": metrics_obj.get("latencyMs") or metrics_obj.get("latency_ms", 0),
+        }
+
+        # Add timeToFirstByteMs if available
+        ttfb = metrics_obj.get("timeToFirstByteMs") or metrics_obj.get("time_to_first_byte_ms")
+        if ttfb is not None:
+            metrics_data["timeToFirstByteMs"] = ttfb
+
+        return metrics_data
+
+    return {}
+
+
+def _extract_result_metrics(result: Any) -> Dict[str, Any]:
+    """Return AgentResult.metrics as a dict (result may be serialized or an object)."""
+    if isinstance(result, dict):
+        return result.get("metrics", {})
+    try:
+        metrics = result.metrics
+    except AttributeError:
+        return {}
+    if not metrics:
+        return {}
+    to_dict = getattr(metrics, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    return getattr(metrics, "__dict__", {})
+
+
 def _handle_metadata_events(event: RawEvent) -> List[ProcessedEvent]:
     """Extract usage metrics and latency information from metadata events.
 
@@ -895,70 +977,6 @@ def _handle_metadata_events(event: RawEvent) -> List[ProcessedEvent]:
     """
     events = []
 
-    def _extract_usage_data(usage_obj: Any) -> Dict[str, Any]:
-        """Extract and normalize usage data from various formats.
-
-        Extracts:
-        - inputTokens/input_tokens: Number of input tokens
-        - outputTokens/output_tokens: Number of output tokens
-        - totalTokens/total_tokens: Total number of tokens
-        - cacheReadInputTokens/cache_read_input_tokens: Tokens read from cache (optional)
-        - cacheWriteInputTokens/cache_write_input_tokens: Tokens written to cache (optional)
-
-        Handles both camelCase (Bedrock API) and snake_case (Python SDK) formats.
-        """
-        if not usage_obj:
-            return {}
-        
-        # Handle dict format
-        if isinstance(usage_obj, dict):
-            usage_data = {
-                "inputTokens": usage_obj.get("inputTokens") or usage_obj.get("input_tokens", 0),
-                "outputTokens": usage_obj.get("outputTokens") or usage_obj.get("output_tokens", 0),
-                "totalTokens": usage_obj.get("totalTokens") or usage_obj.get("total_tokens", 0),
-            }
-            
-            # Add cache token fields if present
-            # Handle both camelCase and snake_case variants
-            # Use 'is not None' check to distinguish between absent field and 0 value
-            cache_read = usage_obj.get("cacheReadInputTokens")
-            if cache_read is None:
-                cache_read = usage_obj.get("cache_read_input_tokens")
-
-            cache_write = usage_obj.get("cacheWriteInputTokens")
-            if cache_write is None:
-                cache_write = usage_obj.get("cache_write_input_tokens")
-
-            # Include cache fields if they exist (even if 0)
-            if cache_read is not None:
-                usage_data["cacheReadInputTokens"] = cache_read
-            if cache_write is not None:
-                usage_data["cacheWriteInputTokens"] = cache_write
-            
-            return usage_data
-        
-        return {}
-
-    def _extract_metrics_data(metrics_obj: Any) -> Dict[str, Any]:
-        """Extract and normalize metrics data from various formats."""
-        if not metrics_obj:
-            return {}
-        
-        # Handle dict format
-        if isinstance(metrics_obj, dict):
-            metrics_data = {
-                "latencyMs": metrics_obj.get("latencyMs") or metrics_obj.get("latency_ms", 0),
-            }
-            
-            # Add timeToFirstByteMs if available
-            ttfb = metrics_obj.get("timeToFirstByteMs") or metrics_obj.get("time_to_first_byte_ms")
-            if ttfb is not None:
-                metrics_data["timeToFirstByteMs"] = ttfb
-            
-            return metrics_data
-        
-        return {}
-
     # Check for combined metadata object first (top-level)
     if "metadata" in event:
         metadata = event["metadata"]
@@ -996,22 +1014,7 @@ def _handle_metadata_events(event: RawEvent) -> List[ProcessedEvent]:
     # Check for metadata in result object (AgentResult.metrics)
     # This is where Strands Python SDK stores metrics
     if "result" in event:
-        result = event["result"]
-        
-        # Handle both dict (serialized) and object (AgentResult) formats
-        if isinstance(result, dict):
-            result_metrics = result.get("metrics", {})
-        else:
-            # If result is an object, try to get metrics attribute
-            result_metrics = getattr(result, "metrics", None)
-            if result_metrics:
-                # Convert to dict if it has to_dict or similar
-                if hasattr(result_metrics, "to_dict"):
-                    result_metrics = result_metrics.to_dict()
-                elif hasattr(result_metrics, "__dict__"):
-                    result_metrics = result_metrics.__dict__
-                else:
-                    result_metrics = {}
+        result_metrics = _extract_result_metrics(event["result"])
 
         if result_metrics:
             metadata_data = {}
@@ -1321,7 +1324,7 @@ async def process_agent_stream(
                         # Tool use deltas indicate the model is generating tool calls
                         if event_data.get("type") in ("text", "tool_use"):
                             first_token_time = time.time()
-                            logger.debug(f"First token detected (content_block_delta, type={event_data.get('type')})")
+                            logger.debug("First token detected (content_block_delta, type=%s)", event_data.get("type"))
                 yield processed_event
 
             # STEP 5: Process tool events (ENHANCED with display_content)
@@ -2,11 +2,18 @@
 Tool registry for discovering and managing available tools
 """
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, NamedTuple
 
 logger = logging.getLogger(__name__)
 
 
+class _LazyToolRef(NamedTuple):
+    """Module attribute to resolve the first time a tool is requested"""
+
+    module: Any
+    name: str
+
+
 class ToolRegistry:
     """Registry for managing available tools"""
 
@@ -29,6 +36,8 @@ class ToolRegistry:
         """
         Register all tools from a module's __all__ export
 
+        Tool objects are looked up on the module when first requested via get_tool.
+
         Args:
             module: Python module with __all__ export containing tool names
         """
@@ -36,9 +45,11 @@ class ToolRegistry:
             logger.warning(f"Module {module.__name__} has no __all__ export")
             return
 
+        # Resolved in get_tool, so packages with lazy (PEP 562) exports only
+        # import the modules of tools that are actually enabled
         for tool_name in module.__all__:
-            tool_obj = getattr(module, tool_name)
-            self.register_tool(tool_name, tool_obj)
+            self._tools[tool_name] = _LazyToolRef(module, tool_name)
+        logger.info(f"Registered {len(module.__all__)} tools from {module.__name__}")
 
     def get_tool(self, tool_id: str) -> Any:
         """
@@ -50,7 +61,11 @@ class ToolRegistry:
         Returns:
             Tool object or None if not found
         """
-        return self._tools.get(tool_id)
+        tool_obj = self._tools.get(tool_id)
+        if isinstance(tool_obj, _LazyToolRef):
+            tool_obj = getattr(tool_obj.module, tool_obj.name)
+            self._tools[tool_id] = tool_obj
+        return tool_obj
 
     def has_tool(self, tool_id: str) -> bool:
         """
@@ -1,10 +1,13 @@
 """Utility modules for strands agent"""
 from .timezone import get_current_date_pacific, TIMEZONE_AVAILABLE
 from .global_state import get_global_stream_processor, set_global_stream_processor
+from agents.request_context import current_session_id, current_user_id
 
 __all__ = [
     "get_current_date_pacific",
     "TIMEZONE_AVAILABLE",
     "get_global_stream_processor",
     "set_global_stream_processor",
+    "current_session_id",
+    "current_user_id",
 ]
@@ -0,0 +1,16 @@
+"""
+Per-request identifiers for code that runs inside an agent stream
+
+Set by StreamCoordinator at the start of each stream. ContextVars follow the
+request through asyncio tasks and asyncio.to_thread (which Strands uses for
+sync tools), so concurrent requests never see each other's values - unlike
+the process-global os.environ these replace.
+
+Kept outside the main_agent package so tool modules can import it without
+pulling in MainAgent and the session stack.
+"""
+from contextvars import ContextVar
+from typing import Optional
+
+current_session_id: ContextVar[Optional[str]] = ContextVar("current_session_id", default=None)
+current_user_id: ContextVar[Optional[str]] = ContextVar("current_user_id", default=None)
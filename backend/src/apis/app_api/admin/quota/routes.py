@@ -7,6 +7,7 @@ from apis.shared.auth import User, require_admin
 from apis.app_api.costs.aggregator import CostAggregator
 from agents.main_agent.quota.repository import QuotaRepository
 from agents.main_agent.quota.resolver import QuotaResolver
+from apis.shared import quota as shared_quota
 from agents.main_agent.quota.models import QuotaTier, QuotaAssignment, QuotaOverride, QuotaEvent
 from .service import QuotaAdminService
 from .models import (
@@ -27,15 +28,18 @@ router = APIRouter(prefix="/quota", tags=["admin-quota"])
 # ========== Dependencies ==========
 
 def get_quota_repository() -> QuotaRepository:
-    """Get quota repository instance"""
-    return QuotaRepository()
+    """Get shared quota repository instance"""
+    return shared_quota.get_quota_repository()
 
 
-def get_quota_resolver(
-    repo: QuotaRepository = Depends(get_quota_repository)
-) -> QuotaResolver:
-    """Get quota resolver instance"""
-    return QuotaResolver(repository=repo)
+def get_quota_resolver() -> QuotaResolver:
+    """
+    Get the process-wide quota resolver
+
+    Shared so its cache survives across requests and admin invalidations
+    reach the same cache that quota enforcement reads.
+    """
+    return shared_quota.get_quota_resolver()
 
 
 def get_cost_aggregator() -> CostAggregator:
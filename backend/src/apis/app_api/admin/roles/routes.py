@@ -1,9 +1,11 @@
 """Admin API routes for AppRole management."""
 
 import logging
-from typing import Optional
+from typing import AsyncIterator, List, Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 
 from apis.shared.auth import User, require_admin
 from apis.shared.rbac import (
@@ -12,6 +14,7 @@ from apis.shared.rbac import (
     AppRoleCache,
 )
 from apis.shared.rbac.models import (
+    AppRole,
     AppRoleCreate,
     AppRoleUpdate,
     AppRoleResponse,
@@ -28,33 +31,109 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/roles", tags=["admin-roles"])
 
 
+# The factories are sync because service constructors call them too; these
+# async wrappers keep FastAPI from dispatching them to the threadpool.
+async def get_admin_service_dependency() -> AppRoleAdminService:
+    """Depends() wrapper returning the AppRoleAdminService singleton."""
+    return get_app_role_admin_service()
+
+
+async def get_role_cache_dependency() -> AppRoleCache:
+    """Depends() wrapper returning the AppRoleCache singleton."""
+    return get_app_role_cache()
+
+
 @router.get("/", response_model=AppRoleListResponse)
 async def list_roles(
     enabled_only: bool = Query(
         False, description="Only return enabled roles"
     ),
+    limit: Optional[int] = Query(
+        None, ge=1, le=500, description="Page size (omit to return all roles)"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="nextCursor from the previous page"
+    ),
     admin: User = Depends(require_admin),
+    service: AppRoleAdminService = Depends(get_admin_service_dependency),
 ):
     """
-    List all application roles.
+    List application roles, optionally one page at a time.
 
     Requires admin access (Admin, SuperAdmin, or DotNetDevelopers role).
 
     Args:
         enabled_only: If True, only return enabled roles
+        limit: Maximum number of roles to return
+        cursor: Resume after this cursor (from a previous response's nextCursor)
+        admin: Authenticated admin user (injected)
+        service: AppRole admin service (injected)
+
+    Returns:
+        AppRoleListResponse with the requested roles, the total number of
+        matching roles, and nextCursor when more roles remain
+
+    Raises:
+        HTTPException: 400 if the cursor no longer matches a role
+    """
+    logger.info("Admin %s listing roles", admin.email)
+
+    try:
+        roles, total, next_cursor = await service.list_roles_page(
+            enabled_only=enabled_only, limit=limit, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    items = [AppRoleResponse.from_app_role(r) for r in roles]
+    return AppRoleListResponse.model_construct(
+        roles=items, total=total, next_cursor=next_cursor
+    )
+
+
+async def _stream_roles_ndjson(roles: List[AppRole]) -> AsyncIterator[bytes]:
+    """Yield one JSON-encoded role per line."""
+    for role in roles:
+        yield orjson.dumps(
+            AppRoleResponse.from_app_role(role).model_dump(by_alias=True)
+        ) + b"\n"
+
+
+@router.get("/export")
+async def export_roles(
+    enabled_only: bool = Query(
+        False, description="Only export enabled roles"
+    ),
+    admin: User = Depends(require_admin),
+    service: AppRoleAdminService = Depends(get_admin_service_dependency),
+):
+    """
+    Export all roles as newline-delimited JSON.
+
+    Roles are loaded (and sorted) in full before streaming starts; streaming
+    only spreads out serialization, it doesn't bound memory.
+
+    Requires admin access.
+
+    Args:
+        enabled_only: If True, only export enabled roles
         admin: Authenticated admin user (injected)
+        service: AppRole admin service (injected)
 
     Returns:
-        AppRoleListResponse with list of all roles
+        StreamingResponse with one role object per line
     """
-    logger.info(f"Admin {admin.email} listing roles")
+    logger.info("Admin %s exporting roles", admin.email)
 
-    service = get_app_role_admin_service()
     roles = await service.list_roles(enabled_only=enabled_only)
 
-    return AppRoleListResponse(
-        roles=[AppRoleResponse.from_app_role(r) for r in roles],
-        total=len(roles),
+    return StreamingResponse(
+        _stream_roles_ndjson(roles),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": "attachment; filename=app_roles.ndjson"},
     )
 
 
@@ -62,6 +141,7 @@ async def list_roles(
 async def get_role(
     role_id: str,
     admin: User = Depends(require_admin),
+    service: AppRoleAdminService = Depends(get_admin_service_dependency),
 ):
     """
     Get a role by ID.
@@ -71,6 +151,7 @@ async def get_role(
     Args:
         role_id: Role identifier
         admin: Authenticated admin user (injected)
+        service: AppRole admin service (injected)
 
     Returns:
         AppRoleResponse with role details
@@ -78,9 +159,8 @@ async def get_role(
     Raises:
         HTTPException: 404 if role not found
     """
-    logger.info(f"Admin {admin.email} getting role: {role_id}")
+    logger.info("Admin %s getting role: %s", admin.email, role_id)
 
-    service = get_app_role_admin_service()
     role = await service.get_role(role_id)
 
     if not role:
@@ -96,6 +176,7 @@ async def get_role(
 async def create_role(
     role_data: AppRoleCreate,
     admin: User = Depends(require_system_admin),
+    service: AppRoleAdminService = Depends(get_admin_service_dependency),
 ):
     """
     Create a new application role.
@@ -105,6 +186,7 @@ async def create_role(
     Args:
         role_data: Role creation data
         admin: Authenticated system admin user (injected)
+        service: AppRole admin service (injected)
 
     Returns:
         Created AppRoleResponse
@@ -112,15 +194,14 @@ async def create_role(
     Raises:
         HTTPException: 400 if role already exists or validation fails
     """
-    logger.info(f"Admin {admin.email} creating role: {role_data.role_id}")
+    logger.info("Admin %s creating role: %s", admin.email, role_data.role_id)
 
     try:
-        service = get_app_role_admin_service()
         role = await service.create_role(role_data, admin)
         return AppRoleResponse.from_app_role(role)
 
     except ValueError as e:
-        logger.warning(f"Role creation failed: {e}")
+        logger.warning("Role creation failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
@@ -132,6 +213,7 @@ async def update_role(
     role_id: str,
     updates: AppRoleUpdate,
     admin: User = Depends(require_system_admin),
+    service: AppRoleAdminService = Depends(get_admin_service_dependency),
 ):
     """
     Update an application role.
@@ -143,6 +225,7 @@ async def update_role(
         role_id: Role identifier
         updates: Fields to update
         admin: Authenticated system admin user (injected)
+        service: AppRole admin service (injected)
 
     Returns:
         Updated AppRoleResponse
@@ -152,10 +235,9 @@ async def update_role(
             - 400 if validation fails
             - 404 if role not found
     """
-    logger.info(f"Admin {admin.email} updating role: {role_id}")
+    logger.info("Admin %s updating role: %s", admin.email, role_id)
 
     try:
-        service = get_app_role_admin_service()
         role = await service.update_role(role_id, updates, admin)
 
         if not role:
@@ -167,7 +249,7 @@ async def update_role(
         return AppRoleResponse.from_app_role(role)
 
     except ValueError as e:
-        logger.warning(f"Role update failed: {e}")
+        logger.warning("Role update failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
@@ -178,6 +260,7 @@ async def update_role(
 async def delete_role(
     role_id: str,
     admin: User = Depends(require_system_admin),
+    service: AppRoleAdminService = Depends(get_admin_service_dependency),
 ):
     """
     Delete an application role.
@@ -188,16 +271,16 @@ async def delete_role(
     Args:
         role_id: Role identifier
         admin: Authenticated system admin user (injected)
+        service: AppRole admin service (injected)
 
     Raises:
         HTTPException:
             - 400 if trying to delete a system role
             - 404 if role not found
     """
-    logger.info(f"Admin {admin.email} deleting role: {role_id}")
+    logger.info("Admin %s deleting role: %s", admin.email, role_id)
 
     try:
-        service = get_app_role_admin_service()
         success = await service.delete_role(role_id, admin)
 
         if not success:
@@ -207,7 +290,7 @@ async def delete_role(
             )
 
     except ValueError as e:
-        logger.warning(f"Role deletion failed: {e}")
+        logger.warning("Role deletion failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
@@ -218,6 +301,7 @@ async def delete_role(
 async def sync_role_permissions(
     role_id: str,
     admin: User = Depends(require_system_admin),
+    service: AppRoleAdminService = Depends(get_admin_service_dependency),
 ):
     """
     Force recomputation of effective permissions for a role.
@@ -229,6 +313,7 @@ async def sync_role_permissions(
     Args:
         role_id: Role identifier
         admin: Authenticated system admin user (injected)
+        service: AppRole admin service (injected)
 
     Returns:
         Updated AppRoleResponse
@@ -236,9 +321,8 @@ async def sync_role_permissions(
     Raises:
         HTTPException: 404 if role not found
     """
-    logger.info(f"Admin {admin.email} syncing permissions for role: {role_id}")
+    logger.info("Admin %s syncing permissions for role: %s", admin.email, role_id)
 
-    service = get_app_role_admin_service()
     role = await service.sync_effective_permissions(role_id, admin)
 
     if not role:
@@ -253,6 +337,8 @@ async def sync_role_permissions(
 @router.get("/cache/stats", response_model=CacheStatsResponse)
 async def get_cache_stats(
     admin: User = Depends(require_system_admin),
+    cache: AppRoleCache = Depends(get_role_cache_dependency),
+    service: AppRoleAdminService = Depends(get_admin_service_dependency),
 ):
     """
     Get cache statistics.
@@ -261,14 +347,15 @@ async def get_cache_stats(
 
     Args:
         admin: Authenticated system admin user (injected)
+        cache: AppRole cache (injected)
+        service: AppRole admin service (injected)
 
     Returns:
-        CacheStatsResponse with cache statistics
+        CacheStatsResponse with runtime and admin role cache statistics
     """
-    logger.info(f"Admin {admin.email} getting cache stats")
+    logger.info("Admin %s getting cache stats", admin.email)
 
-    cache = get_app_role_cache()
-    stats = cache.get_stats()
+    stats = {**cache.get_stats(), **service.get_role_cache_stats()}
 
     return CacheStatsResponse(**stats)
 
@@ -276,6 +363,8 @@ async def get_cache_stats(
 @router.post("/cache/invalidate", status_code=status.HTTP_204_NO_CONTENT)
 async def invalidate_cache(
     admin: User = Depends(require_system_admin),
+    cache: AppRoleCache = Depends(get_role_cache_dependency),
+    service: AppRoleAdminService = Depends(get_admin_service_dependency),
 ):
     """
     Force invalidation of all role caches.
@@ -284,8 +373,10 @@ async def invalidate_cache(
 
     Args:
         admin: Authenticated system admin user (injected)
+        cache: AppRole cache (injected)
+        service: AppRole admin service (injected)
     """
-    logger.info(f"Admin {admin.email} invalidating all caches")
+    logger.info("Admin %s invalidating all caches", admin.email)
 
-    cache = get_app_role_cache()
+    service.clear_role_cache()
     await cache.invalidate_all()
@@ -19,11 +19,18 @@ from decimal import Decimal
 
 import boto3
 from botocore.exceptions import ClientError
+from cachetools import TTLCache
 
 from apis.app_api.admin.models import ManagedModel, ManagedModelCreate, ManagedModelUpdate
 
 logger = logging.getLogger(__name__)
 
+# model_id -> ManagedModel index for per-request lookups (e.g. pricing snapshots).
+# Rebuilt from one full listing at most once per TTL; writes through this module
+# clear it immediately, the TTL bounds staleness from writes on other instances.
+MODEL_INDEX_TTL_SECONDS = 60
+_model_index_cache: TTLCache = TTLCache(maxsize=1, ttl=MODEL_INDEX_TTL_SECONDS)
+
 
 def _resolve_supports_caching(supports_caching: Optional[bool], provider: str) -> bool:
     """
@@ -124,9 +131,12 @@ async def create_managed_model(model_data: ManagedModelCreate) -> ManagedModel:
     managed_models_table = os.environ.get('DYNAMODB_MANAGED_MODELS_TABLE_NAME')
 
     if managed_models_table:
-        return await _create_managed_model_cloud(model_data, managed_models_table)
+        result = await _create_managed_model_cloud(model_data, managed_models_table)
     else:
-        return await _create_managed_model_local(model_data)
+        result = await _create_managed_model_local(model_data)
+
+    invalidate_model_index()
+    return result
 
 
 async def _create_managed_model_local(model_data: ManagedModelCreate) -> ManagedModel:
@@ -446,6 +456,36 @@ async def list_all_managed_models() -> List[ManagedModel]:
         return await _list_managed_models_local()
 
 
+async def get_managed_model_by_model_id(model_id: str) -> Optional[ManagedModel]:
+    """
+    Look up a managed model by its provider model_id (e.g. "us.anthropic.claude-...")
+
+    Served from an in-memory index so per-request callers don't list every
+    model (a full table scan in cloud mode) on each lookup.
+
+    Args:
+        model_id: Provider model identifier (not the managed model's internal id)
+
+    Returns:
+        ManagedModel if found, None otherwise
+    """
+    try:
+        index = _model_index_cache["index"]
+    except KeyError:
+        index = {}
+        # Listing is newest first; keep the newest model for a duplicated model_id
+        for model in await list_all_managed_models():
+            index.setdefault(model.model_id, model)
+        _model_index_cache["index"] = index
+
+    return index.get(model_id)
+
+
+def invalidate_model_index() -> None:
+    """Drop the model_id index so the next lookup re-reads managed models."""
+    _model_index_cache.clear()
+
+
 async def _list_managed_models_local() -> List[ManagedModel]:
     """
     List all managed models from local file storage
@@ -564,9 +604,12 @@ async def update_managed_model(model_id: str, updates: ManagedModelUpdate) -> Op
     managed_models_table = os.environ.get('DYNAMODB_MANAGED_MODELS_TABLE_NAME')
 
     if managed_models_table:
-        return await _update_managed_model_cloud(model_id, updates, managed_models_table)
+        result = await _update_managed_model_cloud(model_id, updates, managed_models_table)
     else:
-        return await _update_managed_model_local(model_id, updates)
+        result = await _update_managed_model_local(model_id, updates)
+
+    invalidate_model_index()
+    return result
 
 
 async def _update_managed_model_local(model_id: str, updates: ManagedModelUpdate) -> Optional[ManagedModel]:
@@ -763,9 +806,12 @@ async def delete_managed_model(model_id: str) -> bool:
     managed_models_table = os.environ.get('DYNAMODB_MANAGED_MODELS_TABLE_NAME')
 
     if managed_models_table:
-        return await _delete_managed_model_cloud(model_id, managed_models_table)
+        result = await _delete_managed_model_cloud(model_id, managed_models_table)
     else:
-        return await _delete_managed_model_local(model_id)
+        result = await _delete_managed_model_local(model_id)
+
+    invalidate_model_index()
+    return result
 
 
 async def _delete_managed_model_local(model_id: str) -> bool:
@@ -2,9 +2,9 @@
 
 import base64
 import hashlib
+import json
 import logging
 import os
-import secrets
 from typing import Any, Dict, Optional, Tuple
 from urllib.parse import urlencode
 
@@ -16,23 +16,49 @@ from apis.shared.auth.state_store import OIDCStateData, StateStore, create_state
 logger = logging.getLogger(__name__)
 
 
-def generate_pkce_pair() -> Tuple[str, str]:
+def _b64url(raw: bytes) -> str:
+    """Unpadded base64url encoding, as used by PKCE and token_urlsafe."""
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode('ascii')
+
+
+def generate_pkce_pair(verifier_bytes: Optional[bytes] = None) -> Tuple[str, str]:
     """
     Generate PKCE code verifier and challenge (S256).
 
+    Args:
+        verifier_bytes: Optional 32 random bytes to derive the verifier from;
+            drawn from os.urandom when omitted
+
     Returns:
         Tuple of (code_verifier, code_challenge)
     """
-    # Generate 32 bytes of random data for code_verifier (43-128 chars when base64 encoded)
-    code_verifier = secrets.token_urlsafe(32)
+    # 32 bytes of random data for code_verifier (43 chars when base64url encoded)
+    code_verifier = _b64url(verifier_bytes if verifier_bytes is not None else os.urandom(32))
 
     # Create code_challenge using S256: BASE64URL(SHA256(code_verifier))
-    digest = hashlib.sha256(code_verifier.encode('ascii')).digest()
-    code_challenge = base64.urlsafe_b64encode(digest).rstrip(b'=').decode('ascii')
+    code_challenge = _b64url(hashlib.sha256(code_verifier.encode('ascii')).digest())
 
     return code_verifier, code_challenge
 
 
+def _decode_unverified_claims(token: str) -> Dict[str, Any]:
+    """
+    Decode a JWT's payload segment without verifying its signature.
+
+    Only for reading claims from tokens received directly from the IdP's
+    token endpoint over TLS.
+
+    Raises:
+        ValueError: If the token is not a well-formed JWT
+    """
+    payload_b64 = token.split('.', 2)[1]
+    payload_b64 += '=' * (-len(payload_b64) % 4)
+    claims = json.loads(base64.urlsafe_b64decode(payload_b64))
+    if not isinstance(claims, dict):
+        raise ValueError("JWT payload is not a JSON object")
+    return claims
+
+
 class OIDCAuthService:
     """Service for handling OIDC authentication with Entra ID."""
     
@@ -58,12 +84,33 @@ class OIDCAuthService:
         # Build scope string with API scope (matches frontend format)
         # Format: openid profile email api://{client_id}/Read offline_access
         self.scope = f"openid profile email api://{self.client_id}/Read offline_access"
+
+        # Authorization URL parameters that never change per request, encoded once
+        self._authorization_url_prefix = f"{self.authorization_endpoint}?" + urlencode({
+            "client_id": self.client_id,
+            "response_type": "code",
+            "response_mode": "query",
+            "scope": self.scope,  # Includes API scope: api://{client_id}/Read
+            "code_challenge_method": "S256",  # PKCE method
+        })
         
         # Distributed state storage (DynamoDB in production, in-memory for local dev)
         self.state_store: StateStore = create_state_store()
         
         # State TTL in seconds (10 minutes)
         self._state_ttl = 600
+
+        # Long-lived client so token exchange/refresh reuse pooled TLS connections
+        # to the token endpoint instead of a fresh handshake per call
+        self._http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client (called on application shutdown)."""
+        await self._http_client.aclose()
     
     def generate_state(
         self,
@@ -78,9 +125,11 @@ class OIDCAuthService:
         Returns:
             Tuple of (state, code_challenge, nonce)
         """
-        state = secrets.token_urlsafe(32)
-        code_verifier, code_challenge = generate_pkce_pair()
-        nonce = secrets.token_urlsafe(32)
+        # One urandom read covers state, PKCE verifier and nonce (32 bytes each)
+        raw = os.urandom(96)
+        state = _b64url(raw[:32])
+        code_verifier, code_challenge = generate_pkce_pair(raw[32:64])
+        nonce = _b64url(raw[64:])
 
         # Store state with PKCE verifier and nonce for validation during callback
         self.state_store.store_state(
@@ -133,21 +182,16 @@ class OIDCAuthService:
         redirect = redirect_uri or self.redirect_uri
 
         params = {
-            "client_id": self.client_id,
-            "response_type": "code",
             "redirect_uri": redirect,
-            "response_mode": "query",
-            "scope": self.scope,  # Includes API scope: api://{client_id}/Read
             "state": state,
             "nonce": nonce,  # ID token binding
             "code_challenge": code_challenge,  # PKCE
-            "code_challenge_method": "S256",  # PKCE method
             "prompt": prompt,
         }
 
         # Returns OIDC v2.0 authorization URL format:
         # https://login.microsoftonline.com/{tenant_id}/oauth2/v2.0/authorize?...
-        return f"{self.authorization_endpoint}?{urlencode(params)}"
+        return f"{self._authorization_url_prefix}&{urlencode(params)}"
     
     async def exchange_code_for_tokens(
         self,
@@ -173,10 +217,10 @@ class OIDCAuthService:
             HTTPException: If token exchange fails or state/nonce is invalid
         """
         # Validate state and retrieve stored OIDC data (code_verifier, nonce)
-        logger.debug(f"Validating state token: {state[:16]}..." if len(state) > 16 else f"Validating state token: {state}")
+        logger.debug("Validating state token: %.16s%s", state, "..." if len(state) > 16 else "")
         is_valid, state_data = self.validate_state(state)
         if not is_valid or state_data is None:
-            logger.warning(f"Invalid or expired state token: {state[:16]}..." if len(state) > 16 else f"Invalid or expired state token: {state}")
+            logger.warning("Invalid or expired state token: %.16s%s", state, "..." if len(state) > 16 else "")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid or expired state parameter. Please initiate login again."
@@ -201,62 +245,60 @@ class OIDCAuthService:
         logger.debug(f"Token exchange - redirect_uri: {redirect}, has_code_verifier: {state_data.code_verifier is not None}")
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.token_endpoint,
-                    data=token_data,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                    timeout=10.0
-                )
-                response.raise_for_status()
-                token_response = response.json()
-
-                # Validate nonce in ID token if present
-                id_token = token_response.get("id_token")
-                if id_token and state_data.nonce:
-                    import jwt
-                    try:
-                        # Decode without verification to check nonce
-                        # (Signature is validated by Entra ID during token exchange)
-                        id_claims = jwt.decode(id_token, options={"verify_signature": False})
-                        token_nonce = id_claims.get("nonce")
-                        if token_nonce != state_data.nonce:
-                            logger.error(
-                                f"Nonce mismatch: expected={state_data.nonce[:8]}..., "
-                                f"got={token_nonce[:8] if token_nonce else 'None'}..."
-                            )
-                            raise HTTPException(
-                                status_code=status.HTTP_400_BAD_REQUEST,
-                                detail="ID token nonce validation failed. Please try again."
-                            )
-                    except jwt.DecodeError as e:
-                        logger.error(f"Failed to decode ID token for nonce validation: {e}")
-                        raise HTTPException(
-                            status_code=status.HTTP_400_BAD_REQUEST,
-                            detail="Invalid ID token received. Please try again."
-                        )
-
-                logger.info("Successfully exchanged authorization code for tokens")
-
-                # Log token details for debugging
-                access_token = token_response.get("access_token")
-                if access_token:
-                    try:
-                        # Decode without verification to log audience
-                        token_claims = jwt.decode(access_token, options={"verify_signature": False})
-                        logger.info(f"Access token audience: {token_claims.get('aud')}")
-                        logger.info(f"Access token scopes (scp): {token_claims.get('scp')}")
-                    except Exception as decode_err:
-                        logger.warning(f"Could not decode access token for logging: {decode_err}")
-
-                return {
-                    "access_token": access_token,
-                    "refresh_token": token_response.get("refresh_token"),
-                    "id_token": token_response.get("id_token"),
-                    "token_type": token_response.get("token_type", "Bearer"),
-                    "expires_in": token_response.get("expires_in", 3600),
-                    "scope": token_response.get("scope", ""),
-                }
+            response = await self._http_client.post(
+                self.token_endpoint,
+                data=token_data,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                timeout=10.0
+            )
+            response.raise_for_status()
+            token_response = response.json()
+
+            # Validate nonce in ID token if present
+            id_token = token_response.get("id_token")
+            if id_token and state_data.nonce:
+                try:
+                    # Decode without verification to check nonce
+                    # (Signature is validated by Entra ID during token exchange)
+                    id_claims = _decode_unverified_claims(id_token)
+                except (ValueError, IndexError) as e:
+                    logger.error(f"Failed to decode ID token for nonce validation: {e}")
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="Invalid ID token received. Please try again."
+                    )
+                token_nonce = id_claims.get("nonce")
+                if token_nonce != state_data.nonce:
+                    logger.error(
+                        f"Nonce mismatch: expected={state_data.nonce[:8]}..., "
+                        f"got={token_nonce[:8] if token_nonce else 'None'}..."
+                    )
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="ID token nonce validation failed. Please try again."
+                    )
+
+            logger.info("Successfully exchanged authorization code for tokens")
+
+            # Log token details for debugging
+            access_token = token_response.get("access_token")
+            if access_token:
+                try:
+                    # Decode without verification to log audience
+                    token_claims = _decode_unverified_claims(access_token)
+                    logger.info(f"Access token audience: {token_claims.get('aud')}")
+                    logger.info(f"Access token scopes (scp): {token_claims.get('scp')}")
+                except Exception as decode_err:
+                    logger.warning(f"Could not decode access token for logging: {decode_err}")
+
+            return {
+                "access_token": access_token,
+                "refresh_token": token_response.get("refresh_token"),
+                "id_token": token_response.get("id_token"),
+                "token_type": token_response.get("token_type", "Bearer"),
+                "expires_in": token_response.get("expires_in", 3600),
+                "scope": token_response.get("scope", ""),
+            }
 
         except httpx.HTTPStatusError as e:
             logger.error(f"Token exchange failed with status {e.response.status_code}: {e.response.text}")
@@ -312,27 +354,26 @@ class OIDCAuthService:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.token_endpoint,
-                    data=token_data,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                    timeout=10.0
-                )
-                response.raise_for_status()
-                token_response = response.json()
-                
-                logger.info("Successfully refreshed access token")
-                
-                return {
-                    "access_token": token_response.get("access_token"),
-                    "refresh_token": token_response.get("refresh_token") or refresh_token,
-                    "id_token": token_response.get("id_token"),
-                    "token_type": token_response.get("token_type", "Bearer"),
-                    "expires_in": token_response.get("expires_in", 3600),
-                    "scope": token_response.get("scope", ""),
-                }
-                
+            response = await self._http_client.post(
+                self.token_endpoint,
+                data=token_data,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                timeout=10.0
+            )
+            response.raise_for_status()
+            token_response = response.json()
+            
+            logger.info("Successfully refreshed access token")
+            
+            return {
+                "access_token": token_response.get("access_token"),
+                "refresh_token": token_response.get("refresh_token") or refresh_token,
+                "id_token": token_response.get("id_token"),
+                "token_type": token_response.get("token_type", "Bearer"),
+                "expires_in": token_response.get("expires_in", 3600),
+                "scope": token_response.get("scope", ""),
+            }
+            
         except httpx.HTTPStatusError as e:
             logger.error(f"Token refresh failed with status {e.response.status_code}: {e.response.text}")
             if e.response.status_code == 400:
@@ -380,3 +421,11 @@ def get_auth_service() -> OIDCAuthService:
         _service = OIDCAuthService()
     return _service
 
+
+async def close_auth_service() -> None:
+    """Release the global auth service's HTTP connections, if it was created."""
+    global _service
+    if _service is not None:
+        await _service.aclose()
+        _service = None
+
@@ -443,16 +443,21 @@ async def chat_stream(request: ChatRequest, current_user: User = Depends(get_cur
                 # Client disconnected (e.g., stop button clicked)
                 logger.warning(f"⚠️ Client disconnected during streaming for session {request.session_id}")
 
-                # Mark session manager as cancelled to prevent further tool execution
-                if hasattr(agent.session_manager, "cancelled"):
-                    agent.session_manager.cancelled = True
-                    logger.info(f"🚫 Session manager marked as cancelled - will ignore further messages")
-
-                # Add final assistant message with stop reason
+                # Final assistant message with stop reason
                 stop_message = {"role": "assistant", "content": [{"text": "Session stopped by user"}]}
-                if hasattr(agent.session_manager, "pending_messages"):
-                    agent.session_manager.pending_messages.append(stop_message)
-                    logger.info(f"📝 Added stop message to pending buffer")
+
+                # Mark session manager as cancelled to prevent further tool execution.
+                # cancel() buffers the stop message and flushes off the event loop; shield
+                # it so a second cancellation doesn't abandon the write half-way.
+                if hasattr(type(agent.session_manager), "cancel"):
+                    await asyncio.shield(agent.session_manager.cancel(stop_message))
+                    logger.info("🚫 Session manager cancelled - stop message persisted")
+                elif hasattr(agent.session_manager, "cancelled"):
+                    agent.session_manager.cancelled = True
+                    logger.info("🚫 Session manager marked as cancelled - will ignore further messages")
+                    if hasattr(agent.session_manager, "pending_messages"):
+                        agent.session_manager.pending_messages.append(stop_message)
+                        logger.info("📝 Added stop message to pending buffer")
 
                 # Re-raise to properly close the connection
                 raise
@@ -13,7 +13,7 @@ import logging
 from typing import Dict, Optional
 from datetime import datetime, timezone
 
-from apis.app_api.admin.services.managed_models import list_managed_models
+from apis.app_api.admin.services.managed_models import get_managed_model_by_model_id
 
 logger = logging.getLogger(__name__)
 
@@ -28,13 +28,9 @@ async def get_model_by_model_id(model_id: str) -> Optional[Dict[str, any]]:
     Returns:
         ManagedModel if found, None otherwise
     """
-    # Get all managed models (no role filtering, we want admin view)
-    models = await list_managed_models(user_roles=None)
-
-    # Find model with matching model_id
-    for model in models:
-        if model.model_id == model_id:
-            return model
+    model = await get_managed_model_by_model_id(model_id)
+    if model:
+        return model
 
     logger.warning(f"No managed model found for model_id: {model_id}")
     return None
@@ -110,8 +106,7 @@ async def create_pricing_snapshot(model_id: str) -> Optional[Dict[str, any]]:
     if not pricing:
         return None
 
-    return {
-        **pricing,
-        "currency": "USD",
-        "snapshotAt": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-    }
+    # get_model_pricing builds a fresh dict per call, so extend it in place
+    pricing["currency"] = "USD"
+    pricing["snapshotAt"] = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    return pricing
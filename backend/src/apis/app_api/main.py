@@ -60,6 +60,16 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("=== Agent Core Service Shutting Down ===")
+    try:
+        from apis.app_api.auth.service import close_auth_service
+        await close_auth_service()
+    except Exception as e:
+        logger.warning(f"Failed to close auth service HTTP client: {e}")
+    try:
+        from agents.local_tools.cludo_search import close_cludo_client
+        await close_cludo_client()
+    except Exception as e:
+        logger.warning(f"Failed to close Cludo HTTP client: {e}")
     # TODO: Cleanup agent pool, MCP clients, etc.
 
 # Create FastAPI app with lifespan
@@ -4,12 +4,13 @@ Retrieves conversation history from AgentCore Memory or local file storage.
 """
 
 import base64
-import json
 import logging
 import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
+
 from apis.app_api.messages.models import Message, MessageContent, MessageResponse, MessagesListResponse
 
 logger = logging.getLogger(__name__)
@@ -503,8 +504,7 @@ async def get_messages_from_local(
     metadata_index = {}
     if metadata_file.exists():
         try:
-            with open(metadata_file, "r") as f:
-                metadata_index = json.load(f)
+            metadata_index = orjson.loads(metadata_file.read_bytes())
             logger.info(f"Loaded metadata for {len(metadata_index)} messages")
         except Exception as e:
             logger.warning(f"Failed to load message metadata index: {e}")
@@ -524,8 +524,7 @@ async def get_messages_from_local(
             # Read each message file
             for message_file in message_files:
                 try:
-                    with open(message_file, "r") as f:
-                        data = json.load(f)
+                    data = orjson.loads(message_file.read_bytes())
 
                     # Extract the message object
                     msg = data.get("message", {})
@@ -12,10 +12,13 @@ import logging
 import json
 import os
 import base64
+from functools import lru_cache
 from typing import Optional, Tuple, Any, Dict
 from pathlib import Path
 from decimal import Decimal
 
+import orjson
+
 from apis.app_api.messages.models import MessageMetadata
 from apis.app_api.sessions.models import SessionMetadata
 from apis.app_api.storage.paths import get_message_path, get_session_metadata_path, get_sessions_root, get_message_metadata_path
@@ -23,6 +26,18 @@ from apis.app_api.storage.paths import get_message_path, get_session_metadata_pa
 logger = logging.getLogger(__name__)
 
 
+# Table names are fixed for the life of the process; read them once on first use
+# (not at import, so .env loading in the app entrypoints still takes effect)
+@lru_cache(maxsize=1)
+def _get_sessions_metadata_table_name() -> Optional[str]:
+    return os.environ.get('DYNAMODB_SESSIONS_METADATA_TABLE_NAME')
+
+
+@lru_cache(maxsize=1)
+def _get_system_rollup_table_name() -> Optional[str]:
+    return os.environ.get("DYNAMODB_SYSTEM_ROLLUP_TABLE_NAME")
+
+
 def _convert_floats_to_decimal(obj: Any) -> Any:
     """
     Recursively convert floats to Decimal for DynamoDB
@@ -77,7 +92,7 @@ async def store_message_metadata(
         This should be called AFTER the session manager flushes messages,
         ensuring the message file exists before we try to update it.
     """
-    sessions_metadata_table = os.environ.get('DYNAMODB_SESSIONS_METADATA_TABLE_NAME')
+    sessions_metadata_table = _get_sessions_metadata_table_name()
 
     if sessions_metadata_table:
         await _store_message_metadata_cloud(
@@ -131,8 +146,8 @@ async def _store_message_metadata_local(
         # Read existing metadata index if it exists
         metadata_index = {}
         if metadata_file.exists():
-            with open(metadata_file, 'r') as f:
-                metadata_index = json.load(f)
+            # The index grows by one entry per turn; parse it with orjson
+            metadata_index = orjson.loads(metadata_file.read_bytes())
 
         # Add or update metadata for this message
         # Use string key for JSON compatibility
@@ -446,7 +461,7 @@ async def _update_system_rollups_async(
     """
     try:
         # Check if we're using DynamoDB storage (rollups only make sense in cloud mode)
-        system_rollup_table = os.environ.get("DYNAMODB_SYSTEM_ROLLUP_TABLE_NAME")
+        system_rollup_table = _get_system_rollup_table_name()
         if not system_rollup_table:
             logger.debug("System rollup table not configured, skipping rollup updates")
             return
@@ -527,7 +542,7 @@ async def store_session_metadata(
         This performs a deep merge - existing fields are preserved unless
         explicitly overwritten by new values.
     """
-    sessions_metadata_table = os.environ.get('DYNAMODB_SESSIONS_METADATA_TABLE_NAME')
+    sessions_metadata_table = _get_sessions_metadata_table_name()
 
     if sessions_metadata_table:
         await _store_session_metadata_cloud(
@@ -855,7 +870,7 @@ async def get_session_metadata(session_id: str, user_id: str) -> Optional[Sessio
     Returns:
         SessionMetadata object if found, None otherwise
     """
-    sessions_metadata_table = os.environ.get('DYNAMODB_SESSIONS_METADATA_TABLE_NAME')
+    sessions_metadata_table = _get_sessions_metadata_table_name()
 
     if sessions_metadata_table:
         return await _get_session_metadata_cloud(
@@ -879,7 +894,7 @@ async def get_all_message_metadata(session_id: str, user_id: str) -> Dict[str, A
     Returns:
         Dictionary mapping message_id (str) to metadata dict
     """
-    sessions_metadata_table = os.environ.get('DYNAMODB_SESSIONS_METADATA_TABLE_NAME')
+    sessions_metadata_table = _get_sessions_metadata_table_name()
 
     if sessions_metadata_table:
         return await _get_all_message_metadata_cloud(session_id, user_id, sessions_metadata_table)
@@ -1133,7 +1148,7 @@ async def list_user_sessions(
         Tuple of (list of SessionMetadata objects, next_token if more sessions exist)
         Sessions are sorted by last_message_at descending (most recent first)
     """
-    sessions_metadata_table = os.environ.get('DYNAMODB_SESSIONS_METADATA_TABLE_NAME')
+    sessions_metadata_table = _get_sessions_metadata_table_name()
 
     if sessions_metadata_table:
         return await _list_user_sessions_cloud(
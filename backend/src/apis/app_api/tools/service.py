@@ -427,7 +427,7 @@ class ToolCatalogService:
         self, role_id: str, tool_id: str, admin: User
     ) -> None:
         """Add a tool to a role's grantedTools."""
-        role = await self.app_role_admin_service.get_role(role_id)
+        role = await self.app_role_admin_service.get_role(role_id, use_cache=False)
         if not role:
             raise ValueError(f"Role '{role_id}' not found")
 
@@ -440,7 +440,7 @@ class ToolCatalogService:
         self, role_id: str, tool_id: str, admin: User
     ) -> None:
         """Remove a tool from a role's grantedTools."""
-        role = await self.app_role_admin_service.get_role(role_id)
+        role = await self.app_role_admin_service.get_role(role_id, use_cache=False)
         if not role:
             raise ValueError(f"Role '{role_id}' not found")
 
@@ -477,17 +477,18 @@ async def invocations(request: InvocationRequest, current_user: User = Depends(g
                 )
 
         # Create stream with optional quota warning injection
-        async def stream_with_quota_warning() -> AsyncGenerator[str, None]:
+        async def stream_with_quota_warning() -> AsyncGenerator[bytes, None]:
             """Wrap agent stream to inject quota warning at start if needed"""
             # Yield quota warning event first if applicable
+            # (encoded to match the agent stream's bytes frames)
             if quota_warning_event:
-                yield quota_warning_event.to_sse_format()
+                yield quota_warning_event.to_sse_format().encode()
 
             # Yield citation events BEFORE the agent stream starts
             # This allows the UI to display sources immediately
             if citations_for_storage:
                 for citation in citations_for_storage:
-                    yield f"event: citation\ndata: {json.dumps(citation)}\n\n"
+                    yield f"event: citation\ndata: {json.dumps(citation)}\n\n".encode()
 
             # Then yield all agent stream events
             # Use augmented message if assistant RAG was applied
@@ -117,6 +117,13 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("=== Inference API Shutting Down ===")
+
+    try:
+        from agents.local_tools.cludo_search import close_cludo_client
+        await close_cludo_client()
+    except Exception as e:
+        logger.warning(f"Failed to close Cludo HTTP client: {e}")
+
     # TODO: Cleanup agent pool, MCP clients, etc.
 
 # Create FastAPI app with lifespan
@@ -153,6 +153,9 @@ def has_all_roles(user: User, *roles: str) -> bool:
 
 # Predefined role checkers for common use cases
 # These can be used directly as dependencies: async def endpoint(user: User = Depends(require_admin))
+# Role checkers are async so FastAPI resolves them on the event loop; a plain
+# `def` dependency would be dispatched to the threadpool on every request.
+# Keep them async, or cheap enough that inline sync work doesn't matter.
 
 # Admin access - requires either Admin or SuperAdmin role
 require_admin = require_roles("Admin", "SuperAdmin", "DotNetDevelopers")
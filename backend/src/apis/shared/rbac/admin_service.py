@@ -1,9 +1,11 @@
 """Admin service for AppRole management operations."""
 
 import logging
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
 
+from cachetools import TTLCache
+
 from apis.shared.auth.models import User
 
 from .models import AppRole, EffectivePermissions, AppRoleCreate, AppRoleUpdate
@@ -12,6 +14,13 @@ from .cache import AppRoleCache, get_app_role_cache
 
 logger = logging.getLogger(__name__)
 
+# Admin role reads get their own short-lived cache (separate from the runtime
+# AppRoleCache, whose role entries live for minutes) so bursts of
+# /roles/{role_id} requests hit DynamoDB once while edits made on other
+# instances show up within seconds. Local mutations pop the entry explicitly.
+ADMIN_ROLE_CACHE_TTL_SECONDS = 5
+ADMIN_ROLE_CACHE_MAXSIZE = 1024
+
 
 class AppRoleAdminService:
     """
@@ -32,6 +41,12 @@ class AppRoleAdminService:
         """Initialize admin service with repository and cache."""
         self.repository = repository or AppRoleRepository()
         self.cache = cache or get_app_role_cache()
+        # Only touched from the event loop thread, so no lock is needed
+        self._role_cache: TTLCache = TTLCache(
+            maxsize=ADMIN_ROLE_CACHE_MAXSIZE, ttl=ADMIN_ROLE_CACHE_TTL_SECONDS
+        )
+        self._role_cache_hits = 0
+        self._role_cache_misses = 0
 
     # =========================================================================
     # CRUD Operations
@@ -41,9 +56,82 @@ class AppRoleAdminService:
         """List all roles."""
         return await self.repository.list_roles(enabled_only=enabled_only)
 
-    async def get_role(self, role_id: str) -> Optional[AppRole]:
-        """Get a role by ID."""
-        return await self.repository.get_role(role_id)
+    async def list_roles_page(
+        self,
+        enabled_only: bool = False,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[AppRole], int, Optional[str]]:
+        """
+        List one page of roles in list_roles order.
+
+        Pagination here is presentation-only: every page still scans and sorts
+        the full role table (roles are ordered by priority after the scan), so
+        it bounds response size, not server memory or DynamoDB reads. For the
+        same reason the cursor is the role_id of the last role on the previous
+        page rather than a DynamoDB start key.
+
+        Args:
+            enabled_only: If True, only return enabled roles
+            limit: Maximum roles to return (None returns all remaining)
+            cursor: role_id to resume after, from a previous page
+
+        Returns:
+            Tuple of (roles on this page, total matching roles, next cursor or None)
+
+        Raises:
+            ValueError: If the cursor doesn't match a listed role (e.g. the role
+                was deleted or disabled between pages)
+        """
+        roles = await self.list_roles(enabled_only=enabled_only)
+        total = len(roles)
+
+        start = 0
+        if cursor:
+            start = next(
+                (i + 1 for i, r in enumerate(roles) if r.role_id == cursor), None
+            )
+            if start is None:
+                raise ValueError(f"Unknown or expired cursor: {cursor}")
+
+        end = total if limit is None else min(start + limit, total)
+        page = roles[start:end]
+        next_cursor = page[-1].role_id if page and end < total else None
+        return page, total, next_cursor
+
+    async def get_role(
+        self, role_id: str, use_cache: bool = True
+    ) -> Optional[AppRole]:
+        """
+        Get a role by ID (served from the admin role cache when fresh).
+
+        Read-modify-write callers must pass use_cache=False: a cached role can
+        be up to ADMIN_ROLE_CACHE_TTL_SECONDS behind edits made on other
+        instances, and writing back a list built from it would drop them.
+        """
+        if use_cache:
+            role = self._role_cache.get(role_id)
+            if role is not None:
+                self._role_cache_hits += 1
+                return role
+            self._role_cache_misses += 1
+
+        role = await self.repository.get_role(role_id)
+        if role:
+            self._role_cache[role_id] = role
+        return role
+
+    def clear_role_cache(self) -> None:
+        """Drop every admin role cache entry."""
+        self._role_cache.clear()
+
+    def get_role_cache_stats(self) -> Dict[str, int]:
+        """Admin role cache statistics for monitoring."""
+        return {
+            "adminRoleCacheSize": len(self._role_cache),
+            "adminRoleCacheHits": self._role_cache_hits,
+            "adminRoleCacheMisses": self._role_cache_misses,
+        }
 
     async def create_role(
         self, role_data: AppRoleCreate, admin: User
@@ -194,6 +282,7 @@ class AppRoleAdminService:
 
         if deleted:
             # Invalidate caches
+            self._role_cache.pop(role_id, None)
             await self.cache.invalidate_role(role_id)
             for jwt_role in existing.jwt_role_mappings:
                 await self.cache.invalidate_jwt_mapping(jwt_role)
@@ -291,6 +380,7 @@ class AppRoleAdminService:
 
     async def _invalidate_caches_for_role(self, role: AppRole):
         """Invalidate all relevant caches after role update."""
+        self._role_cache.pop(role.role_id, None)
         await self.cache.invalidate_role(role.role_id)
         for jwt_role in role.jwt_role_mappings:
             await self.cache.invalidate_jwt_mapping(jwt_role)
@@ -363,7 +453,7 @@ class AppRoleAdminService:
         Raises:
             ValueError: If role not found
         """
-        role = await self.get_role(role_id)
+        role = await self.get_role(role_id, use_cache=False)
         if not role:
             raise ValueError(f"Role '{role_id}' not found")
 
@@ -403,7 +493,7 @@ class AppRoleAdminService:
         Raises:
             ValueError: If role not found
         """
-        role = await self.get_role(role_id)
+        role = await self.get_role(role_id, use_cache=False)
         if not role:
             raise ValueError(f"Role '{role_id}' not found")
 
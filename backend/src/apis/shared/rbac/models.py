@@ -212,8 +212,13 @@ class AppRoleResponse(BaseModel):
 
     @classmethod
     def from_app_role(cls, role: AppRole) -> "AppRoleResponse":
-        """Create response from AppRole dataclass."""
-        return cls(
+        """
+        Create response from AppRole dataclass.
+
+        AppRole is already typed and validated on load, so validation is
+        skipped here; the response model still validates on serialization.
+        """
+        return cls.model_construct(
             role_id=role.role_id,
             display_name=role.display_name,
             description=role.description,
@@ -221,7 +226,7 @@ class AppRoleResponse(BaseModel):
             inherits_from=role.inherits_from,
             granted_tools=role.granted_tools,
             granted_models=role.granted_models,
-            effective_permissions=EffectivePermissionsResponse(
+            effective_permissions=EffectivePermissionsResponse.model_construct(
                 tools=role.effective_permissions.tools,
                 models=role.effective_permissions.models,
                 quota_tier=role.effective_permissions.quota_tier,
@@ -240,6 +245,9 @@ class AppRoleListResponse(BaseModel):
 
     roles: List[AppRoleResponse]
     total: int
+    next_cursor: Optional[str] = Field(None, alias="nextCursor")
+
+    model_config = {"populate_by_name": True}
 
 
 class CacheStatsResponse(BaseModel):
@@ -249,6 +257,9 @@ class CacheStatsResponse(BaseModel):
     user_cache_expired: int = Field(..., alias="userCacheExpired")
     role_cache_size: int = Field(..., alias="roleCacheSize")
     role_cache_expired: int = Field(..., alias="roleCacheExpired")
+    admin_role_cache_size: int = Field(0, alias="adminRoleCacheSize")
+    admin_role_cache_hits: int = Field(0, alias="adminRoleCacheHits")
+    admin_role_cache_misses: int = Field(0, alias="adminRoleCacheMisses")
     jwt_mapping_cache_size: int = Field(..., alias="jwtMappingCacheSize")
     jwt_mapping_cache_expired: int = Field(..., alias="jwtMappingCacheExpired")
 
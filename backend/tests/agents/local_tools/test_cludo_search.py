@@ -0,0 +1,74 @@
+"""Unit tests for Cludo query coalescing."""
+
+import asyncio
+
+import pytest
+
+from agents.local_tools import cludo_search
+
+
+@pytest.fixture(autouse=True)
+def cludo_env(monkeypatch):
+    monkeypatch.setenv("TOOL_CLUDO_SITE_KEY", "test-key")
+    cludo_search._RESULT_CACHE.clear()
+    cludo_search._INFLIGHT.clear()
+    yield
+    cludo_search._RESULT_CACHE.clear()
+    cludo_search._INFLIGHT.clear()
+
+
+@pytest.mark.asyncio
+async def test_follower_survives_leader_cancellation(monkeypatch):
+    calls = 0
+
+    async def slow_post(request_body, site_key):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"TotalDocument": 1, "TypedDocuments": []}
+
+    monkeypatch.setattr(cludo_search, "_post_cludo", slow_post)
+
+    leader = asyncio.create_task(cludo_search.query_cludo_api("admissions"))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(cludo_search.query_cludo_api("admissions"))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+    assert (await follower)["TotalDocument"] == 1
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_follower_does_not_cancel_leader(monkeypatch):
+    async def slow_post(request_body, site_key):
+        await asyncio.sleep(0.05)
+        return {"TotalDocument": 3}
+
+    monkeypatch.setattr(cludo_search, "_post_cludo", slow_post)
+
+    leader = asyncio.create_task(cludo_search.query_cludo_api("housing"))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(cludo_search.query_cludo_api("housing"))
+    await asyncio.sleep(0)
+
+    follower.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await follower
+
+    assert (await leader)["TotalDocument"] == 3
+
+
+@pytest.mark.asyncio
+async def test_site_key_change_closes_replaced_client(monkeypatch):
+    old_client = await cludo_search._get_client("old-key")
+    new_client = await cludo_search._get_client("new-key")
+    await asyncio.sleep(0)
+
+    assert new_client is not old_client
+    assert old_client.is_closed
+    await cludo_search.close_cludo_client()
+    assert new_client.is_closed
@@ -0,0 +1,91 @@
+"""Unit tests for QuotaRepository role-assignment queries."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from agents.main_agent.quota import resolver as resolver_module
+from agents.main_agent.quota.repository import QuotaRepository
+from agents.main_agent.quota.resolver import QuotaResolver
+from apis.shared.auth.models import User
+
+QUERY_DELAY = 0.2
+
+
+class _SlowClient:
+    """Stand-in for a low-level DynamoDB client whose query blocks like a network round trip."""
+
+    def __init__(self, items=()):
+        self.items = list(items)
+        self.queries = 0
+
+    def query(self, **kwargs):
+        assert kwargs["TableName"] == "UserQuotas"
+        self.queries += 1
+        time.sleep(QUERY_DELAY)
+        return {"Items": [dict(item) for item in self.items]}
+
+
+def _repository(client):
+    repository = QuotaRepository.__new__(QuotaRepository)
+    repository.table_name = "UserQuotas"
+    # Worker-thread queries must not touch the (non-thread-safe) Table resource
+    repository.table = None
+    repository.client = client
+    return repository
+
+
+@pytest.mark.asyncio
+async def test_role_queries_overlap_in_resolver(monkeypatch):
+    repository = _repository(_SlowClient())
+
+    async def nothing(*args, **kwargs):
+        return None
+
+    async def no_assignments(*args, **kwargs):
+        return []
+
+    class _AppRoleService:
+        async def resolve_user_permissions(self, user):
+            return SimpleNamespace(app_roles=["student", "researcher", "staff"])
+
+    repository.get_active_override = nothing
+    repository.query_user_assignment = nothing
+    repository.list_assignments_by_type = no_assignments
+    monkeypatch.setattr(resolver_module, "_get_app_role_service", lambda: _AppRoleService())
+
+    resolver = QuotaResolver(repository=repository)
+    resolver._get_cached_domain_assignments = no_assignments
+    user = User(user_id="u1", email="", name="U", roles=["Student", "Faculty", "Staff"])
+
+    start = time.perf_counter()
+    assert await resolver._resolve_from_db(user) is None
+    elapsed = time.perf_counter() - start
+
+    assert repository.client.queries == 6
+    # One round trip per stage (app roles, then JWT roles) rather than six in sequence
+    assert elapsed < 4 * QUERY_DELAY
+
+
+@pytest.mark.asyncio
+async def test_role_query_deserializes_client_items():
+    repository = _repository(_SlowClient([{
+        "PK": {"S": "ASSIGNMENT#a1"},
+        "GSI3PK": {"S": "ROLE#Staff"},
+        "assignmentId": {"S": "a1"},
+        "tierId": {"S": "standard"},
+        "assignmentType": {"S": "jwt_role"},
+        "jwtRole": {"S": "Staff"},
+        "priority": {"N": "200"},
+        "enabled": {"BOOL": True},
+        "createdAt": {"S": "2025-01-01T00:00:00Z"},
+        "updatedAt": {"S": "2025-01-01T00:00:00Z"},
+        "createdBy": {"S": "admin"},
+    }]))
+
+    [assignment] = await repository.query_role_assignments("Staff")
+
+    assert assignment.assignment_id == "a1"
+    assert assignment.jwt_role == "Staff"
+    assert assignment.priority == 200
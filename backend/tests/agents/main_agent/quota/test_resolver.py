@@ -298,3 +298,152 @@ async def test_disabled_assignment_skipped(resolver, mock_repository, sample_use
 
     # Should return None since assignment is disabled
     assert resolved is None
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded(mock_repository, sample_tier):
+    """Test that the cache evicts old entries once max size is reached"""
+    resolver = QuotaResolver(repository=mock_repository, cache_ttl_seconds=300, cache_max_size=2)
+    mock_repository.query_user_assignment.return_value = None
+    mock_repository.query_role_assignments.return_value = []
+    mock_repository.list_assignments_by_type.return_value = []
+
+    for i in range(5):
+        user = User(user_id=f"user{i}", email=f"user{i}@example.com", name="User", roles=[])
+        await resolver.resolve_user_quota(user)
+
+    assert len(resolver._cache) == 2
+    # Per-user index follows evictions instead of growing with every user seen
+    assert set(resolver._cache.user_index) == {"user3", "user4"}
+
+    resolver.invalidate_cache("user4")
+    assert set(resolver._cache.user_index) == {"user3"}
+    assert len(resolver._cache) == 1
+
+
+def test_matches_email_domain_patterns(resolver):
+    """Test exact, wildcard, regex, and comma-separated domain patterns"""
+    assert resolver._matches_email_domain("example.com", "example.com")
+    assert resolver._matches_email_domain("cs.example.com", "*.example.com")
+    assert resolver._matches_email_domain("example.com", "*.example.com")
+    assert not resolver._matches_email_domain("badexample.com", "*.example.com")
+    assert resolver._matches_email_domain("eng.example.com", r"regex:^(cs|eng)\.example\.com$")
+    assert not resolver._matches_email_domain("art.example.com", r"regex:^(cs|eng)\.example\.com$")
+    assert not resolver._matches_email_domain("example.com", "regex:(")
+    assert resolver._matches_email_domain("college.edu", "example.com, college.edu")
+    assert not resolver._matches_email_domain("example.com", "")
+
+
+@pytest.mark.asyncio
+async def test_resolve_email_domain_highest_priority(resolver, mock_repository, sample_tier, sample_user):
+    """Test that domain assignments are matched in priority order"""
+    def domain_assignment(assignment_id, pattern, priority):
+        return QuotaAssignment(
+            assignment_id=assignment_id,
+            tier_id=assignment_id,
+            assignment_type=QuotaAssignmentType.EMAIL_DOMAIN,
+            email_domain=pattern,
+            priority=priority,
+            enabled=True,
+            created_at="2025-01-01T00:00:00Z",
+            updated_at="2025-01-01T00:00:00Z",
+            created_by="admin"
+        )
+
+    mock_repository.query_user_assignment.return_value = None
+    mock_repository.query_role_assignments.return_value = []
+    mock_repository.list_assignments_by_type.return_value = [
+        domain_assignment("low", "example.com", 100),
+        domain_assignment("high", "*.com", 150),
+    ]
+    mock_repository.get_tier.return_value = sample_tier
+
+    resolved = await resolver.resolve_user_quota(sample_user)
+
+    assert resolved.matched_by == "email_domain:*.com"
+    mock_repository.get_tier.assert_called_once_with("high")
+
+
+@pytest.mark.asyncio
+async def test_role_queries_cover_all_roles(resolver, mock_repository, sample_tier):
+    """Test that every JWT role is queried and the highest priority match wins"""
+    def role_assignment(role, priority):
+        return QuotaAssignment(
+            assignment_id=f"assign_{role}",
+            tier_id=role,
+            assignment_type=QuotaAssignmentType.JWT_ROLE,
+            jwt_role=role,
+            priority=priority,
+            enabled=True,
+            created_at="2025-01-01T00:00:00Z",
+            updated_at="2025-01-01T00:00:00Z",
+            created_by="admin"
+        )
+
+    user = User(user_id="multi", email="multi@example.com", name="Multi", roles=["Student", "Faculty"])
+    mock_repository.query_user_assignment.return_value = None
+    mock_repository.query_role_assignments.side_effect = lambda role: [
+        role_assignment(role, 200 if role == "Faculty" else 100)
+    ]
+    mock_repository.get_tier.return_value = sample_tier
+
+    resolved = await resolver.resolve_user_quota(user)
+
+    assert resolved.matched_by == "jwt_role:Faculty"
+    assert mock_repository.query_role_assignments.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_negative_result_cached_with_short_ttl(mock_repository, sample_user):
+    """Test that "no quota configured" is cached, but for the shorter negative TTL"""
+    resolver = QuotaResolver(repository=mock_repository, cache_ttl_seconds=300, negative_ttl_seconds=60)
+    mock_repository.query_user_assignment.return_value = None
+    mock_repository.query_role_assignments.return_value = []
+    mock_repository.list_assignments_by_type.return_value = []
+
+    assert await resolver.resolve_user_quota(sample_user) is None
+    assert await resolver.resolve_user_quota(sample_user) is None
+    assert mock_repository.get_active_override.call_count == 1
+
+    now = 1000.0
+    assert resolver._time_to_use("key", None, now) == now + 60
+
+
+def test_cache_key_ignores_role_order(resolver):
+    """Test that the cache key is stable across role ordering"""
+    user_a = User(user_id="u1", email="u1@example.com", name="U", roles=["Student", "Faculty"])
+    user_b = User(user_id="u1", email="u1@example.com", name="U", roles=["Faculty", "Student"])
+
+    assert resolver._get_cache_key(user_a) == resolver._get_cache_key(user_b)
+
+
+@pytest.mark.asyncio
+async def test_tier_lookup_shared_across_users(resolver, mock_repository, sample_tier):
+    """Test that tier definitions are fetched once and reused across users"""
+    mock_repository.query_user_assignment.return_value = None
+    mock_repository.query_role_assignments.return_value = []
+    mock_repository.list_assignments_by_type.return_value = [
+        QuotaAssignment(
+            assignment_id="default",
+            tier_id="premium",
+            assignment_type=QuotaAssignmentType.DEFAULT_TIER,
+            priority=100,
+            enabled=True,
+            created_at="2025-01-01T00:00:00Z",
+            updated_at="2025-01-01T00:00:00Z",
+            created_by="admin"
+        )
+    ]
+    mock_repository.get_tier.return_value = sample_tier
+
+    for i in range(3):
+        user = User(user_id=f"user{i}", email=f"user{i}@other.org", name="User", roles=[])
+        resolved = await resolver.resolve_user_quota(user)
+        assert resolved.tier.tier_id == "premium"
+
+    assert mock_repository.get_tier.call_count == 1
+
+    # Full invalidation (e.g. after a tier update) drops the tier cache too
+    resolver.invalidate_cache()
+    await resolver.resolve_user_quota(User(user_id="user0", email="user0@other.org", name="User", roles=[]))
+    assert mock_repository.get_tier.call_count == 2
@@ -0,0 +1,41 @@
+"""Unit tests for the conversation caching prefix-size estimate."""
+
+from types import SimpleNamespace
+
+from agents.main_agent.session.hooks.conversation_caching import ConversationCachingHook
+
+_AGENT = SimpleNamespace(system_prompt="", tool_registry=None)
+
+
+def _meets_minimum(messages):
+    hook = ConversationCachingHook()
+    return hook._prefix_meets_minimum(_AGENT, messages, len(messages) - 1)
+
+
+def test_short_text_prefix_is_below_minimum():
+    messages = [
+        {"role": "user", "content": [{"text": "hi"}]},
+        {"role": "assistant", "content": [{"text": "hello"}, {"cachePoint": {"type": "default"}}]},
+    ]
+    assert not _meets_minimum(messages)
+
+
+def test_attachment_prefix_meets_minimum():
+    messages = [
+        {"role": "user", "content": [
+            {"text": "what is in this?"},
+            {"image": {"format": "png", "source": {"bytes": b"\x89PNG"}}},
+        ]},
+        {"role": "assistant", "content": [{"text": "A chart."}]},
+    ]
+    assert _meets_minimum(messages)
+
+
+def test_document_in_tool_result_meets_minimum():
+    messages = [
+        {"role": "user", "content": [{"toolResult": {"toolUseId": "t1", "content": [
+            {"document": {"format": "pdf", "name": "report", "source": {"bytes": b"%PDF"}}},
+        ]}}]},
+        {"role": "assistant", "content": [{"text": "Summary."}]},
+    ]
+    assert _meets_minimum(messages)
@@ -0,0 +1,88 @@
+"""Unit tests for LocalSessionBuffer."""
+
+import asyncio
+import json
+
+import pytest
+
+from agents.main_agent.session.local_session_buffer import LocalSessionBuffer
+from apis.app_api.storage.paths import get_message_path
+
+SESSION_ID = "buffer-test"
+
+
+@pytest.fixture
+def buffer(tmp_path, monkeypatch):
+    monkeypatch.setenv("SESSIONS_DIR", str(tmp_path))
+    return LocalSessionBuffer(base_manager=object(), session_id=SESSION_ID, batch_size=2)
+
+
+def _stored_texts(count):
+    texts = []
+    for seq in range(count):
+        data = json.loads(get_message_path(SESSION_ID, seq).read_text())
+        texts.append(data["message"]["content"][0]["text"])
+    return texts
+
+
+@pytest.mark.asyncio
+async def test_background_flushes_keep_message_order(buffer):
+    for i in range(7):
+        buffer.append_message({"role": "user", "content": [{"text": f"m{i}"}]}, agent=None)
+
+    assert await buffer.flush_async() == 6
+    assert _stored_texts(7) == [f"m{i}" for i in range(7)]
+    assert buffer.message_count == 7
+    assert not buffer._flush_tasks
+
+
+@pytest.mark.asyncio
+async def test_cancel_persists_buffered_and_stop_messages(buffer):
+    buffer.append_message({"role": "user", "content": [{"text": "question"}]}, agent=None)
+
+    stop = {"role": "assistant", "content": [{"text": "Session stopped by user"}]}
+    assert await buffer.cancel(stop) == 1
+    assert _stored_texts(2) == ["question", "Session stopped by user"]
+
+    buffer.append_message({"role": "assistant", "content": [{"text": "late"}]}, agent=None)
+    assert buffer.pending_messages == []
+
+
+@pytest.mark.asyncio
+async def test_flush_async_batch_is_written_before_later_background_flushes(buffer):
+    for i in range(3):
+        buffer.append_message({"role": "user", "content": [{"text": f"m{i}"}]}, agent=None)
+
+    # m2 is detached by flush_async; m3/m4 then trigger a background flush
+    flushing = asyncio.create_task(buffer.flush_async())
+    await asyncio.sleep(0)
+    for i in range(3, 5):
+        buffer.append_message({"role": "user", "content": [{"text": f"m{i}"}]}, agent=None)
+
+    # flush_async's write is queued with the others, so the m3/m4 flush waits on it
+    assert [[m["content"][0]["text"] for m in batch] for batch in buffer._flush_tasks.values()][-2:] == [
+        ["m2"], ["m3", "m4"]
+    ]
+
+    await flushing
+    await buffer.flush_async()
+    assert _stored_texts(5) == [f"m{i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_message_count_does_not_wait_for_writes(buffer):
+    buffer.append_message({"role": "user", "content": [{"text": "m0"}]}, agent=None)
+
+    with buffer._flush_lock:
+        # The detached batch is counted while its write waits on the lock
+        flushing = asyncio.create_task(buffer.flush_async())
+        await asyncio.sleep(0.05)
+        buffer.append_message({"role": "user", "content": [{"text": "m1"}]}, agent=None)
+        # Timeout instead of a hang if message_count ever waits on the lock again
+        count = await asyncio.wait_for(asyncio.to_thread(lambda: buffer.message_count), 1)
+        assert count == 2
+
+    await flushing
+    assert buffer.message_count == 2
+    await buffer.flush_async()
+    assert buffer.message_count == 2
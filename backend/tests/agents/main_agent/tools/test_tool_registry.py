@@ -0,0 +1,39 @@
+"""Unit tests for ToolRegistry module registration."""
+
+from types import ModuleType
+
+from agents.main_agent.tools.tool_registry import ToolRegistry
+
+
+def _lazy_module(resolved):
+    """Module whose exports are resolved on attribute access, like local_tools."""
+    module = ModuleType("fake_tools")
+    module.__all__ = ["tool_a", "tool_b"]
+
+    def __getattr__(name):
+        if name in module.__all__:
+            resolved.append(name)
+            obj = object()
+            setattr(module, name, obj)
+            return obj
+        raise AttributeError(name)
+
+    module.__getattr__ = __getattr__
+    return module
+
+
+def test_register_module_tools_resolves_only_requested_tools():
+    resolved = []
+    registry = ToolRegistry()
+    registry.register_module_tools(_lazy_module(resolved))
+
+    assert registry.has_tool("tool_a")
+    assert registry.get_tool_count() == 2
+    assert resolved == []
+
+    tool = registry.get_tool("tool_a")
+
+    assert tool is not None
+    assert registry.get_tool("tool_a") is tool
+    assert resolved == ["tool_a"]
+    assert registry.get_tool("missing") is None
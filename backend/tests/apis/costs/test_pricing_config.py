@@ -0,0 +1,69 @@
+"""Tests for model pricing lookups."""
+
+import pytest
+
+from apis.app_api.admin.models import ManagedModelCreate, ManagedModelUpdate
+from apis.app_api.admin.services import managed_models
+from apis.app_api.costs.pricing_config import create_pricing_snapshot, get_model_pricing
+
+MODEL_ID = "us.anthropic.claude-sonnet-4-5-20250929-v1:0"
+
+
+@pytest.fixture
+def local_models(tmp_path, monkeypatch):
+    """Local managed-model storage in a temp dir with a fresh model index."""
+    monkeypatch.delenv("DYNAMODB_MANAGED_MODELS_TABLE_NAME", raising=False)
+    monkeypatch.setenv("MANAGED_MODELS_DIR", str(tmp_path))
+    managed_models.invalidate_model_index()
+    yield
+    managed_models.invalidate_model_index()
+
+
+def _model(input_price: float = 3.0) -> ManagedModelCreate:
+    return ManagedModelCreate(
+        modelId=MODEL_ID,
+        modelName="Claude Sonnet 4.5",
+        provider="bedrock",
+        providerName="Anthropic",
+        inputModalities=["TEXT"],
+        outputModalities=["TEXT"],
+        maxInputTokens=200000,
+        maxOutputTokens=8192,
+        inputPricePerMillionTokens=input_price,
+        outputPricePerMillionTokens=15.0,
+        cacheReadPricePerMillionTokens=0.3,
+    )
+
+
+@pytest.mark.asyncio
+async def test_pricing_lookup_lists_models_once(local_models, monkeypatch):
+    """Repeated lookups are served from the model index."""
+    await managed_models.create_managed_model(_model())
+
+    calls = 0
+    original = managed_models.list_all_managed_models
+
+    async def counting_list():
+        nonlocal calls
+        calls += 1
+        return await original()
+
+    monkeypatch.setattr(managed_models, "list_all_managed_models", counting_list)
+
+    for _ in range(3):
+        pricing = await get_model_pricing(MODEL_ID)
+        assert pricing == {"inputPricePerMtok": 3.0, "outputPricePerMtok": 15.0, "cacheReadPricePerMtok": 0.3}
+    assert await get_model_pricing("unknown-model") is None
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_model_update_refreshes_pricing(local_models):
+    """Writes through the managed models service invalidate the index."""
+    model = await managed_models.create_managed_model(_model())
+    assert (await get_model_pricing(MODEL_ID))["inputPricePerMtok"] == 3.0
+
+    await managed_models.update_managed_model(model.id, ManagedModelUpdate(inputPricePerMillionTokens=2.5))
+    snapshot = await create_pricing_snapshot(MODEL_ID)
+    assert snapshot["inputPricePerMtok"] == 2.5
+    assert snapshot["currency"] == "USD"
@@ -0,0 +1,101 @@
+"""Tests for AppRoleAdminService role lookups."""
+
+import pytest
+
+from apis.shared.auth.models import User
+from apis.shared.rbac.admin_service import AppRoleAdminService
+from apis.shared.rbac.cache import AppRoleCache
+from apis.shared.rbac.models import AppRole
+
+
+class _CountingRepository:
+    """In-memory stand-in for AppRoleRepository that counts reads."""
+
+    def __init__(self, roles):
+        self.roles = {r.role_id: r for r in roles}
+        self.reads = 0
+
+    async def get_role(self, role_id):
+        self.reads += 1
+        return self.roles.get(role_id)
+
+
+@pytest.mark.asyncio
+async def test_get_role_is_cached_until_role_changes():
+    repo = _CountingRepository([AppRole(role_id="staff", display_name="Staff", description="")])
+    cache = AppRoleCache()
+    service = AppRoleAdminService(repository=repo, cache=cache)
+
+    assert (await service.get_role("staff")).role_id == "staff"
+    assert (await service.get_role("staff")).role_id == "staff"
+    assert repo.reads == 1
+
+    # Runtime cache entries (minutes-long TTL) are not served to admin reads
+    assert await cache.get_role("staff") is None
+
+    await service._invalidate_caches_for_role(repo.roles["staff"])
+    await service.get_role("staff")
+    assert repo.reads == 2
+
+    stats = service.get_role_cache_stats()
+    assert stats["adminRoleCacheHits"] == 1
+    assert stats["adminRoleCacheMisses"] == 2
+
+
+@pytest.mark.asyncio
+async def test_list_roles_page_walks_sorted_roles_by_cursor():
+    class _ListRepository:
+        async def list_roles(self, enabled_only=False):
+            return [
+                AppRole(role_id=f"r{i}", display_name=f"R{i}", description="", priority=10 - i)
+                for i in range(5)
+            ]
+
+    service = AppRoleAdminService(repository=_ListRepository(), cache=AppRoleCache())
+
+    page, total, cursor = await service.list_roles_page(limit=2)
+    assert [r.role_id for r in page] == ["r0", "r1"] and total == 5 and cursor == "r1"
+
+    page, _, cursor = await service.list_roles_page(limit=2, cursor=cursor)
+    assert [r.role_id for r in page] == ["r2", "r3"] and cursor == "r3"
+
+    page, _, cursor = await service.list_roles_page(limit=2, cursor=cursor)
+    assert [r.role_id for r in page] == ["r4"] and cursor is None
+
+    page, total, cursor = await service.list_roles_page()
+    assert len(page) == total == 5 and cursor is None
+
+
+@pytest.mark.asyncio
+async def test_list_roles_page_rejects_unknown_cursor():
+    class _ListRepository:
+        async def list_roles(self, enabled_only=False):
+            return [AppRole(role_id="staff", display_name="Staff", description="")]
+
+    service = AppRoleAdminService(repository=_ListRepository(), cache=AppRoleCache())
+
+    with pytest.raises(ValueError):
+        await service.list_roles_page(limit=1, cursor="deleted-role")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method, tool_id", [("add_tool_to_role", "new"), ("remove_tool_from_role", "a")])
+async def test_tool_grant_edits_read_role_from_repository(method, tool_id):
+    repo = _CountingRepository([AppRole(role_id="staff", display_name="Staff", description="", granted_tools=["a"])])
+    service = AppRoleAdminService(repository=repo, cache=AppRoleCache())
+    written = []
+
+    async def _update_role(role_id, updates, admin):
+        written.append(updates.granted_tools)
+        return repo.roles[role_id]
+
+    service.update_role = _update_role
+
+    # Prime the admin role cache, then another instance grants "b"
+    await service.get_role("staff")
+    repo.roles["staff"] = AppRole(role_id="staff", display_name="Staff", description="", granted_tools=["a", "b"])
+
+    admin = User(email="admin@example.com", user_id="admin", name="Admin", roles=[])
+    await getattr(service, method)("staff", tool_id, admin)
+
+    assert written and "b" in written[0]
@@ -0,0 +1,46 @@
+"""Tests for AppRole response models."""
+
+from apis.shared.rbac.models import (
+    AppRole,
+    AppRoleListResponse,
+    AppRoleResponse,
+    EffectivePermissions,
+)
+
+
+def _role() -> AppRole:
+    return AppRole(
+        role_id="power_user",
+        display_name="Power User",
+        description="Extra tools",
+        jwt_role_mappings=["PowerUsers"],
+        inherits_from=["default"],
+        granted_tools=["fetch_url_content"],
+        granted_models=["*"],
+        effective_permissions=EffectivePermissions(
+            tools=["fetch_url_content", "ddg_web_search"],
+            models=["*"],
+            quota_tier="premium",
+        ),
+        priority=50,
+        created_at="2025-01-01T00:00:00Z",
+        updated_at="2025-01-02T00:00:00Z",
+        created_by="admin@example.com",
+    )
+
+
+def test_from_app_role_serializes_like_validated_model():
+    role = _role()
+    constructed = AppRoleResponse.from_app_role(role)
+    validated = AppRoleResponse.model_validate(constructed.model_dump())
+
+    assert constructed.model_dump(by_alias=True) == validated.model_dump(by_alias=True)
+    assert constructed.model_dump(by_alias=True)["effectivePermissions"]["quotaTier"] == "premium"
+
+
+def test_list_response_serializes_like_validated_model():
+    items = [AppRoleResponse.from_app_role(_role())]
+    constructed = AppRoleListResponse.model_construct(roles=items, total=len(items))
+    validated = AppRoleListResponse(roles=items, total=1)
+
+    assert constructed.model_dump_json(by_alias=True) == validated.model_dump_json(by_alias=True)
@@ -18,7 +18,7 @@ export interface GatewayStackProps extends cdk.StackProps {
  * This stack creates:
  * - AgentCore Gateway with MCP protocol and AWS_IAM authorization
  * - Lambda function for Google Custom Search (web & image search)
- * - Lambda function for Brave Search (web, local, video, image, news, summarizer)
+ * - Lambda function for Brave Search (web, local, video, image, news, summarizer, multi)
  * - Gateway Targets connecting Lambda to Gateway as MCP tools
  * - IAM roles with appropriate permissions
  *
@@ -170,6 +170,15 @@ export class GatewayStack extends cdk.Stack {
         BRAVE_CREDENTIALS_SECRET_NAME: braveCredentialsSecret.secretName,
         LOG_LEVEL: config.gateway.logLevel || 'INFO',
       },
+      // Parameters and Secrets Lambda Extension - serves the API key from a
+      // localhost cache instead of a signed Secrets Manager call per cold start
+      paramsAndSecrets: lambda.ParamsAndSecretsLayerVersion.fromVersion(
+        lambda.ParamsAndSecretsVersions.V1_0_103,
+        {
+          cacheEnabled: true,
+          logLevel: lambda.ParamsAndSecretsLogLevel.WARN,
+        }
+      ),
     });   
 
     // ============================================================
@@ -620,6 +629,62 @@ export class GatewayStack extends cdk.Stack {
       },
     });
 
+    // Brave Multi Target
+    new agentcore.CfnGatewayTarget(this, 'BraveMultiTarget', {
+      name: 'brave-multi',
+      gatewayIdentifier: gatewayId,
+      description: 'Run several Brave Search tools concurrently in one call',
+
+      credentialProviderConfigurations: [
+        {
+          credentialProviderType: 'GATEWAY_IAM_ROLE',
+        },
+      ],
+
+      targetConfiguration: {
+        mcp: {
+          lambda: {
+            lambdaArn: this.braveSearchFunction.functionArn,
+            toolSchema: {
+              inlinePayload: [
+                {
+                  name: 'brave_multi',
+                  description:
+                    'Runs up to 10 Brave Search tool calls concurrently and returns all results together. Use when several independent searches are needed at once.',
+                  inputSchema: {
+                    type: 'object',
+                    description: 'Batched Brave tool calls',
+                    required: ['calls'],
+                    properties: {
+                      calls: {
+                        type: 'array',
+                        description: 'Tool calls to run concurrently',
+                        items: {
+                          type: 'object',
+                          required: ['tool', 'params'],
+                          properties: {
+                            tool: {
+                              type: 'string',
+                              description:
+                                'Brave tool name: brave_web_search, brave_local_search, brave_video_search, brave_image_search, brave_news_search, or brave_summarizer',
+                            },
+                            params: {
+                              type: 'object',
+                              description: 'Arguments for the tool, as accepted by that tool',
+                            },
+                          },
+                        },
+                      },
+                    },
+                  },
+                },
+              ],
+            },
+          },
+        },
+      },
+    });
+
     // ============================================================
     // SSM Parameters
     // ============================================================
@@ -676,8 +741,8 @@ export class GatewayStack extends cdk.Stack {
     });
 
     new cdk.CfnOutput(this, 'TotalTargets', {
-      value: '8',
-      description: 'Total number of Gateway Targets (2 Google + 6 Brave)',
+      value: '9',
+      description: 'Total number of Gateway Targets (2 Google + 7 Brave)',
     });
 
     new cdk.CfnOutput(this, 'UsageInstructions', {